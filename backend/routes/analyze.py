@@ -6,7 +6,7 @@ green computing pipeline and returns comprehensive results.
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import sys
 import os
@@ -151,3 +151,49 @@ async def analyze_status() -> Dict[str, Any]:
             status_code=500,
             detail=f"Status check failed: {str(e)}"
         )
+
+
+@router.post("/analyze/predict")
+async def predict_carbon(rows: List[Dict[str, float]]):
+    """
+    Predict carbon emissions for a batch of workloads with the trained model.
+    
+    The model is loaded once per process and reloaded only when
+    train_model writes a new version.
+    
+    Args:
+        rows: List of workloads, each with dataset_size, avg_time_sec,
+            avg_cpu_percent and avg_memory_mb
+    
+    Returns:
+        JSON response with one predicted carbon_gco2 per row and the
+        model version (content hash) used
+    """
+    try:
+        cao_dir = os.path.abspath(
+            os.path.join(os.path.dirname(__file__), "..", "..", "carbon_aware_optimizer")
+        )
+        if cao_dir not in sys.path:
+            sys.path.insert(0, cao_dir)
+        from ai_model.predictor import predict_batch, model_version, FEATURES
+        
+        missing = sorted({f for row in rows for f in FEATURES if f not in row})
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Missing features: {', '.join(missing)}")
+        predictions = predict_batch(rows)
+        return {
+            "predictions": [float(p) for p in predictions],
+            "count": len(rows),
+            "model_version": model_version(),
+            "timestamp": datetime.now().isoformat(),
+            "message": "Prediction completed successfully"
+        }
+    except HTTPException:
+        raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Model not trained yet. Run the analysis pipeline first.")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Prediction failed: {str(e)}"
+        )
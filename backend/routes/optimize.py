@@ -6,13 +6,194 @@ based on carbon efficiency and performance metrics.
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
+import math
 import os
+import sys
+from collections import OrderedDict
 
 router = APIRouter()
 
+# backend/routes/optimize.py -> project root -> carbon_aware_optimizer
+CAO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "carbon_aware_optimizer"))
+CLEANED_CSV = os.path.join(CAO_DIR, "data", "experiments", "cleaned_results.csv")
+# Written by ai_model/cost_model.py; predicted fronts are refreshed when it is refitted
+COST_MODEL_JSON = os.path.join(CAO_DIR, "data", "experiments", "cost_model.json")
+
+# Strategy -> objective weights used to scalarize the precomputed Pareto front
+STRATEGY_WEIGHTS = {
+    "carbon_first": {"carbon_gco2": 0.7, "avg_time_sec": 0.1, "p99_time_sec": 0.1, "peak_memory_mb": 0.1},
+    "speed_first": {"carbon_gco2": 0.1, "avg_time_sec": 0.5, "p99_time_sec": 0.3, "peak_memory_mb": 0.1},
+    "balanced": {"carbon_gco2": 0.25, "avg_time_sec": 0.25, "p99_time_sec": 0.25, "peak_memory_mb": 0.25}
+}
+
+# Entries kept per cache; keys start with the CSV mtime, and entries for an
+# older CSV are dropped on the next insert
+CACHE_MAX_ENTRIES = 32
+
+# One front per (CSV mtime, dataset_size, task_type), plus the cost model's
+# mtime for predicted fronts; strategies only re-weight it
+_front_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# One alpha breakpoint table per (CSV mtime, task_type), covering every dataset size
+_winner_table_cache: "OrderedDict[tuple, Dict[int, List[Dict[str, Any]]]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> Any:
+    """Cached value for key (None if absent), marked most recently used."""
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _cache_put(cache: OrderedDict, key: tuple, value: Any) -> Any:
+    """Stores value, evicting stale-CSV and least recently used entries."""
+    for stale in [k for k in cache if k[0] != key[0]]:
+        del cache[stale]
+    cache[key] = value
+    while len(cache) > CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return value
+
+
+def load_pareto_front(dataset_size: Optional[int] = None, task_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Compute (or reuse) the Pareto front of the cleaned experiment results.
+
+    Candidates are the rows at dataset_size (default: the largest size),
+    optionally restricted to one task_type. When nothing was measured at
+    dataset_size, candidates come from the pre-execution cost model
+    (ai_model/cost_model.py) instead and the result is marked "predicted".
+    Returns None without data.
+    """
+    if not os.path.exists(CLEANED_CSV):
+        return None
+    key = (os.path.getmtime(CLEANED_CSV), dataset_size, task_type)
+    model_mtime = os.path.getmtime(COST_MODEL_JSON) if os.path.exists(COST_MODEL_JSON) else None
+    predicted_key = key + (model_mtime,)
+    result = _cache_get(_front_cache, key)
+    if result is None:
+        result = _cache_get(_front_cache, predicted_key)
+    if result is None:
+        if CAO_DIR not in sys.path:
+            sys.path.insert(0, CAO_DIR)
+        import pandas as pd
+        from optimization.quantum_inspired_optimizer import select_pareto
+
+        df = pd.read_csv(CLEANED_CSV)
+        if task_type is not None:
+            df = df[df["task_type"] == task_type]
+        if df.empty:
+            return None
+        size = dataset_size if dataset_size is not None else df["dataset_size"].max()
+        df = df[df["dataset_size"] == size]
+        predicted = df.empty
+        if predicted:
+            from ai_model.cost_model import predict_candidates
+
+            try:
+                df = pd.DataFrame(predict_candidates(int(size), task_type))
+            except FileNotFoundError:
+                return None
+            if df.empty:
+                return None
+        # Label candidates by task type when the same algorithm appears in several
+        labels = df["algorithm"]
+        if labels.duplicated().any():
+            labels = df["task_type"] + ":" + df["algorithm"]
+        # Targets the cost model could not predict are NaN; leave them out so
+        # select_pareto only ranks on objectives every candidate has
+        candidates = [
+            {k: v for k, v in r.items() if not (isinstance(v, float) and math.isnan(v))}
+            for r in df.assign(algorithm=labels).to_dict("records")
+        ]
+        result = select_pareto(candidates)
+        result["dataset_size"] = int(size)
+        result["candidate_count"] = len(candidates)
+        result["predicted"] = bool(predicted)
+        _cache_put(_front_cache, predicted_key if predicted else key, result)
+    return result
+
+
+def recommend_from_front(front_result: Dict[str, Any], strategy: str) -> Dict[str, Any]:
+    """Scalarize a precomputed front for a strategy, in the recommendation format."""
+    from optimization.quantum_inspired_optimizer import scalarize_front
+
+    objectives = front_result["objectives"]
+    # Copy members so cached scores are not overwritten between strategies
+    front = [dict(c) for c in front_result["front"]]
+    pick = scalarize_front(front, objectives, STRATEGY_WEIGHTS[strategy])
+    ranked = sorted(front, key=lambda c: c["score"])
+    return {
+        "best_algorithm": pick["best"],
+        "optimization_score": round(1.0 - pick["score"], 4),
+        "explanation": pick["explanation"],
+        "alternatives": [
+            {
+                "algorithm": c["algorithm"],
+                "score": round(1.0 - c["score"], 4),
+                "explanation": "Pareto-optimal: " + ", ".join(f"{o}={c[o]:.4g}" for o in objectives)
+            }
+            for c in ranked[1:]
+        ],
+        "carbon_saved_annually": None,
+        "performance_metrics": {
+            c["algorithm"]: {
+                "time_seconds": c.get("avg_time_sec"),
+                "carbon_gco2": c.get("carbon_gco2"),
+                "efficiency_score": round(1.0 - c["score"], 4)
+            }
+            for c in ranked
+        },
+        "pareto_front": [
+            {"algorithm": c["algorithm"], **{o: c[o] for o in objectives}}
+            for c in front_result["front"]
+        ],
+        "objectives": objectives,
+        "dataset_size": front_result["dataset_size"],
+        "candidate_count": front_result["candidate_count"],
+        "predicted": front_result["predicted"],
+        # 95% prediction intervals when the front was predicted rather than measured
+        "prediction_intervals": {
+            c["algorithm"]: {o: c[f"{o}_interval"] for o in objectives}
+            for c in front_result["front"]
+        } if front_result["predicted"] else None
+    }
+
+
+def load_winner_table(task_type: Optional[str] = None) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+    """
+    Compute (or reuse) the alpha breakpoint table of the cleaned results.
+
+    Maps each dataset size to the segments of alpha (carbon weight,
+    beta = 1 - alpha) on which one algorithm wins. Returns None without data.
+    """
+    if not os.path.exists(CLEANED_CSV):
+        return None
+    key = (os.path.getmtime(CLEANED_CSV), task_type)
+    table = _cache_get(_winner_table_cache, key)
+    if table is None:
+        if CAO_DIR not in sys.path:
+            sys.path.insert(0, CAO_DIR)
+        import pandas as pd
+        from optimization.weight_sweep import winner_breakpoints
+
+        df = pd.read_csv(CLEANED_CSV)
+        if task_type is not None:
+            df = df[df["task_type"] == task_type]
+        if df.empty:
+            return None
+        labels = df["algorithm"]
+        if df.duplicated(["dataset_size", "algorithm"]).any():
+            labels = df["task_type"] + ":" + df["algorithm"]
+        records = df.assign(algorithm=labels)[["algorithm", "carbon_gco2", "avg_time_sec", "dataset_size"]].to_dict("records")
+        table = {int(size): segments for size, segments in winner_breakpoints(records).items()}
+        _cache_put(_winner_table_cache, key, table)
+    return table
+
 
 def get_optimization_recommendations() -> Dict[str, Any]:
     """
@@ -123,7 +304,8 @@ async def get_optimize_status():
 @router.post("/optimize", response_model=Dict[str, Any])
 async def get_optimization(
     strategy: str = "balanced",
-    dataset_size: int = None
+    dataset_size: int = None,
+    task_type: str = None
 ):
     """
     Get algorithm optimization recommendations.
@@ -139,7 +321,13 @@ async def get_optimization(
             - "speed_first": Maximize performance
             - "balanced": Balance speed and carbon efficiency
         dataset_size: Optional dataset size for context
+        task_type: Optional task type (e.g. "sorting") to restrict candidates
         
+    When experiment results exist, every strategy is answered by weighting
+    the same precomputed Pareto front (carbon, mean/p99 time, peak memory).
+    A dataset_size that was never measured is answered from predicted costs
+    ("predicted": true, with 95% "prediction_intervals") instead.
+    
     Returns:
         JSON response with:
         - Best algorithm recommendation
@@ -175,7 +363,18 @@ async def get_optimization(
                 detail=f"strategy must be one of: {', '.join(valid_strategies)}"
             )
         
-        # Load recommendations
+        front_result = load_pareto_front(dataset_size, task_type)
+        if front_result is not None:
+            recommendations = recommend_from_front(front_result, strategy)
+            return {
+                "strategy": strategy,
+                **recommendations,
+                "strategy_applied": f"Pareto front weighted for {strategy}",
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "message": "Optimization completed successfully"
+            }
+        
+        # No experiment data yet: sample recommendations
         recommendations = load_optimization_model()
         
         # Apply strategy-specific logic
@@ -217,6 +416,109 @@ async def get_optimization(
         )
 
 
+@router.get("/optimize/alpha-sweep", response_model=Dict[str, Any])
+async def get_alpha_sweep(
+    alpha: float = None,
+    dataset_size: int = None,
+    task_type: str = None
+):
+    """
+    Get the winning algorithm for every carbon weight from a precomputed table.
+    
+    Args:
+        alpha: Optional carbon weight in [0, 1] (beta = 1 - alpha); when given,
+            the winner at that weight is returned as well
+        dataset_size: Optional dataset size (default: the largest size)
+        task_type: Optional task type (e.g. "sorting") to restrict candidates
+        
+    Returns:
+        JSON response with the breakpoint segments
+        (alpha_from, alpha_to, algorithm) and, if alpha is given, the winner
+    """
+    try:
+        if alpha is not None and not 0.0 <= alpha <= 1.0:
+            raise HTTPException(status_code=400, detail="alpha must be between 0 and 1")
+        
+        table = load_winner_table(task_type)
+        if table is None:
+            raise HTTPException(status_code=404, detail="No experiment results found. Run the pipeline first.")
+        size = dataset_size if dataset_size is not None else max(table)
+        if size not in table:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No results for dataset_size {size}. Available: {sorted(table)}"
+            )
+        
+        from optimization.weight_sweep import lookup_winner
+        segments = [
+            {k: s[k] for k in ("alpha_from", "alpha_to", "algorithm")}
+            for s in table[size]
+        ]
+        response = {
+            "dataset_size": size,
+            "task_type": task_type,
+            "segments": segments,
+            "available_sizes": sorted(table),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "message": "Alpha sweep retrieved successfully"
+        }
+        if alpha is not None:
+            response["alpha"] = alpha
+            response["beta"] = round(1.0 - alpha, 10)
+            response["best_algorithm"] = lookup_winner(table[size], alpha)
+        return response
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Alpha sweep failed: {str(e)}"
+        )
+
+
+@router.get("/optimize/bandit", response_model=Dict[str, Any])
+async def get_bandit_state(name: str = None):
+    """
+    Get the state of the online (bandit) algorithm selectors.
+    
+    Reads the state each selector persists (optimization/bandit.py), so
+    convergence can be watched while production traffic is served.
+    
+    Args:
+        name: Optional selector name (e.g. "sorting"); default: all selectors
+        
+    Returns:
+        JSON response with, per selector and context (size bucket and input
+        distribution): calls, exploration fraction, current best arm and
+        per-arm calls and typical runtime
+    """
+    try:
+        if CAO_DIR not in sys.path:
+            sys.path.insert(0, CAO_DIR)
+        from optimization.bandit import load_states
+        
+        selectors = load_states()
+        if name is not None:
+            if name not in selectors:
+                raise HTTPException(status_code=404, detail=f"No bandit state for '{name}'")
+            selectors = {name: selectors[name]}
+        return {
+            "selectors": selectors,
+            "count": len(selectors),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "message": "Bandit state retrieved successfully"
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to read bandit state: {str(e)}"
+        )
+
+
 @router.post("/optimize/recommend-for-scenario", response_model=Dict[str, Any])
 async def recommend_for_scenario(
     cpu_intensive: bool = False,
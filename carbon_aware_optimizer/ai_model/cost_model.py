@@ -0,0 +1,175 @@
+
+"""
+Pre-execution cost model: predicts runtime, peak memory, energy and carbon
+of an algorithm from what is known before running it (algorithm, task type
+= category plus input distribution/variant, dataset size, host).
+
+Each (task_type, algorithm, host) cell of cleaned results gets a log-log
+least-squares fit, log(metric) = a + b * log(size), i.e. the empirical
+complexity exponent, which also extrapolates to unmeasured sizes. Every
+prediction carries a 95% prediction interval from the fit's residuals. A
+host without its own measurements falls back to the fit pooled over all
+hosts. Fits are saved as JSON, so predicting needs neither sklearn nor the
+benchmark run.
+"""
+import json
+import math
+import os
+import numpy as np
+
+COST_MODEL_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/cost_model.json')
+CSV_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/cleaned_results.csv')
+
+TARGETS = ['avg_time_sec', 'p99_time_sec', 'peak_memory_mb', 'energy_kwh', 'carbon_gco2']
+# Pooled (all-host) fits are stored under this host
+ANY_HOST = '*'
+# Log-space residual std assumed for fits with fewer than 3 sizes
+# (no degrees of freedom left); replaced by the median of the other fits
+DEFAULT_LOG_STD = 0.5
+# Two-sided 95% Student t quantiles by degrees of freedom; 1.96 beyond 30
+T_QUANTILES_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086, 30: 2.042}
+
+def split_task_type(task_type):
+	"""'caching[trace=zipf]' -> ('caching', 'trace=zipf'); plain categories get 'default'."""
+	if task_type.endswith(']') and '[' in task_type:
+		category, distribution = task_type[:-1].split('[', 1)
+		return category, distribution
+	return task_type, 'default'
+
+def _t_quantile(dof):
+	eligible = [d for d in T_QUANTILES_95 if d <= dof]
+	return T_QUANTILES_95[max(eligible)] if eligible and dof <= 30 else 1.96
+
+def _fit(log_sizes, values):
+	"""Log-log OLS of one metric; None when no positive readings remain."""
+	keep = values > 0
+	x, y = log_sizes[keep], np.log(values[keep])
+	if len(x) == 0:
+		return None
+	x_mean = float(x.mean())
+	sxx = float(((x - x_mean) ** 2).sum())
+	slope = float(((x - x_mean) * (y - y.mean())).sum() / sxx) if sxx > 0 else 0.0
+	intercept = float(y.mean() - slope * x_mean)
+	dof = len(x) - 2
+	resid_std = float(math.sqrt(((y - intercept - slope * x) ** 2).sum() / dof)) if dof > 0 else None
+	return {'intercept': intercept, 'slope': slope, 'n': int(len(x)), 'x_mean': x_mean, 'sxx': sxx, 'resid_std': resid_std}
+
+def fit_cost_model(csv_path=CSV_PATH, path=COST_MODEL_PATH):
+	"""Fits every (task_type, algorithm, host) cell and its all-host pool; saves and returns the model."""
+	import pandas as pd
+
+	df = pd.read_csv(csv_path)
+	if 'host' not in df.columns:
+		df['host'] = 'unknown'
+	cells = {}
+	for by in (['task_type', 'algorithm', 'host'], ['task_type', 'algorithm']):
+		for key, group in df.groupby(by):
+			task_type, algorithm = key[0], key[1]
+			host = key[2] if len(key) > 2 else ANY_HOST
+			log_sizes = np.log(group['dataset_size'].to_numpy(dtype=float))
+			fits = {t: _fit(log_sizes, group[t].to_numpy(dtype=float)) for t in TARGETS if t in group}
+			cells[f"{task_type}|{algorithm}|{host}"] = {
+				'task_type': task_type,
+				'algorithm': algorithm,
+				'host': host,
+				'min_size': int(group['dataset_size'].min()),
+				'max_size': int(group['dataset_size'].max()),
+				'fits': {t: f for t, f in fits.items() if f is not None}
+			}
+	stds = {t: [c['fits'][t]['resid_std'] for c in cells.values() if t in c['fits'] and c['fits'][t]['resid_std'] is not None] for t in TARGETS}
+	model = {
+		'targets': TARGETS,
+		'fallback_log_std': {t: float(np.median(v)) if v else DEFAULT_LOG_STD for t, v in stds.items()},
+		'cells': cells
+	}
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path + '.tmp', 'w') as f:
+		json.dump(model, f, indent=2)
+	os.replace(path + '.tmp', path)
+	_models.pop(path, None)
+	return model
+
+# path -> (mtime, model)
+_models = {}
+
+def load_cost_model(path=COST_MODEL_PATH):
+	"""The saved model, re-read only when the file changes; raises FileNotFoundError without one."""
+	mtime = os.path.getmtime(path)
+	cached = _models.get(path)
+	if cached is None or cached[0] != mtime:
+		with open(path, 'r') as f:
+			cached = _models[path] = (mtime, json.load(f))
+	return cached[1]
+
+def _interval(fit, log_size, fallback_std):
+	mean = fit['intercept'] + fit['slope'] * log_size
+	if fit['resid_std'] is None:
+		spread = fallback_std * math.sqrt(1.0 + 1.0 / fit['n'])
+		quantile = 1.96
+	else:
+		leverage = (log_size - fit['x_mean']) ** 2 / fit['sxx'] if fit['sxx'] > 0 else 0.0
+		spread = fit['resid_std'] * math.sqrt(1.0 + 1.0 / fit['n'] + leverage)
+		quantile = _t_quantile(fit['n'] - 2)
+	return {'mean': math.exp(mean), 'low': math.exp(mean - quantile * spread), 'high': math.exp(mean + quantile * spread)}
+
+def predict_cost(task_type, algorithm, dataset_size, host=None, path=COST_MODEL_PATH):
+	"""
+	{'task_type', 'category', 'distribution', 'algorithm', 'dataset_size',
+	'host', 'host_matched',
+	'extrapolated', 'measured_sizes', metric: {'mean', 'low', 'high'} for
+	each of TARGETS}, or None when the algorithm was never measured for
+	task_type. host defaults to this machine's fingerprint.
+	"""
+	if host is None:
+		from profiling.host_profiler import host_fingerprint
+		host = host_fingerprint()
+	model = load_cost_model(path)
+	cell = model['cells'].get(f"{task_type}|{algorithm}|{host}")
+	host_matched = cell is not None
+	if cell is None:
+		cell = model['cells'].get(f"{task_type}|{algorithm}|{ANY_HOST}")
+	if cell is None:
+		return None
+	log_size = math.log(max(dataset_size, 1))
+	category, distribution = split_task_type(task_type)
+	prediction = {
+		'task_type': task_type,
+		'category': category,
+		'distribution': distribution,
+		'algorithm': algorithm,
+		'dataset_size': int(dataset_size),
+		'host': host,
+		'host_matched': host_matched,
+		'extrapolated': not cell['min_size'] <= dataset_size <= cell['max_size'],
+		'measured_sizes': [cell['min_size'], cell['max_size']]
+	}
+	for target, fit in cell['fits'].items():
+		prediction[target] = _interval(fit, log_size, model['fallback_log_std'][target])
+	return prediction
+
+def predict_candidates(dataset_size, task_type=None, algorithms=None, host=None, path=COST_MODEL_PATH):
+	"""
+	Predicted cleaned_results-style records (point estimates, plus
+	'<metric>_interval' pairs) for every modelled algorithm of task_type (all
+	task types when None), restricted to algorithms when given.
+	"""
+	model = load_cost_model(path)
+	pairs = sorted({(c['task_type'], c['algorithm']) for c in model['cells'].values()})
+	records = []
+	for cell_task_type, algorithm in pairs:
+		if task_type is not None and cell_task_type != task_type:
+			continue
+		if algorithms is not None and algorithm not in algorithms:
+			continue
+		prediction = predict_cost(cell_task_type, algorithm, dataset_size, host, path)
+		record = {k: v for k, v in prediction.items() if k not in TARGETS}
+		for target in TARGETS:
+			if target in prediction:
+				record[target] = prediction[target]['mean']
+				record[f"{target}_interval"] = [prediction[target]['low'], prediction[target]['high']]
+		records.append(record)
+	return records
+
+if __name__ == "__main__":
+	model = fit_cost_model()
+	print(f"Cost model: {len(model['cells'])} (task type, algorithm, host) cells saved to {COST_MODEL_PATH}")
@@ -5,14 +5,25 @@ Extracts, normalizes, validates, and saves as CSV.
 """
 import os
 import json
+import numpy as np
 import pandas as pd
 
 SCHEMA = [
 	'algorithm', 'task_type', 'dataset_size',
 	'avg_time_sec', 'avg_cpu_percent', 'avg_memory_mb',
-	'energy_kwh', 'carbon_gco2'
+	'energy_kwh', 'carbon_gco2',
+	'p99_time_sec', 'peak_memory_mb',  # Tail latency / peak memory over runs
+	'host'  # profiling/host_profiler.py fingerprint; 'unknown' for older results
 ]
 
+# Result-file serialization benchmarks are keyed by payload bytes, not dataset
+# size; older raw_results.json files may still contain them
+RESULT_FILE_TASK_PREFIX = 'serialization[payload='
+
+# Long-format per-run samples for variance-aware selection (optimization/robust_selection.py)
+# carbon_measured is False where a run's carbon was scaled from its runtime
+RUN_SAMPLE_SCHEMA = ['algorithm', 'task_type', 'dataset_size', 'run', 'time_sec', 'carbon_gco2', 'carbon_measured']
+
 def load_raw_results(json_path):
 	with open(json_path, 'r') as f:
 		return json.load(f)
@@ -20,6 +31,8 @@ def load_raw_results(json_path):
 def build_clean_dataset(raw_results):
 	rows = []
 	for task_type, algos in raw_results.items():
+		if task_type.startswith(RESULT_FILE_TASK_PREFIX):
+			continue
 		for algo, sizes in algos.items():
 			for size, metrics in sizes.items():
 				try:
@@ -29,6 +42,9 @@ def build_clean_dataset(raw_results):
 					avg_mem = float(metrics.get('avg_mem', 0)) / (1024 * 1024)  # bytes to MB
 					energy = float(metrics.get('energy_kwh', 0))
 					carbon = float(metrics.get('carbon_gco2', 0))
+					runs = metrics.get('runs') or [{'time': avg_time, 'mem': avg_mem * 1024 * 1024}]
+					p99_time = float(np.percentile([float(r['time']) for r in runs], 99))
+					peak_mem = max(float(r['mem']) for r in runs) / (1024 * 1024)
 					# Remove anomalies
 					if energy <= 0 or carbon <= 0:
 						continue
@@ -36,7 +52,9 @@ def build_clean_dataset(raw_results):
 					row = [
 						str(algo), str(task_type), int(size),
 						avg_time, avg_cpu, avg_mem,
-						energy, carbon
+						energy, carbon,
+						p99_time, peak_mem,
+						str(metrics.get('host', 'unknown'))
 					]
 					rows.append(row)
 				except Exception:
@@ -51,6 +69,37 @@ def build_clean_dataset(raw_results):
 		raise ValueError("NaN values found in dataset. Check input data.")
 	return df
 
+def build_run_samples(raw_results):
+	"""
+	One row per profiled run. Runs without their own carbon (energy phase
+	not run) get the entry's carbon scaled by their share of the mean time,
+	marked carbon_measured=False. Entries without positive carbon are left
+	out with a warning.
+	"""
+	rows = []
+	skipped = 0
+	for task_type, algos in raw_results.items():
+		if task_type.startswith(RESULT_FILE_TASK_PREFIX):
+			continue
+		for algo, sizes in algos.items():
+			for size, metrics in sizes.items():
+				carbon = float(metrics.get('carbon_gco2', 0))
+				avg_time = float(metrics.get('avg_time', 0))
+				if carbon <= 0:
+					skipped += 1
+					continue
+				for i, run in enumerate(metrics.get('runs') or []):
+					run_time = float(run['time'])
+					measured = 'carbon_gco2' in run
+					if measured:
+						run_carbon = float(run['carbon_gco2'])
+					else:
+						run_carbon = carbon * run_time / avg_time if avg_time > 0 else carbon
+					rows.append([str(algo), str(task_type), int(size), i, run_time, run_carbon, measured])
+	if skipped:
+		print(f"[Warning] {skipped} result entries without positive carbon left out of the run samples.")
+	return pd.DataFrame(rows, columns=RUN_SAMPLE_SCHEMA)
+
 def save_dataset(df, out_path):
 	df.to_csv(out_path, index=False)
 
@@ -62,6 +111,9 @@ def main():
 	df = build_clean_dataset(raw_results)
 	save_dataset(df, out_path)
 	print(f"Cleaned dataset saved to {out_path}")
+	samples_path = os.path.join(os.path.dirname(__file__), '../data/experiments/run_samples.csv')
+	save_dataset(build_run_samples(raw_results), samples_path)
+	print(f"Per-run samples saved to {samples_path}")
 
 if __name__ == "__main__":
 	main()
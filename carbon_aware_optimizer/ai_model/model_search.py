@@ -0,0 +1,189 @@
+
+"""
+Hyperparameter search for the carbon predictor.
+Every combination of SEARCH_GRID (tree count, depth, leaf size) is
+cross-validated in a process pool. Fold indices are computed once per
+dataset, cached in CV_FOLDS_PATH and shipped to each worker once.
+
+Besides R2 and MAE, each configuration is scored on what it costs to serve:
+it is refitted on all rows and exported with tree_export in its worker, and
+once the pool has finished the size of each .npz plus the CompiledForest
+batch and single-row latency are measured serially in the parent, so the
+timings are not skewed by workers competing for the CPU.
+select_cheapest() picks the fastest (then smallest) configuration that
+meets the accuracy targets; train_model uses it for full retrains.
+"""
+import hashlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add project root to Python path, so this file also runs as a script
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+
+from ai_model.train_model import FEATURES, TARGET, CSV_PATH, MODEL_SEARCH_PATH, row_hashes
+from ai_model.tree_export import CompiledForest, export_forest
+
+CV_FOLDS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/cv_folds.npz')
+
+SEARCH_GRID = {
+	'n_estimators': [25, 50, 100, 200],
+	'max_depth': [None, 8, 16],
+	'min_samples_leaf': [1, 2, 5]
+}
+CV_SPLITS = 5
+DEFAULT_TARGET_R2 = 0.9
+# Rows per batch when timing inference
+LATENCY_BATCH = 1000
+LATENCY_REPEATS = 5
+
+def cv_folds(hashes, n_splits=CV_SPLITS, path=CV_FOLDS_PATH, seed=42):
+	"""
+	[(train_idx, test_idx)] for the rows identified by hashes (row_hashes).
+	Reused from path while the rows, split count and seed are unchanged.
+	"""
+	key = hashlib.sha256(hashes.tobytes() + f"{n_splits}:{seed}".encode()).hexdigest()
+	if os.path.exists(path):
+		with np.load(path) as cached:
+			if str(cached['key']) == key:
+				fold_of = cached['fold_of']
+				return [(np.flatnonzero(fold_of != k), np.flatnonzero(fold_of == k)) for k in range(n_splits)]
+	# Shuffled KFold: fold k holds every n_splits-th row of a permutation
+	fold_of = np.empty(len(hashes), dtype=np.int8)
+	fold_of[np.random.default_rng(seed).permutation(len(hashes))] = np.arange(len(hashes)) % n_splits
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path + '.tmp', 'wb') as f:
+		np.savez(f, key=np.array(key), fold_of=fold_of)
+	os.replace(path + '.tmp', path)
+	return [(np.flatnonzero(fold_of != k), np.flatnonzero(fold_of == k)) for k in range(n_splits)]
+
+# Set once per worker process by _init_worker
+_X = _y = _folds = _export_dir = None
+
+def _init_worker(X, y, folds, export_dir):
+	global _X, _y, _folds, _export_dir
+	_X, _y, _folds, _export_dir = X, y, folds, export_dir
+
+def _export_path(export_dir, params):
+	name = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+	return os.path.join(export_dir, f"{name}.npz")
+
+def _serving_cost(path, X):
+	"""Exported .npz size and CompiledForest latency; run with the pool shut down."""
+	size = os.path.getsize(path)
+	compiled = CompiledForest.load(path)
+	batch = X[:LATENCY_BATCH]
+	batch_times, row_times = [], []
+	for _ in range(LATENCY_REPEATS):
+		start = time.perf_counter()
+		compiled.predict(batch)
+		batch_times.append(time.perf_counter() - start)
+		start = time.perf_counter()
+		compiled.predict(batch[:1])
+		row_times.append(time.perf_counter() - start)
+	return {
+		'size_bytes': size,
+		'batch_latency_ms_per_row': min(batch_times) * 1000.0 / len(batch),
+		'single_latency_ms': min(row_times) * 1000.0
+	}
+
+def _evaluate(params):
+	from sklearn.ensemble import RandomForestRegressor
+	from sklearn.metrics import r2_score, mean_absolute_error
+
+	r2s, maes = [], []
+	start = time.perf_counter()
+	for train_idx, test_idx in _folds:
+		model = RandomForestRegressor(random_state=42, **params)
+		model.fit(_X[train_idx], _y[train_idx])
+		y_pred = model.predict(_X[test_idx])
+		r2s.append(r2_score(_y[test_idx], y_pred))
+		maes.append(mean_absolute_error(_y[test_idx], y_pred))
+	cv_seconds = time.perf_counter() - start
+	model = RandomForestRegressor(random_state=42, **params).fit(_X, _y)
+	export_forest(model, _export_path(_export_dir, params))
+	return {
+		'params': params,
+		'r2': float(np.mean(r2s)),
+		'r2_std': float(np.std(r2s)),
+		'mae': float(np.mean(maes)),
+		'cv_seconds': cv_seconds
+	}
+
+def grid(search_grid=SEARCH_GRID):
+	names = list(search_grid)
+	return [dict(zip(names, values)) for values in itertools.product(*(search_grid[n] for n in names))]
+
+def select_cheapest(results, target_r2=DEFAULT_TARGET_R2, target_mae=None):
+	"""
+	The result with the lowest batch latency (then size) among those with
+	r2 >= target_r2 and mae <= target_mae (either target may be None), or
+	None when no configuration meets them.
+	"""
+	eligible = [
+		r for r in results
+		if (target_r2 is None or r['r2'] >= target_r2) and (target_mae is None or r['mae'] <= target_mae)
+	]
+	if not eligible:
+		return None
+	return min(eligible, key=lambda r: (r['batch_latency_ms_per_row'], r['size_bytes']))
+
+def search(csv_path=CSV_PATH, search_grid=SEARCH_GRID, target_r2=DEFAULT_TARGET_R2, target_mae=None, workers=None, path=MODEL_SEARCH_PATH):
+	"""
+	Evaluates every configuration of search_grid on cleaned results and saves
+	all scores and the selected configuration ('chosen', None if no
+	configuration meets the targets) to path.
+	"""
+	df = pd.read_csv(csv_path)
+	X = df[FEATURES].to_numpy(dtype=float)
+	y = df[TARGET].to_numpy(dtype=float)
+	folds = cv_folds(row_hashes(df))
+	configs = grid(search_grid)
+	print(f"Evaluating {len(configs)} configurations ({len(folds)}-fold CV, {len(df)} rows)...")
+	with tempfile.TemporaryDirectory() as export_dir:
+		with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(X, y, folds, export_dir)) as pool:
+			results = list(pool.map(_evaluate, configs))
+		# Timed one at a time on an otherwise idle process pool
+		for result in results:
+			result.update(_serving_cost(_export_path(export_dir, result['params']), X))
+	chosen = select_cheapest(results, target_r2, target_mae)
+	report = {
+		'rows': len(df),
+		'cv_splits': len(folds),
+		'target_r2': target_r2,
+		'target_mae': target_mae,
+		'chosen': chosen['params'] if chosen else None,
+		'results': results
+	}
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, 'w') as f:
+		json.dump(report, f, indent=2)
+	return report
+
+def print_report(report):
+	print(f"{'n_estimators':>12} {'max_depth':>9} {'leaf':>4} {'R2':>7} {'MAE':>9} {'KB':>8} {'us/row':>8} {'1-row ms':>8}")
+	for r in sorted(report['results'], key=lambda r: r['batch_latency_ms_per_row']):
+		p = r['params']
+		print(
+			f"{p['n_estimators']:>12} {str(p['max_depth']):>9} {p['min_samples_leaf']:>4} {r['r2']:>7.3f} {r['mae']:>9.4f} "
+			f"{r['size_bytes'] / 1024:>8.1f} {r['batch_latency_ms_per_row'] * 1000:>8.2f} {r['single_latency_ms']:>8.3f}"
+		)
+	if report['chosen']:
+		print(f"\nCheapest configuration meeting the targets: {report['chosen']}")
+	else:
+		print("\nNo configuration meets the targets; train_model keeps its defaults.")
+
+if __name__ == "__main__":
+	if not os.path.exists(CSV_PATH):
+		print(f"[Error] Dataset not found at {CSV_PATH}. Run dataset_builder.py first.")
+		sys.exit(1)
+	print_report(search())
@@ -1,26 +1,119 @@
 
 """
 Predicts carbon emissions using the trained regression model.
+The model is held by a process-wide ModelHandle that loads it once and
+reloads it only when the model file changes, so predictions do not
+unpickle the forest on every call. When train_model has exported the
+compiled forest (.npz, see tree_export.py) it is used instead, so serving
+needs neither sklearn nor joblib.
 """
+import hashlib
 import os
-import joblib
+import sys
+import threading
+
+# Add project root to Python path, so this file also runs as a script
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
 import numpy as np
 
+from ai_model.tree_export import CompiledForest, COMPILED_MODEL_PATH
+
 FEATURES = ['dataset_size', 'avg_time_sec', 'avg_cpu_percent', 'avg_memory_mb']
 MODEL_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/carbon_predictor.joblib')
 
+def _load_file(path):
+	if path.endswith('.npz'):
+		return CompiledForest.load(path)
+	import joblib
+	return joblib.load(path)
+
+def _file_hash(path):
+	digest = hashlib.sha256()
+	with open(path, 'rb') as f:
+		for chunk in iter(lambda: f.read(1 << 20), b''):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+class ModelHandle:
+	"""
+	Cached model for one file. get() stats the file on each call; when its
+	mtime or size changed, the content hash decides whether to reload, and
+	the new model replaces the old one in a single assignment so concurrent
+	callers always see a complete model. train_model replaces the file
+	atomically, so a reload never reads a half-written model.
+	"""
+
+	def __init__(self, path=MODEL_PATH):
+		self.path = path
+		self._lock = threading.Lock()
+		# (model, stat signature, content hash) swapped as one tuple
+		self._current = (None, None, None)
+
+	def _signature(self):
+		stat = os.stat(self.path)
+		return (stat.st_mtime_ns, stat.st_size)
+
+	def get(self):
+		"""The current model; raises FileNotFoundError if there is none."""
+		model, signature, _ = self._current
+		if model is not None and self._signature() == signature:
+			return model
+		with self._lock:
+			model, signature, digest = self._current
+			new_signature = self._signature()
+			if model is not None and new_signature == signature:
+				return model
+			new_digest = _file_hash(self.path)
+			if model is None or new_digest != digest:
+				model = _load_file(self.path)
+			self._current = (model, new_signature, new_digest)
+			return model
+
+	@property
+	def version(self):
+		"""Content hash of the loaded model (None before the first load)."""
+		return self._current[2]
+
+	def invalidate(self):
+		with self._lock:
+			self._current = (None, None, None)
+
+_compiled_handle = ModelHandle(COMPILED_MODEL_PATH)
+_sklearn_handle = ModelHandle(MODEL_PATH)
+
+def _active_handle():
+	return _compiled_handle if os.path.exists(COMPILED_MODEL_PATH) else _sklearn_handle
+
 def load_model():
-	return joblib.load(MODEL_PATH)
+	return _active_handle().get()
+
+def model_version():
+	return _active_handle().version
+
+def predict_batch(rows):
+	"""
+	rows: list of dicts with keys matching FEATURES, or a DataFrame with
+	those columns. Returns a NumPy array of predicted carbon (gCO2), from
+	one feature matrix and a single model.predict call.
+	"""
+	model = load_model()
+	if hasattr(rows, 'columns'):
+		X = rows[FEATURES].to_numpy(dtype=float)
+	else:
+		X = np.array([[row[feat] for feat in FEATURES] for row in rows], dtype=float).reshape(-1, len(FEATURES))
+	if len(X) == 0:
+		return np.array([])
+	return model.predict(X)
 
 def predict_carbon_emission(metrics_dict):
 	"""
 	metrics_dict: dict with keys matching FEATURES
 	Returns predicted carbon emissions (gCO2)
 	"""
-	model = load_model()
-	X = np.array([[metrics_dict[feat] for feat in FEATURES]])
-	pred = model.predict(X)
-	return float(pred[0])
+	return float(predict_batch([metrics_dict])[0])
 
 if __name__ == "__main__":
 	# Example usage
@@ -2,55 +2,193 @@
 """
 Trains a Random Forest Regressor to predict carbon emissions from execution metrics.
 Loads cleaned CSV, selects features, splits data, trains, evaluates, and saves model.
+
+Training is incremental by default: rows are identified by a hash of their
+features and target, and only rows the saved model has not seen are used.
+The current model is first scored on them (test-then-train); if its error
+has not drifted, new trees are grown on the new rows plus a replay sample of
+older rows with warm_start. A full retrain happens when there is no model
+yet, the drift check fails, the forest would exceed MAX_TREES, or
+model_search has chosen different hyperparameters. Every run is appended to
+MODEL_VERSIONS_PATH with its mode and metrics.
 """
+import json
 import os
+import sys
+import time
+
+# Add project root to Python path, so this file also runs as a script
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import r2_score, mean_absolute_error
 import joblib
 
+from ai_model.tree_export import export_forest, COMPILED_MODEL_PATH
+
 FEATURES = ['dataset_size', 'avg_time_sec', 'avg_cpu_percent', 'avg_memory_mb']
 TARGET = 'carbon_gco2'
 MODEL_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/carbon_predictor.joblib')
 CSV_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/cleaned_results.csv')
+# Hashes of the rows the saved model was trained on
+TRAINED_ROWS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/carbon_predictor_rows.npy')
+MODEL_VERSIONS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/model_versions.json')
+# Written by model_search.py; its 'chosen' configuration replaces DEFAULT_PARAMS
+MODEL_SEARCH_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/model_search.json')
+
+DEFAULT_PARAMS = {'n_estimators': 100, 'max_depth': None, 'min_samples_leaf': 1}
+# Trees added per incremental update scale with the share of new rows, within these bounds
+MIN_NEW_TREES = 5
+MAX_TREES = 300
+# Older rows replayed alongside the new ones, as a multiple of the new row count
+REPLAY_RATIO = 1.0
+# Full retrain when the MAE on new rows exceeds this multiple of the last full retrain's holdout MAE
+DRIFT_TOLERANCE = 2.0
+
+def row_hashes(df):
+	"""Content hash per row of FEATURES and TARGET, stable across CSV rebuilds."""
+	return pd.util.hash_pandas_object(df[FEATURES + [TARGET]], index=False).to_numpy(dtype=np.uint64)
+
+def load_versions(path=MODEL_VERSIONS_PATH):
+	if not os.path.exists(path):
+		return []
+	with open(path, 'r') as f:
+		return json.load(f)
+
+def _atomic_write(path, write):
+	"""write(f) into a temporary file that then replaces path."""
+	tmp_path = path + '.tmp'
+	with open(tmp_path, 'wb') as f:
+		write(f)
+	os.replace(tmp_path, path)
+
+def forest_params():
+	"""Hyperparameters for a full retrain: model_search's choice, else DEFAULT_PARAMS."""
+	if os.path.exists(MODEL_SEARCH_PATH):
+		with open(MODEL_SEARCH_PATH, 'r') as f:
+			chosen = json.load(f).get('chosen')
+		if chosen:
+			return dict(DEFAULT_PARAMS, **chosen)
+	return dict(DEFAULT_PARAMS)
+
+def _full_retrain(df, params):
+	X_train, X_test, y_train, y_test = train_test_split(df[FEATURES], df[TARGET], test_size=0.2, random_state=42)
+	model = RandomForestRegressor(random_state=42, n_jobs=-1, **params)
+	model.fit(X_train, y_train)
+	y_pred = model.predict(X_test)
+	return model, {'r2': r2_score(y_test, y_pred), 'mae': mean_absolute_error(y_test, y_pred), 'eval_rows': len(y_test)}
+
+def _grow(model, df, is_new, base_trees, seed):
+	"""Adds trees fitted on the new rows plus a replay sample of older rows."""
+	new_rows = df[is_new]
+	old_rows = df[~is_new]
+	replay = min(len(old_rows), int(round(len(new_rows) * REPLAY_RATIO)))
+	if replay:
+		new_rows = pd.concat([new_rows, old_rows.sample(n=replay, random_state=seed)])
+	added = int(np.clip(round(base_trees * is_new.sum() / len(df)), MIN_NEW_TREES, MAX_TREES - model.n_estimators))
+	model.set_params(warm_start=True, n_estimators=model.n_estimators + added, n_jobs=-1)
+	model.fit(new_rows[FEATURES], new_rows[TARGET])
+	model.set_params(warm_start=False)
+	return added
 
-def train_and_save_model():
+def train_and_save_model(full=False):
+	"""
+	Updates the saved model with rows of cleaned_results.csv it has not seen
+	(full=True forces a retrain on everything). Returns the recorded version
+	entry, or None when there is no dataset.
+	"""
 	if not os.path.exists(CSV_PATH):
 		print(f"[Error] Dataset not found at {CSV_PATH}. Run dataset_builder.py first.")
-		return
+		return None
 
+	start = time.perf_counter()
 	df = pd.read_csv(CSV_PATH)
-	X = df[FEATURES]
-	y = df[TARGET]
-	
-	# Split data
-	X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-	
-	# Initialize and train Random Forest Regressor
-	# n_estimators=100 is a good starting point for robustness
-	print("Training Random Forest Regressor...")
-	model = RandomForestRegressor(n_estimators=100, random_state=42)
-	model.fit(X_train, y_train)
-	
-	# Evaluate
-	y_pred = model.predict(X_test)
-	r2 = r2_score(y_test, y_pred)
-	mae = mean_absolute_error(y_test, y_pred)
-	
-	print(f"Model Performance:")
-	print(f"  R2 Score: {r2:.3f}")
-	print(f"  MAE: {mae:.2f} gCO2")
-	
+	hashes = row_hashes(df)
+	versions = load_versions()
+	previous = versions[-1] if versions else None
+	params = forest_params()
+	model = None
+	if not full and previous and os.path.exists(MODEL_PATH) and os.path.exists(TRAINED_ROWS_PATH):
+		model = joblib.load(MODEL_PATH)
+		is_new = ~np.isin(hashes, np.load(TRAINED_ROWS_PATH))
+	entry = {
+		'version': previous['version'] + 1 if previous else 1,
+		'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+		'rows_total': len(df)
+	}
+
+	reason = 'requested' if full else 'no previous model'
+	if model is not None and any(model.get_params()[name] != value for name, value in params.items() if name != 'n_estimators'):
+		reason = "hyperparameters changed"
+		model = None
+	if model is not None and not is_new.any():
+		print("No new rows since the last model version; model unchanged.")
+		return previous
+
+	if model is not None:
+		# Test-then-train: score the current model on rows it has not seen
+		new_rows = df[is_new]
+		y_pred = model.predict(new_rows[FEATURES])
+		mae = mean_absolute_error(new_rows[TARGET], y_pred)
+		drift_ratio = mae / max(previous.get('baseline_mae', previous['mae']), 1e-12)
+		entry.update({
+			'rows_new': int(is_new.sum()),
+			'mae': mae,
+			'r2': r2_score(new_rows[TARGET], y_pred) if len(new_rows) > 1 else None,
+			'eval_rows': len(new_rows),
+			'drift_ratio': drift_ratio
+		})
+		if drift_ratio > DRIFT_TOLERANCE:
+			reason = f"drift (MAE on new rows {drift_ratio:.2f}x the baseline MAE)"
+			model = None
+		elif model.n_estimators + MIN_NEW_TREES > MAX_TREES:
+			reason = f"forest reached {MAX_TREES} trees"
+			model = None
+
+	if model is not None:
+		print(f"Growing Random Forest on {entry['rows_new']} new rows...")
+		entry['trees_added'] = _grow(model, df, is_new, params['n_estimators'], seed=entry['version'])
+		entry['mode'] = 'incremental'
+		# The drift baseline stays at the last full retrain's holdout error
+		entry['baseline_mae'] = previous.get('baseline_mae', previous['mae'])
+	else:
+		print(f"Training Random Forest Regressor (full retrain: {reason})...")
+		model, metrics = _full_retrain(df, params)
+		entry.update(metrics)
+		entry.setdefault('rows_new', len(df))
+		entry.update({'mode': 'full', 'reason': reason, 'baseline_mae': metrics['mae']})
+	entry['params'] = {name: model.get_params()[name] for name in DEFAULT_PARAMS}
+	entry['train_seconds'] = time.perf_counter() - start
+
+	print(f"Model Performance ({entry['eval_rows']} evaluation rows):")
+	if entry['r2'] is not None:
+		print(f"  R2 Score: {entry['r2']:.3f}")
+	print(f"  MAE: {entry['mae']:.2f} gCO2")
+
 	# Feature Importance
 	print("\nFeature Importances:")
 	importances = model.feature_importances_
 	for name, importance in zip(FEATURES, importances):
 		print(f"  {name}: {importance:.4f}")
 
-	# Save model
-	joblib.dump(model, MODEL_PATH)
-	print(f"\nTrained model saved to {MODEL_PATH}")
+	# Save model: write then atomically replace, so a running predictor never
+	# loads a half-written file (it reloads when the file changes)
+	_atomic_write(MODEL_PATH, lambda f: joblib.dump(model, f))
+	# Flattened copy for the NumPy-only predictor used when serving
+	export_forest(model, feature_names=FEATURES)
+	_atomic_write(TRAINED_ROWS_PATH, lambda f: np.save(f, np.unique(hashes)))
+	from ai_model.predictor import _file_hash
+	# Same content hash the predictor reports as its model_version
+	entry['model_hash'] = _file_hash(COMPILED_MODEL_PATH)
+	versions.append(entry)
+	_atomic_write(MODEL_VERSIONS_PATH, lambda f: f.write(json.dumps(versions, indent=2).encode()))
+	print(f"\nTrained model version {entry['version']} ({entry['mode']}, {model.n_estimators} trees) saved to {MODEL_PATH}")
+	return entry
 
 if __name__ == "__main__":
-	train_and_save_model()
+	train_and_save_model(full='--full' in sys.argv)
@@ -0,0 +1,90 @@
+
+"""
+Dependency-free inference for the trained Random Forest.
+export_forest() flattens every tree of a fitted RandomForestRegressor into
+contiguous node arrays (feature, threshold, left, right, value) saved as one
+.npz; CompiledForest loads them with NumPy alone and predicts a batch by
+walking all trees one level at a time.
+"""
+import os
+import numpy as np
+
+COMPILED_MODEL_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/carbon_predictor.npz')
+
+def export_forest(model, path=COMPILED_MODEL_PATH, feature_names=None):
+	"""
+	Writes the forest's nodes to path (atomically). Child indices are global
+	across trees, -1 marks a leaf; roots holds each tree's first node.
+	"""
+	features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+	offset, max_depth = 0, 0
+	for estimator in model.estimators_:
+		tree = estimator.tree_
+		is_leaf = tree.children_left == -1
+		roots.append(offset)
+		features.append(np.where(is_leaf, 0, tree.feature))
+		thresholds.append(tree.threshold)
+		lefts.append(np.where(is_leaf, -1, tree.children_left + offset))
+		rights.append(np.where(is_leaf, -1, tree.children_right + offset))
+		values.append(tree.value[:, 0, 0])
+		max_depth = max(max_depth, tree.max_depth)
+		offset += tree.node_count
+	arrays = {
+		'feature': np.concatenate(features).astype(np.int32),
+		'threshold': np.concatenate(thresholds).astype(np.float64),
+		'left': np.concatenate(lefts).astype(np.int32),
+		'right': np.concatenate(rights).astype(np.int32),
+		'value': np.concatenate(values).astype(np.float64),
+		'roots': np.array(roots, dtype=np.int32),
+		'max_depth': np.array(max_depth),
+		'n_features': np.array(model.n_features_in_)
+	}
+	if feature_names is not None:
+		arrays['feature_names'] = np.array(list(feature_names))
+	tmp_path = path + '.tmp.npz'
+	np.savez(tmp_path, **arrays)
+	os.replace(tmp_path, path)
+	return path
+
+class CompiledForest:
+	"""Exported forest; predict() matches RandomForestRegressor.predict."""
+
+	def __init__(self, arrays):
+		self.feature = arrays['feature']
+		self.threshold = arrays['threshold']
+		self.left = arrays['left']
+		self.right = arrays['right']
+		self.value = arrays['value']
+		self.roots = arrays['roots']
+		self.max_depth = int(arrays['max_depth'])
+		self.n_features_in_ = int(arrays['n_features'])
+		self.feature_names = [str(f) for f in arrays['feature_names']] if 'feature_names' in arrays else None
+
+	@classmethod
+	def load(cls, path=COMPILED_MODEL_PATH):
+		with np.load(path) as data:
+			return cls({name: data[name] for name in data.files})
+
+	def predict(self, X):
+		X = np.asarray(X, dtype=np.float64)
+		if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+			raise ValueError(f"X must have shape (n_samples, {self.n_features_in_})")
+		# sklearn compares float32 inputs against the split thresholds
+		X = X.astype(np.float32).astype(np.float64)
+		n_trees = len(self.roots)
+		# One (sample, tree) walker per entry; only walkers still at internal nodes advance
+		nodes = np.tile(self.roots, len(X))
+		flat_X = X.ravel()
+		offsets = np.repeat(np.arange(len(X)) * X.shape[1], n_trees)
+		active = np.arange(len(nodes))
+		for _ in range(self.max_depth):
+			current = nodes[active]
+			left = self.left[current]
+			internal = left >= 0
+			if not internal.all():
+				active, current, left = active[internal], current[internal], left[internal]
+			if active.size == 0:
+				break
+			go_left = flat_X[offsets[active] + self.feature[current]] <= self.threshold[current]
+			nodes[active] = np.where(go_left, left, self.right[current])
+		return self.value[nodes].reshape(len(X), n_trees).mean(axis=1)
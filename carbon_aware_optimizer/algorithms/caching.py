@@ -0,0 +1,164 @@
+"""
+Caching strategy benchmarks.
+Each policy replays an access trace of keys; a miss runs miss_kernel(key, work)
+to simulate the cost of recomputing or fetching the value.
+Every function returns {'requests', 'hits'}.
+"""
+import functools
+from collections import OrderedDict, defaultdict
+
+
+def miss_kernel(key, work):
+    """Deterministic CPU-bound stand-in for the cost of a cache miss (`work` loop iterations)."""
+    acc = key
+    for i in range(work):
+        acc = (acc * 1103515245 + i) & 0xFFFFFFFF
+    return acc
+
+
+def no_cache(trace, work, capacity=None):
+    """Recomputes every request."""
+    for key in trace:
+        miss_kernel(key, work)
+    return {'requests': len(trace), 'hits': 0}
+
+
+def dict_cache(trace, work, capacity=None):
+    """Unbounded dict memoization: every key is computed once, memory grows with the key space."""
+    cache = {}
+    hits = 0
+    for key in trace:
+        if key in cache:
+            hits += 1
+        else:
+            cache[key] = miss_kernel(key, work)
+    return {'requests': len(trace), 'hits': hits}
+
+
+def lru_cache(trace, work, capacity):
+    """functools.lru_cache with maxsize=capacity (C implementation)."""
+    cached = functools.lru_cache(maxsize=capacity)(lambda key: miss_kernel(key, work))
+    for key in trace:
+        cached(key)
+    return {'requests': len(trace), 'hits': cached.cache_info().hits}
+
+
+class LFUCache:
+    """O(1) least-frequently-used cache; ties are broken by least recent use."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = {}
+        self.freq = {}
+        self.buckets = defaultdict(OrderedDict)
+        self.min_freq = 0
+
+    def _touch(self, key):
+        f = self.freq[key]
+        bucket = self.buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = f + 1
+        self.freq[key] = f + 1
+        self.buckets[f + 1][key] = None
+
+    def get(self, key, compute):
+        """Returns (value, hit)."""
+        if key in self.values:
+            self._touch(key)
+            return self.values[key], True
+        value = compute(key)
+        if len(self.values) >= self.capacity:
+            bucket = self.buckets[self.min_freq]
+            old, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self.buckets[self.min_freq]
+            del self.values[old]
+            del self.freq[old]
+        self.values[key] = value
+        self.freq[key] = 1
+        self.buckets[1][key] = None
+        self.min_freq = 1
+        return value, False
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha). T1/T2 hold recent/frequent
+    entries, B1/B2 remember their evicted keys, and the target size p of T1
+    adapts to ghost hits, which keeps scans from flushing the frequent set.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.p = 0
+        self.t1, self.t2 = OrderedDict(), OrderedDict()
+        self.b1, self.b2 = OrderedDict(), OrderedDict()
+
+    def _replace(self, key):
+        if self.t1 and (len(self.t1) > self.p or (key in self.b2 and len(self.t1) == self.p)):
+            old, _ = self.t1.popitem(last=False)
+            self.b1[old] = None
+        elif self.t2:
+            old, _ = self.t2.popitem(last=False)
+            self.b2[old] = None
+        elif self.t1:
+            old, _ = self.t1.popitem(last=False)
+            self.b1[old] = None
+
+    def get(self, key, compute):
+        """Returns (value, hit)."""
+        if key in self.t1:
+            value = self.t1.pop(key)
+            self.t2[key] = value
+            return value, True
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            return self.t2[key], True
+        value = compute(key)
+        if key in self.b1:
+            self.p = min(self.capacity, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(key)
+            del self.b1[key]
+            self.t2[key] = value
+        elif key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(key)
+            del self.b2[key]
+            self.t2[key] = value
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            if l1 == self.capacity:
+                if len(self.t1) < self.capacity:
+                    self.b1.popitem(last=False)
+                    self._replace(key)
+                else:
+                    self.t1.popitem(last=False)
+            elif l1 < self.capacity:
+                total = l1 + len(self.t2) + len(self.b2)
+                if total >= self.capacity:
+                    if total == 2 * self.capacity:
+                        self.b2.popitem(last=False)
+                    self._replace(key)
+            self.t1[key] = value
+        return value, False
+
+
+def _replay(cache, trace, work):
+    compute = functools.partial(miss_kernel, work=work)
+    hits = 0
+    for key in trace:
+        hits += cache.get(key, compute)[1]
+    return {'requests': len(trace), 'hits': hits}
+
+
+def lfu_cache(trace, work, capacity):
+    """Hand-rolled LFU with `capacity` entries."""
+    return _replay(LFUCache(capacity), trace, work)
+
+
+def arc_cache(trace, work, capacity):
+    """Hand-rolled ARC with `capacity` entries."""
+    return _replay(ARCCache(capacity), trace, work)
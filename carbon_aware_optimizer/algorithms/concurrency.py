@@ -0,0 +1,179 @@
+"""
+Concurrency model benchmarks for I/O-bound fan-out.
+Each model issues n_requests HTTP GETs against a local StandInServer and
+returns {'requests', 'wall_sec', 'cpu_sec'}. CPU time includes reaped child
+processes (ProcessPoolExecutor workers) and the in-process server threads.
+"""
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_REQUEST = b"GET / HTTP/1.0\r\nHost: localhost\r\n\r\n"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Sleeps for the server's latency, then returns the server's JSON body."""
+
+    def do_GET(self):
+        with self.server.count_lock:
+            self.server.requests_served += 1
+        time.sleep(self.server.latency_sec)
+        stand_in = self.server.stand_in
+        body = json.dumps(stand_in.body_factory()).encode('utf-8')
+        self.send_response(stand_in.status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+
+class _KeepAliveStandInHandler(_StandInHandler):
+    # HTTP/1.1 keeps connections open unless the client asks to close
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; avoid delayed-ACK stalls on reused connections
+    disable_nagle_algorithm = True
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    # listen() backlog must cover the highest benchmarked concurrency level
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StandInServer:
+    """
+    Local HTTP server standing in for a remote service with configurable latency.
+    Usable as a context manager; `address` is (host, port) once started.
+    body_factory returns the JSON-serializable response body for each request;
+    body_factory and status_code may be changed while running.
+    keep_alive serves HTTP/1.1 persistent connections.
+    """
+
+    def __init__(self, latency_ms=0.0, body_factory=None, status_code=200, keep_alive=False):
+        self.latency_ms = latency_ms
+        self.body_factory = body_factory or (lambda: {'status': 'ok'})
+        self.status_code = status_code
+        self.keep_alive = keep_alive
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def requests_served(self):
+        return self._httpd.requests_served
+
+    @property
+    def address(self):
+        return self._httpd.server_address[:2]
+
+    @property
+    def url(self):
+        host, port = self.address
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        handler = _KeepAliveStandInHandler if self.keep_alive else _StandInHandler
+        self._httpd = _StandInHTTPServer(('127.0.0.1', 0), handler)
+        self._httpd.latency_sec = self.latency_ms / 1000.0
+        self._httpd.stand_in = self
+        self._httpd.requests_served = 0
+        self._httpd.count_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def _cpu_seconds():
+    """User + system CPU time of this process and its reaped children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def fetch(address):
+    """One blocking request; returns the number of response bytes."""
+    with socket.create_connection(address) as sock:
+        sock.sendall(_REQUEST)
+        received = 0
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return received
+            received += len(chunk)
+
+
+async def _fetch_async(address, semaphore):
+    async with semaphore:
+        reader, writer = await asyncio.open_connection(*address)
+        writer.write(_REQUEST)
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return len(data)
+
+
+def _measure(run, n_requests):
+    wall_start, cpu_start = time.perf_counter(), _cpu_seconds()
+    run()
+    return {
+        'requests': n_requests,
+        'wall_sec': time.perf_counter() - wall_start,
+        'cpu_sec': _cpu_seconds() - cpu_start
+    }
+
+
+def sequential_requests(address, n_requests, concurrency):
+    """One request at a time (concurrency is ignored)."""
+    def run():
+        for _ in range(n_requests):
+            fetch(address)
+    return _measure(run, n_requests)
+
+
+def thread_pool_requests(address, n_requests, concurrency):
+    """ThreadPoolExecutor with `concurrency` worker threads."""
+    def run():
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(fetch, [address] * n_requests))
+    return _measure(run, n_requests)
+
+
+def process_pool_requests(address, n_requests, concurrency):
+    """ProcessPoolExecutor with `concurrency` workers (start-up cost included)."""
+    def run():
+        with ProcessPoolExecutor(max_workers=concurrency) as pool:
+            chunksize = max(1, n_requests // (concurrency * 4))
+            list(pool.map(fetch, [address] * n_requests, chunksize=chunksize))
+    return _measure(run, n_requests)
+
+
+def asyncio_requests(address, n_requests, concurrency):
+    """Single-threaded asyncio event loop with at most `concurrency` requests in flight."""
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(_fetch_async(address, semaphore) for _ in range(n_requests)))
+
+    def run():
+        asyncio.run(main())
+    return _measure(run, n_requests)
@@ -0,0 +1,174 @@
+"""
+Container operation benchmarks.
+Each function builds its container from `initial` (unique int keys) and replays
+an operation trace of (op, a, b) tuples:
+- ('insert', x, None): add key x
+- ('contains', x, None): membership test
+- ('pop_oldest', None, None): remove the earliest-inserted key (FIFO)
+- ('pop_min', None, None): remove the smallest key
+- ('range_count', lo, hi): count keys in [lo, hi)
+Returns a checksum of all answers so every container can be validated against the others.
+"""
+import bisect
+import heapq
+from array import array
+from collections import deque
+
+
+def list_ops(initial, ops):
+    """Plain list: append, linear scans, pop(0) for FIFO."""
+    items = list(initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            items.append(a)
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_oldest':
+            if items:
+                checksum += items.pop(0)
+        elif op == 'pop_min':
+            if items:
+                m = min(items)
+                items.remove(m)
+                checksum += m
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+def deque_ops(initial, ops):
+    """collections.deque: O(1) FIFO at both ends, linear scans otherwise."""
+    items = deque(initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            items.append(a)
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_oldest':
+            if items:
+                checksum += items.popleft()
+        elif op == 'pop_min':
+            if items:
+                m = min(items)
+                items.remove(m)
+                checksum += m
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+def set_ops(initial, ops):
+    """Hash set: O(1) membership, no insertion order (no FIFO)."""
+    items = set(initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            items.add(a)
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_min':
+            if items:
+                m = min(items)
+                items.remove(m)
+                checksum += m
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+def dict_ops(initial, ops):
+    """Insertion-ordered dict used as an ordered set: O(1) membership and FIFO via next(iter())."""
+    items = dict.fromkeys(initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            items[a] = None
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_oldest':
+            if items:
+                oldest = next(iter(items))
+                del items[oldest]
+                checksum += oldest
+        elif op == 'pop_min':
+            if items:
+                m = min(items)
+                del items[m]
+                checksum += m
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+def array_ops(initial, ops):
+    """array.array('q'): compact unboxed storage, list-like operations."""
+    items = array('q', initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            items.append(a)
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_oldest':
+            if items:
+                checksum += items.pop(0)
+        elif op == 'pop_min':
+            if items:
+                m = min(items)
+                items.remove(m)
+                checksum += m
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+def bisect_ops(initial, ops):
+    """Sorted list maintained with bisect: O(log n) search and range queries, O(n) insertion."""
+    items = sorted(initial)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            bisect.insort(items, a)
+        elif op == 'contains':
+            i = bisect.bisect_left(items, a)
+            checksum += i < len(items) and items[i] == a
+        elif op == 'pop_min':
+            if items:
+                checksum += items.pop(0)
+        elif op == 'range_count':
+            checksum += bisect.bisect_left(items, b) - bisect.bisect_left(items, a)
+    return checksum
+
+
+def heapq_ops(initial, ops):
+    """Binary heap via heapq: O(log n) insert and pop_min, linear scans otherwise."""
+    items = list(initial)
+    heapq.heapify(items)
+    checksum = 0
+    for op, a, b in ops:
+        if op == 'insert':
+            heapq.heappush(items, a)
+        elif op == 'contains':
+            checksum += a in items
+        elif op == 'pop_min':
+            if items:
+                checksum += heapq.heappop(items)
+        elif op == 'range_count':
+            checksum += sum(1 for v in items if a <= v < b)
+    return checksum
+
+
+_ALL_OPS = {'insert', 'contains', 'pop_oldest', 'pop_min', 'range_count'}
+
+# Operations each container can answer correctly; sorted/hashed/heap containers lose insertion order
+SUPPORTED_OPS = {
+    'list_ops': _ALL_OPS,
+    'deque_ops': _ALL_OPS,
+    'set_ops': _ALL_OPS - {'pop_oldest'},
+    'dict_ops': _ALL_OPS,
+    'array_ops': _ALL_OPS,
+    'bisect_ops': _ALL_OPS - {'pop_oldest'},
+    'heapq_ops': _ALL_OPS - {'pop_oldest'},
+}
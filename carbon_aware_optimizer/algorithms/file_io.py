@@ -0,0 +1,101 @@
+"""
+File I/O strategy benchmarks.
+Read strategies scan a text file and return its newline count; the copy
+strategy returns the number of bytes copied.
+"""
+import mmap
+import os
+import shutil
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def line_iteration(path):
+    """Iterates text lines through the default TextIOWrapper."""
+    count = 0
+    with open(path, 'r', encoding='ascii') as f:
+        for _ in f:
+            count += 1
+    return count
+
+
+def buffered_read(path, chunk_size=CHUNK_SIZE):
+    """Large binary reads; each call allocates a new bytes object."""
+    count = 0
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return count
+            count += chunk.count(b'\n')
+
+
+def readinto_read(path, chunk_size=CHUNK_SIZE):
+    """Unbuffered readinto a single preallocated bytearray (no per-chunk allocation)."""
+    count = 0
+    buf = bytearray(chunk_size)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return count
+            count += buf.count(b'\n', 0, n)
+
+
+def mmap_scan(path):
+    """Memory-maps the file and scans it with mmap.find (page faults instead of read calls)."""
+    count = 0
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(b'\n')
+            while pos != -1:
+                count += 1
+                pos = mm.find(b'\n', pos + 1)
+    return count
+
+
+def sendfile_copy(path, dest_path):
+    """Copies path to dest_path in the kernel with os.sendfile; falls back to copyfileobj where unsupported."""
+    with open(path, 'rb') as src, open(dest_path, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        if not hasattr(os, 'sendfile'):
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            return size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # e.g. macOS only supports sendfile to sockets
+            src.seek(offset)
+            dst.seek(offset)
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            offset = size
+        return offset
+
+
+def drop_file_cache(path):
+    """
+    Evicts path's clean pages from the page cache via posix_fadvise(DONTNEED).
+    Returns False where that is not possible (e.g. Windows, macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Dirty pages cannot be evicted, so flush them first
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def cold_cache_supported():
+    """Whether cold-cache runs are possible on this platform."""
+    return hasattr(os, 'posix_fadvise')
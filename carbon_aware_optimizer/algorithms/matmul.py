@@ -0,0 +1,92 @@
+"""
+Dense matrix multiplication kernels for benchmarking.
+All kernels multiply two square n x n matrices; each takes its own input layout.
+"""
+from array import array
+
+import numpy as np
+
+
+def matmul_naive(a, b):
+    """Textbook i-j-k triple loop over nested lists. O(n^3), strided column access to b."""
+    n = len(a)
+    c = [[0] * n for _ in range(n)]
+    for i in range(n):
+        ai = a[i]
+        ci = c[i]
+        for j in range(n):
+            s = 0
+            for k in range(n):
+                s += ai[k] * b[k][j]
+            ci[j] = s
+    return c
+
+
+def matmul_blocked(a, b, tile_size=16):
+    """Cache-blocked i-k-j loop over nested lists; each tile of b is reused while hot."""
+    n = len(a)
+    c = [[0] * n for _ in range(n)]
+    for ii in range(0, n, tile_size):
+        i_end = min(ii + tile_size, n)
+        for kk in range(0, n, tile_size):
+            k_end = min(kk + tile_size, n)
+            for jj in range(0, n, tile_size):
+                j_end = min(jj + tile_size, n)
+                for i in range(ii, i_end):
+                    ai = a[i]
+                    ci = c[i]
+                    for k in range(kk, k_end):
+                        aik = ai[k]
+                        bk = b[k]
+                        for j in range(jj, j_end):
+                            ci[j] += aik * bk[j]
+    return c
+
+
+def matmul_flat_array(a, b, n):
+    """i-k-j loop over row-major array.array buffers (contiguous, unboxed storage)."""
+    c = array(a.typecode, [0]) * (n * n)
+    for i in range(n):
+        row = i * n
+        for k in range(n):
+            aik = a[row + k]
+            col = k * n
+            for j in range(n):
+                c[row + j] += aik * b[col + j]
+    return c
+
+
+def matmul_numpy(a, b):
+    """numpy.dot on ndarrays; dispatches to BLAS for float dtypes."""
+    return np.dot(a, b)
+
+
+# Input layout expected by each kernel
+ALGORITHM_LAYOUTS = {
+    'matmul_naive': 'nested',
+    'matmul_blocked': 'nested',
+    'matmul_flat_array': 'flat',
+    'matmul_numpy': 'numpy',
+}
+
+
+def matmul_flops(n):
+    """Floating point (or integer) operations for an n x n product: one multiply and one add per term."""
+    return 2 * n ** 3
+
+
+def memory_traffic_bytes(algo_name, n, element_bytes, tile_size=16):
+    """
+    Modelled bytes moved between cache and memory for one product.
+    - naive / flat: every inner-loop term streams one element of a and b
+    - blocked: operands are re-read once per tile pass (2n^3 / tile_size)
+    - numpy: BLAS keeps operands cache-resident, so only compulsory traffic
+    All variants also write the n^2 result.
+    """
+    if algo_name == 'matmul_blocked':
+        elements = 2 * n ** 3 / tile_size + n ** 2
+    elif algo_name == 'matmul_numpy':
+        elements = 3 * n ** 2
+    else:
+        elements = 2 * n ** 3 + n ** 2
+    return elements * element_bytes
@@ -0,0 +1,235 @@
+"""
+Serialization format benchmarks for benchmark result payloads.
+Payloads follow the raw_results.json shape: {task: {algorithm: {size: leaf}}},
+where each leaf holds METRIC_FIELDS and a 'runs' list of RUN_FIELDS dicts.
+Each *_roundtrip function encodes and decodes a payload and returns
+{'bytes', 'encode_sec', 'decode_sec'}.
+Columnar formats (struct, npy, savez) store the numeric schema below as
+columns and every other field (strings, None, nested metrics) in one JSON
+side block, so all codecs round-trip the same payload (integer schema
+values come back as equal floats).
+"""
+import io
+import json
+import marshal
+import pickle
+import struct
+import time
+
+import numpy as np
+
+METRIC_FIELDS = ('avg_time', 'avg_cpu', 'avg_mem', 'energy_kwh', 'carbon_gco2')
+RUN_FIELDS = ('time', 'cpu', 'mem')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+
+def _split_fields(record, fields):
+    """Numeric values of fields (NaN where absent or not a number) and the remaining fields."""
+    values = [float(record[f]) if _is_number(record.get(f)) else float('nan') for f in fields]
+    rest = {k: v for k, v in record.items() if not (k in fields and _is_number(v))}
+    return values, rest
+
+
+def _merge_fields(fields, values, rest):
+    record = {f: v for f, v in zip(fields, values) if v == v}  # NaN marks an absent field
+    record.update(rest)
+    return record
+
+
+def to_columns(payload):
+    """
+    Flattens a results payload into per-leaf and per-run columns. 'extras'
+    is a JSON document of every field that is not a numeric schema column.
+    """
+    tasks, algos, sizes, metrics, run_counts, runs, extras = [], [], [], [], [], [], []
+    for task, algo_map in payload.items():
+        for algo, size_map in algo_map.items():
+            for size, leaf in size_map.items():
+                tasks.append(task)
+                algos.append(algo)
+                sizes.append(int(size))
+                leaf_metrics, leaf_rest = _split_fields({k: v for k, v in leaf.items() if k != 'runs'}, METRIC_FIELDS)
+                metrics.append(leaf_metrics)
+                leaf_runs = leaf.get('runs', [])
+                run_counts.append(len(leaf_runs))
+                run_rests = []
+                for r in leaf_runs:
+                    values, rest = _split_fields(r, RUN_FIELDS)
+                    runs.append(values)
+                    run_rests.append(rest)
+                extras.append({'leaf': leaf_rest, 'runs': run_rests, 'has_runs': 'runs' in leaf})
+    return {
+        'task': tasks, 'algorithm': algos, 'size': sizes,
+        'metrics': metrics, 'run_counts': run_counts, 'runs': runs,
+        'extras': json.dumps(extras).encode('utf-8')
+    }
+
+
+def from_columns(cols):
+    """Rebuilds a results payload from to_columns() output."""
+    payload = {}
+    offset = 0
+    extras = json.loads(cols['extras'])
+    for task, algo, size, leaf_metrics, count, extra in zip(
+            cols['task'], cols['algorithm'], cols['size'], cols['metrics'], cols['run_counts'], extras):
+        leaf = _merge_fields(METRIC_FIELDS, leaf_metrics, extra['leaf'])
+        if extra['has_runs']:
+            leaf['runs'] = [
+                _merge_fields(RUN_FIELDS, r, rest)
+                for r, rest in zip(cols['runs'][offset:offset + count], extra['runs'])
+            ]
+        offset += count
+        payload.setdefault(task, {}).setdefault(algo, {})[str(size)] = leaf
+    return payload
+
+
+def _json_encode(payload):
+    return json.dumps(payload).encode('utf-8')
+
+
+def _json_indent_encode(payload):
+    # Matches how the pipeline writes raw_results.json
+    return json.dumps(payload, indent=2).encode('utf-8')
+
+
+def _json_decode(blob):
+    return json.loads(blob)
+
+
+def _struct_encode(payload):
+    cols = to_columns(payload)
+    names = sorted(set(cols['task']) | set(cols['algorithm']))
+    index = {name: i for i, name in enumerate(names)}
+    out = [struct.pack('<III', len(names), len(cols['size']), len(cols['runs']))]
+    for name in names:
+        raw = name.encode('utf-8')
+        out.append(struct.pack('<H', len(raw)) + raw)
+    leaf = struct.Struct('<IIq%ddI' % len(METRIC_FIELDS))
+    for task, algo, size, leaf_metrics, count in zip(
+            cols['task'], cols['algorithm'], cols['size'], cols['metrics'], cols['run_counts']):
+        out.append(leaf.pack(index[task], index[algo], size, *leaf_metrics, count))
+    flat_runs = [v for r in cols['runs'] for v in r]
+    out.append(struct.pack('<%dd' % len(flat_runs), *flat_runs))
+    out.append(cols['extras'])
+    return b''.join(out)
+
+
+def _struct_decode(blob):
+    n_names, n_leaves, n_runs = struct.unpack_from('<III', blob, 0)
+    pos = 12
+    names = []
+    for _ in range(n_names):
+        (length,) = struct.unpack_from('<H', blob, pos)
+        names.append(blob[pos + 2:pos + 2 + length].decode('utf-8'))
+        pos += 2 + length
+    leaf = struct.Struct('<IIq%ddI' % len(METRIC_FIELDS))
+    end = pos + leaf.size * n_leaves
+    cols = {'task': [], 'algorithm': [], 'size': [], 'metrics': [], 'run_counts': []}
+    for rec in leaf.iter_unpack(blob[pos:end]):
+        cols['task'].append(names[rec[0]])
+        cols['algorithm'].append(names[rec[1]])
+        cols['size'].append(rec[2])
+        cols['metrics'].append(list(rec[3:-1]))
+        cols['run_counts'].append(rec[-1])
+    width = len(RUN_FIELDS)
+    flat_runs = struct.unpack_from('<%dd' % (n_runs * width), blob, end)
+    cols['runs'] = [list(flat_runs[i:i + width]) for i in range(0, len(flat_runs), width)]
+    cols['extras'] = blob[end + 8 * len(flat_runs):]
+    return from_columns(cols)
+
+
+def _npy_encode(payload):
+    cols = to_columns(payload)
+    width = max([len(s) for s in cols['task'] + cols['algorithm']] or [1])
+    leaves = np.zeros(len(cols['size']), dtype=[
+        ('task', f'U{width}'), ('algorithm', f'U{width}'), ('size', 'i8'),
+        ('metrics', 'f8', (len(METRIC_FIELDS),)), ('run_count', 'i4')
+    ])
+    leaves['task'] = cols['task']
+    leaves['algorithm'] = cols['algorithm']
+    leaves['size'] = cols['size']
+    leaves['metrics'] = np.array(cols['metrics'], dtype='f8').reshape(-1, len(METRIC_FIELDS))
+    leaves['run_count'] = cols['run_counts']
+    buf = io.BytesIO()
+    # Three consecutive .npy records: the leaf table, the runs matrix and the extras bytes
+    np.save(buf, leaves)
+    np.save(buf, np.array(cols['runs'], dtype='f8').reshape(-1, len(RUN_FIELDS)))
+    np.save(buf, np.frombuffer(cols['extras'], dtype=np.uint8))
+    return buf.getvalue()
+
+
+def _npy_decode(blob):
+    buf = io.BytesIO(blob)
+    leaves = np.load(buf)
+    runs = np.load(buf)
+    extras = np.load(buf)
+    return from_columns({
+        'task': leaves['task'].tolist(), 'algorithm': leaves['algorithm'].tolist(),
+        'size': leaves['size'].tolist(), 'metrics': leaves['metrics'].tolist(),
+        'run_counts': leaves['run_count'].tolist(), 'runs': runs.tolist(),
+        'extras': extras.tobytes()
+    })
+
+
+def _savez_encode(payload):
+    cols = to_columns(payload)
+    buf = io.BytesIO()
+    np.savez(
+        buf,
+        task=np.array(cols['task'], dtype=str),
+        algorithm=np.array(cols['algorithm'], dtype=str),
+        size=np.array(cols['size'], dtype='i8'),
+        metrics=np.array(cols['metrics'], dtype='f8').reshape(-1, len(METRIC_FIELDS)),
+        run_counts=np.array(cols['run_counts'], dtype='i4'),
+        runs=np.array(cols['runs'], dtype='f8').reshape(-1, len(RUN_FIELDS)),
+        extras=np.frombuffer(cols['extras'], dtype=np.uint8)
+    )
+    return buf.getvalue()
+
+
+def _savez_decode(blob):
+    with np.load(io.BytesIO(blob)) as npz:
+        cols = {key: npz[key].tolist() for key in npz.files if key != 'extras'}
+        cols['extras'] = npz['extras'].tobytes()
+        return from_columns(cols)
+
+
+# Codec name -> (encode, decode); pickle has one codec per protocol
+CODECS = {
+    'json': (_json_encode, _json_decode),
+    'json_indent': (_json_indent_encode, _json_decode),
+    'marshal': (marshal.dumps, marshal.loads),
+    'struct': (_struct_encode, _struct_decode),
+    'npy': (_npy_encode, _npy_decode),
+    'savez': (_savez_encode, _savez_decode),
+}
+for _protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+    CODECS[f'pickle_protocol_{_protocol}'] = (
+        lambda payload, p=_protocol: pickle.dumps(payload, protocol=p), pickle.loads)
+
+
+def roundtrip(codec, payload):
+    """Encodes and decodes payload with the named codec, timing each phase."""
+    encode, decode = CODECS[codec]
+    start = time.perf_counter()
+    blob = encode(payload)
+    mid = time.perf_counter()
+    decode(blob)
+    end = time.perf_counter()
+    return {'bytes': len(blob), 'encode_sec': mid - start, 'decode_sec': end - mid}
+
+
+def _make_roundtrip(codec):
+    def run(payload):
+        return roundtrip(codec, payload)
+    run.__name__ = f'{codec}_roundtrip'
+    run.__doc__ = f'Round-trips a payload through {codec}.'
+    return run
+
+
+# Benchmarkable entry points, e.g. json_roundtrip, pickle_protocol_5_roundtrip
+for _codec in CODECS:
+    globals()[f'{_codec}_roundtrip'] = _make_roundtrip(_codec)
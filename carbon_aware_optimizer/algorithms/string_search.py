@@ -0,0 +1,106 @@
+"""
+Substring search implementations for benchmarking.
+All functions return the index of the first occurrence of pattern in text, or -1.
+"""
+import re
+
+
+def naive_string_search(text, pattern):
+    """Checks every alignment of pattern against text. O(n*m) worst case."""
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    for i in range(n - m + 1):
+        j = 0
+        while j < m and text[i + j] == pattern[j]:
+            j += 1
+        if j == m:
+            return i
+    return -1
+
+
+def _kmp_failure(pattern):
+    """Builds the KMP failure table (length of the longest proper border per prefix)."""
+    failure = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k > 0 and pattern[i] != pattern[k]:
+            k = failure[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        failure[i] = k
+    return failure
+
+
+def kmp_search(text, pattern):
+    """Knuth-Morris-Pratt search. O(n + m), never re-reads text characters."""
+    m = len(pattern)
+    if m == 0:
+        return 0
+    failure = _kmp_failure(pattern)
+    k = 0
+    for i, ch in enumerate(text):
+        while k > 0 and ch != pattern[k]:
+            k = failure[k - 1]
+        if ch == pattern[k]:
+            k += 1
+            if k == m:
+                return i - m + 1
+    return -1
+
+
+def horspool_search(text, pattern):
+    """Boyer-Moore-Horspool search. Sublinear on average for large alphabets."""
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    shift = {}
+    for i in range(m - 1):
+        shift[pattern[i]] = m - 1 - i
+    last = pattern[m - 1]
+    i = 0
+    while i <= n - m:
+        ch = text[i + m - 1]
+        if ch == last and text[i:i + m] == pattern:
+            return i
+        i += shift.get(ch, m)
+    return -1
+
+
+def builtin_find(text, pattern):
+    """Delegates to str.find (CPython's C fastsearch)."""
+    return text.find(pattern)
+
+
+def regex_search(text, pattern):
+    """Searches with a compiled regular expression for the escaped literal pattern."""
+    match = re.compile(re.escape(pattern)).search(text)
+    return match.start() if match else -1
+
+
+def bytes_find(text, pattern):
+    """bytes.find over pre-encoded input; avoids the unicode representation entirely."""
+    return text.find(pattern)
+
+
+def memoryview_horspool(text, pattern):
+    """Horspool over a zero-copy memoryview, comparing byte values as ints."""
+    view = memoryview(text)
+    n, m = len(view), len(pattern)
+    if m == 0:
+        return 0
+    shift = [m] * 256
+    for i in range(m - 1):
+        shift[pattern[i]] = m - 1 - i
+    last = pattern[m - 1]
+    i = 0
+    while i <= n - m:
+        b = view[i + m - 1]
+        if b == last and view[i:i + m] == pattern:
+            return i
+        i += shift[b]
+    return -1
+
+
+# Algorithms that expect bytes-like input rather than str
+BYTES_ALGORITHMS = {'bytes_find', 'memoryview_horspool'}
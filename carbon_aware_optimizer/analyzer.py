@@ -58,6 +58,7 @@ def analyze_algorithms() -> Dict[str, Any]:
             "status": "success" if best_algo else "warning",
             "best_algorithm": best_algo
         }
+        results["crossovers"] = _build_crossover_table()
         
         # Phase 6: Gather visualizations metadata
         results["pipeline_phases"]["visualizations"] = _prepare_visualizations()
@@ -87,7 +88,10 @@ def _run_experiments() -> Dict[str, Any]:
 def _compute_energy_carbon() -> Dict[str, Any]:
     """Run phase 2: compute energy and carbon emissions."""
     try:
-        from carbon.carbon_calculator import enrich_with_energy_and_carbon
+        from carbon.carbon_calculator import enrich_records, collect_runs
+        from carbon.intensity_store import configure_calculator
+        from config import experiment_config
+        configure_calculator(experiment_config.CARBON_INTENSITY_REGION)
         
         raw_path = os.path.join(os.path.dirname(__file__), 'data/experiments/raw_results.json')
         if not os.path.exists(raw_path):
@@ -96,15 +100,8 @@ def _compute_energy_carbon() -> Dict[str, Any]:
         with open(raw_path, 'r') as f:
             results = json.load(f)
         
-        def enrich_all(d):
-            if isinstance(d, dict):
-                for k, v in d.items():
-                    if isinstance(v, dict) and 'time' in v and 'mem' in v:
-                        d[k] = enrich_with_energy_and_carbon(v)
-                    else:
-                        enrich_all(v)
-        
-        enrich_all(results)
+        # Collect every run dict, then enrich them in one vectorized pass
+        enrich_records(collect_runs(results))
         
         with open(raw_path, 'w') as f:
             json.dump(results, f, indent=2)
@@ -165,6 +162,20 @@ def _run_optimizer() -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
         return {}, None, f"Optimizer failed: {str(e)[:100]}"
 
 
+def _build_crossover_table() -> Dict[str, Any]:
+    """Compute the size-aware winner table (per task type and weighting) used by green_dispatch."""
+    try:
+        from optimization.crossover import build_crossover_table
+        from experiments.run_experiments import dispatch_registry
+        
+        csv_path = os.path.join(os.path.dirname(__file__), 'data/experiments/cleaned_results.csv')
+        if not os.path.exists(csv_path):
+            return {}
+        return build_crossover_table(csv_path, registry=dispatch_registry())["categories"]
+    except Exception as e:
+        return {"error": f"Crossover table failed: {str(e)[:100]}"}
+
+
 def _prepare_visualizations() -> Dict[str, Any]:
     """Prepare visualization metadata."""
     try:
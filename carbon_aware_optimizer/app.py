@@ -9,8 +9,8 @@ import subprocess
 import sys
 
 # Import project modules
-from ai_model.predictor import predict_carbon_emission, FEATURES
-from optimization.quantum_inspired_optimizer import select_best_algorithm
+from ai_model.predictor import predict_carbon_emission, predict_batch, FEATURES
+from optimization.weight_sweep import winner_breakpoints, lookup_winner
 
 # Set page config
 st.set_page_config(
@@ -29,6 +29,14 @@ RAW_RESULTS = os.path.join(DATA_DIR, 'raw_results.json')
 CLEANED_CSV = os.path.join(DATA_DIR, 'cleaned_results.csv')
 IMG_DIR = DATA_DIR
 
+
+@st.cache_data
+def load_winner_table(csv_path, mtime):
+    """Alpha breakpoints for every dataset size; recomputed only when the CSV changes (mtime)."""
+    df = pd.read_csv(csv_path)
+    records = df[['algorithm', 'carbon_gco2', 'avg_time_sec', 'dataset_size']].to_dict('records')
+    return winner_breakpoints(records)
+
 # Overview Page
 if menu == "Overview":
     st.title("🌱 Carbon-Aware Algorithm Optimization")
@@ -90,17 +98,23 @@ elif menu == "Results & Analytics":
         st.divider()
         st.subheader("Quantum-Inspired Optimizer Selection")
         max_size = df['dataset_size'].max()
-        df_plot = df[df['dataset_size'] == max_size]
-        algos_list = df_plot[['algorithm', 'carbon_gco2', 'avg_time_sec']].to_dict('records')
         
-        if algos_list:
+        if not df.empty:
+            # Winners for every alpha are precomputed; the slider only looks them up
+            segments = load_winner_table(CLEANED_CSV, os.path.getmtime(CLEANED_CSV))[max_size]
             alpha = st.slider("Alpha (Weight for Carbon)", 0.0, 1.0, 0.5)
             beta = 1.0 - alpha
             st.caption(f"Beta (Weight for Runtime) is automatically set to {beta:.1f}")
             
-            best_algo, score, explanation = select_best_algorithm(algos_list, alpha, beta)
+            best_algo = lookup_winner(segments, alpha)
+            explanation = (
+                f"Selected '{best_algo}' as it achieves the lowest combined energy score "
+                f"(alpha={alpha}, beta={beta:.2f}) based on normalized carbon and runtime."
+            )
             st.success(f"**Best Algorithm Selection:** {best_algo}")
             st.info(f"**Explanation:** {explanation}")
+            st.caption("Winner by carbon weight (alpha) at the largest dataset size")
+            st.dataframe(pd.DataFrame(segments)[['alpha_from', 'alpha_to', 'algorithm']])
     else:
         st.warning("No experiment data found. Please run the pipeline first.")
 
@@ -134,6 +148,21 @@ elif menu == "AI Predictor":
             st.error("Model file not found. Please run the pipeline (Run Experiments) to train the model first.")
         except Exception as e:
             st.error(f"Error making prediction: {e}")
+    
+    st.divider()
+    st.subheader("Batch Prediction")
+    uploaded = st.file_uploader(f"CSV with columns: {', '.join(FEATURES)}", type="csv")
+    if uploaded is not None:
+        try:
+            batch = pd.read_csv(uploaded)
+            batch['predicted_carbon_gco2'] = predict_batch(batch)
+            st.dataframe(batch)
+        except FileNotFoundError:
+            st.error("Model file not found. Please run the pipeline (Run Experiments) to train the model first.")
+        except KeyError as e:
+            st.error(f"Missing column in CSV: {e}")
+        except Exception as e:
+            st.error(f"Error making predictions: {e}")
 
 st.sidebar.markdown("---")
 st.sidebar.info("Developed for Green Computing Research.")
@@ -3,21 +3,32 @@
 Carbon emission calculation utilities.
 Assumes energy in kWh and configurable carbon intensity (gCO2/kWh).
 """
+import numpy as np
 
+# Energy estimation lives in energy_model; re-exported for existing callers
+from carbon.energy_model import (
+	DEFAULT_CPU_POWER_W as CPU_POWER_W,
+	DEFAULT_MEM_POWER_W_PER_MB as MEM_POWER_W_PER_MB,
+	FlatPowerModel,
+	estimate_cpu_energy,
+	estimate_memory_energy,
+	get_power_model
+)
 
-# Explicit constants for energy and carbon estimation
-CPU_POWER_W = 50.0  # Watts per core
-MEM_POWER_W_PER_MB = 0.3725  # Watts per MB
+# Explicit constants for carbon estimation
 DEFAULT_CARBON_INTENSITY = 475.0  # gCO2 per kWh
 
 # Global provider for carbon intensity (can be replaced at runtime)
 # Signature: () -> float
 _carbon_intensity_provider = None
+# Whether the provider's last call failed (warn once per failure streak)
+_provider_failing = False
 
 def set_carbon_intensity_provider(provider_func):
 	"""
 	Set a function that returns the current carbon intensity (gCO2/kWh).
-	Useful for connecting to real-time APIs like ElectricityMap or WattTime.
+	Useful for connecting to real-time APIs like ElectricityMap or WattTime;
+	see carbon/intensity_provider.py for a cached, fault-tolerant HTTP provider.
 	"""
 	global _carbon_intensity_provider
 	_carbon_intensity_provider = provider_func
@@ -27,30 +38,47 @@ def get_current_carbon_intensity():
 	Returns current carbon intensity.
 	Uses the registered provider if available, otherwise returns default static value.
 	"""
+	global _provider_failing
 	if _carbon_intensity_provider:
 		try:
-			return float(_carbon_intensity_provider())
+			value = float(_carbon_intensity_provider())
+			_provider_failing = False
+			return value
 		except Exception as e:
-			print(f"[Warning] Carbon provider failed: {e}. Using fallback.")
+			if not _provider_failing:
+				print(f"[Warning] Carbon provider failed: {e}. Using fallback.")
+			_provider_failing = True
 	return DEFAULT_CARBON_INTENSITY
 
-def estimate_cpu_energy(runtime_seconds, cpu_cores=1, cpu_power_w=CPU_POWER_W):
+# Optional time-series intensity source (see carbon/intensity_store.py)
+_intensity_store = None
+_intensity_region = None
+
+def set_carbon_intensity_store(store, region):
 	"""
-	Estimate CPU energy consumption in kWh.
+	Charge timestamped runs from a CarbonIntensityStore series for region.
+	Pass store=None to go back to the current/default intensity.
 	"""
-	hours = runtime_seconds / 3600.0
-	total_power = cpu_power_w * cpu_cores
-	energy_kwh = total_power * hours / 1000.0
-	return energy_kwh
+	global _intensity_store, _intensity_region
+	_intensity_store = store
+	_intensity_region = region
 
-def estimate_memory_energy(mem_mb, runtime_seconds, mem_power_w_per_mb=MEM_POWER_W_PER_MB):
+def get_carbon_intensity_at(timestamp):
 	"""
-	Estimate memory energy consumption in kWh.
+	Carbon intensity at a Unix timestamp from the configured store,
+	falling back to get_current_carbon_intensity().
 	"""
-	hours = runtime_seconds / 3600.0
-	total_power = mem_power_w_per_mb * mem_mb
-	energy_kwh = total_power * hours / 1000.0
-	return energy_kwh
+	if _intensity_store is not None and timestamp is not None:
+		return _intensity_store.intensity(_intensity_region, timestamp)
+	return get_current_carbon_intensity()
+
+def _power_model(cpu_power_w=None, power_model=None):
+	"""Explicit model, else a flat model for an explicit cpu_power_w, else the configured model."""
+	if power_model is not None:
+		return power_model
+	if cpu_power_w is not None:
+		return FlatPowerModel(cpu_power_w)
+	return get_power_model()
 
 def estimate_carbon_emissions(energy_kwh, carbon_intensity=None):
 	"""
@@ -61,17 +89,20 @@ def estimate_carbon_emissions(energy_kwh, carbon_intensity=None):
 		carbon_intensity = get_current_carbon_intensity()
 	return energy_kwh * carbon_intensity
 
-def enrich_with_energy_and_carbon(profile_result, cpu_cores=1, cpu_power_w=CPU_POWER_W, mem_power_w_per_mb=MEM_POWER_W_PER_MB, carbon_intensity=None, real_energy_kwh=None):
+def enrich_with_energy_and_carbon(profile_result, cpu_cores=1, cpu_power_w=None, mem_power_w_per_mb=MEM_POWER_W_PER_MB, carbon_intensity=None, real_energy_kwh=None, power_model=None):
 	"""
 	Given a profiling result dict with keys: 'time' (s), 'mem' (bytes),
 	add 'energy_kwh' and 'carbon_gco2' fields.
 	
 	If real_energy_kwh is provided (from hardware counters), use it.
-	Otherwise, estimate based on time, cpu, and memory.
+	Otherwise, estimate based on time, cpu, and memory: CPU energy comes from
+	the configured power model (see carbon/energy_model.py), fed with the
+	measured 'cpu' (%) and 'cpu_time' (s) where present.
+	An optional 'timestamp' (Unix s) charges the intensity at that time.
 	"""
 	# Determine carbon intensity for this calculation
 	if carbon_intensity is None:
-		carbon_intensity = get_current_carbon_intensity()
+		carbon_intensity = get_carbon_intensity_at(profile_result.get('timestamp'))
 
 	if real_energy_kwh is not None:
 		total_energy = real_energy_kwh
@@ -80,7 +111,8 @@ def enrich_with_energy_and_carbon(profile_result, cpu_cores=1, cpu_power_w=CPU_P
 		runtime = profile_result.get('time', 0)
 		mem_bytes = profile_result.get('mem', 0)
 		mem_mb = mem_bytes / (1024 * 1024)
-		cpu_energy = estimate_cpu_energy(runtime, cpu_cores, cpu_power_w)
+		model = _power_model(cpu_power_w, power_model)
+		cpu_energy = model.cpu_energy(runtime, profile_result.get('cpu'), profile_result.get('cpu_time'), cpu_cores)
 		mem_energy = estimate_memory_energy(mem_mb, runtime, mem_power_w_per_mb)
 		total_energy = cpu_energy + mem_energy
 		source = "estimated"
@@ -92,3 +124,109 @@ def enrich_with_energy_and_carbon(profile_result, cpu_cores=1, cpu_power_w=CPU_P
 	enriched['carbon_intensity_used'] = carbon_intensity
 	enriched['energy_source'] = source
 	return enriched
+
+def enrich_batch(time_s, mem_bytes, cpu_cores=1, real_energy_kwh=None, timestamps=None, cpu_power_w=None, mem_power_w_per_mb=MEM_POWER_W_PER_MB, carbon_intensity=None, intensity_lookup=None, bucket_seconds=3600, cpu_percent=None, cpu_seconds=None, power_model=None):
+	"""
+	Vectorized enrich_with_energy_and_carbon over equal-length arrays.
+	real_energy_kwh, cpu_percent and cpu_seconds may contain NaN/None where
+	not measured.
+	Carbon intensity is resolved once per batch, or, given timestamps (Unix s),
+	per row from the configured intensity store (vectorized) or once per
+	bucket_seconds bucket via intensity_lookup(ts) -> gCO2/kWh.
+	Returns a dict of 'energy_kwh', 'carbon_gco2', 'carbon_intensity_used'
+	and 'energy_source' arrays.
+	"""
+	runtime = np.asarray(time_s, dtype=float)
+	mem_mb = np.asarray(mem_bytes, dtype=float) / (1024 * 1024)
+	hours = runtime / 3600.0
+	cpu_energy = _power_model(cpu_power_w, power_model).cpu_energy(runtime, cpu_percent, cpu_seconds, cpu_cores)
+	estimated = cpu_energy + mem_power_w_per_mb * mem_mb * hours / 1000.0
+
+	if real_energy_kwh is None:
+		has_real = np.zeros(runtime.shape, dtype=bool)
+		total_energy = estimated
+	else:
+		real = np.asarray(real_energy_kwh, dtype=float)  # None -> NaN
+		has_real = ~np.isnan(real)
+		total_energy = np.where(has_real, real, estimated)
+
+	if carbon_intensity is not None:
+		intensity = np.broadcast_to(np.asarray(carbon_intensity, dtype=float), runtime.shape)
+	elif timestamps is not None and intensity_lookup is not None:
+		# One lookup per distinct bucket, scattered back to the rows
+		buckets, inverse = np.unique(np.floor_divide(np.asarray(timestamps, dtype=float), bucket_seconds), return_inverse=True)
+		per_bucket = np.array([float(intensity_lookup(b * bucket_seconds)) for b in buckets])
+		intensity = per_bucket[inverse.reshape(-1)].reshape(runtime.shape)
+	elif timestamps is not None and _intensity_store is not None:
+		intensity = _intensity_store.intensities(_intensity_region, timestamps)
+	else:
+		intensity = np.full(runtime.shape, get_current_carbon_intensity())
+
+	return {
+		'energy_kwh': total_energy,
+		'carbon_gco2': total_energy * intensity,
+		'carbon_intensity_used': intensity,
+		'energy_source': np.where(has_real, "hardware", "estimated")
+	}
+
+def enrich_dataframe(df, **kwargs):
+	"""
+	enrich_batch over a DataFrame with 'time' (s) and 'mem' (bytes) columns and
+	optional 'cpu_cores', 'cpu' (%), 'cpu_time' (s), 'real_energy' (kWh) and
+	'timestamp' (Unix s) columns.
+	Returns a copy with the enrich_batch columns added.
+	"""
+	columns = enrich_batch(
+		df['time'].to_numpy(),
+		df['mem'].to_numpy(),
+		cpu_cores=df['cpu_cores'].to_numpy() if 'cpu_cores' in df else 1,
+		cpu_percent=df['cpu'].to_numpy(dtype=float) if 'cpu' in df else None,
+		cpu_seconds=df['cpu_time'].to_numpy(dtype=float) if 'cpu_time' in df else None,
+		real_energy_kwh=df['real_energy'].to_numpy(dtype=float) if 'real_energy' in df else None,
+		timestamps=df['timestamp'].to_numpy() if 'timestamp' in df else None,
+		**kwargs
+	)
+	enriched = df.copy()
+	for name, values in columns.items():
+		enriched[name] = values
+	return enriched
+
+def collect_runs(results, out=None):
+	"""
+	Every profiling dict (one with 'time' and 'mem') nested anywhere in a
+	raw results payload, in document order, for enrich_records.
+	"""
+	out = [] if out is None else out
+	if isinstance(results, dict):
+		if 'time' in results and 'mem' in results:
+			out.append(results)
+		else:
+			for v in results.values():
+				collect_runs(v, out)
+	elif isinstance(results, list):
+		for v in results:
+			collect_runs(v, out)
+	return out
+
+def enrich_records(records, **kwargs):
+	"""
+	Batch-enriches a list of profiling dicts (keys as in enrich_with_energy_and_carbon,
+	plus optional 'real_energy' and 'timestamp') in place. Returns the list.
+	"""
+	if not records:
+		return records
+	columns = enrich_batch(
+		[r.get('time', 0) for r in records],
+		[r.get('mem', 0) for r in records],
+		real_energy_kwh=[r.get('real_energy') for r in records],
+		cpu_percent=[r.get('cpu') for r in records],
+		cpu_seconds=[r.get('cpu_time') for r in records],
+		timestamps=[r['timestamp'] for r in records] if all('timestamp' in r for r in records) else None,
+		**kwargs
+	)
+	# tolist() converts back to plain Python floats/strs for JSON
+	columns = {name: values.tolist() for name, values in columns.items()}
+	for i, record in enumerate(records):
+		for name, values in columns.items():
+			record[name] = values[i]
+	return records
@@ -5,7 +5,15 @@ All constants are configurable.
 Assumptions:
 - CPU power: default 50W per core (configurable)
 - Memory power: 0.3725W per MB (configurable)
+- CPU power models (PowerModel) turn wall time plus measured utilisation into
+  CPU energy; the active one is selected by experiment_config.POWER_MODEL
 """
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
 
 DEFAULT_CPU_POWER_W = 50.0  # Default CPU power per core in Watts
 DEFAULT_MEM_POWER_W_PER_MB = 0.3725  # Memory power in Watts per MB
@@ -33,3 +41,209 @@ def estimate_memory_energy(mem_usage_mb, runtime_seconds, mem_power_w_per_mb=DEF
 	total_power = mem_power_w_per_mb * mem_usage_mb
 	energy_kwh = total_power * hours / 1000.0
 	return energy_kwh
+
+# Roofline parameters used to separate compute-bound from memory-bound kernels
+DEFAULT_PEAK_GFLOPS = 50.0  # Sustained per-core arithmetic throughput (GFLOP/s)
+DEFAULT_PEAK_BANDWIDTH_GBPS = 20.0  # Sustained DRAM bandwidth (GB/s)
+DEFAULT_DRAM_JOULES_PER_BYTE = 1.6e-10  # ~20 pJ/bit DRAM access energy
+
+def classify_kernel_bound(flops, bytes_moved, peak_gflops=DEFAULT_PEAK_GFLOPS, peak_bandwidth_gbps=DEFAULT_PEAK_BANDWIDTH_GBPS):
+	"""
+	Roofline classification of a kernel.
+	Returns 'memory' if its arithmetic intensity (flops/byte) is below the
+	machine balance (peak_gflops / peak_bandwidth_gbps), else 'compute'.
+	"""
+	if bytes_moved <= 0:
+		return 'compute'
+	machine_balance = peak_gflops / peak_bandwidth_gbps
+	return 'memory' if flops / bytes_moved < machine_balance else 'compute'
+
+def estimate_memory_traffic_energy(bytes_moved, joules_per_byte=DEFAULT_DRAM_JOULES_PER_BYTE):
+	"""
+	Estimate the DRAM energy of moving bytes_moved bytes, in kWh.
+	"""
+	return bytes_moved * joules_per_byte / 3.6e6
+
+# Linear utilisation model defaults: whole-package idle and full-load power
+DEFAULT_IDLE_POWER_W = 10.0
+DEFAULT_TDP_W = 65.0
+
+RAPL_ENERGY_PATH = "/sys/class/powercap/intel-rapl:0/energy_uj"
+RAPL_MAX_ENERGY_PATH = "/sys/class/powercap/intel-rapl:0/max_energy_range_uj"
+
+def _output(value):
+	"""Plain float for scalar inputs, array otherwise."""
+	return float(value) if np.ndim(value) == 0 else value
+
+def busy_cores(runtime_seconds, cpu_percent=None, cpu_seconds=None, default=1.0):
+	"""
+	Average number of busy cores during a run. Prefers measured CPU time
+	(cpu_seconds / runtime), then psutil-style cpu_percent (100 = one core),
+	then default. Accepts scalars or arrays; None/NaN entries fall through.
+	"""
+	runtime = np.asarray(runtime_seconds, dtype=float)
+	busy = np.broadcast_to(np.asarray(default, dtype=float), runtime.shape)
+	if cpu_percent is not None:
+		pct = np.asarray(cpu_percent, dtype=float)
+		busy = np.where(np.isnan(pct), busy, pct / 100.0)
+	if cpu_seconds is not None:
+		cpu = np.asarray(cpu_seconds, dtype=float)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			from_time = np.where(runtime > 0, cpu / runtime, np.nan)
+		busy = np.where(np.isnan(from_time), busy, from_time)
+	return busy
+
+class PowerModel(ABC):
+	"""
+	Interface: CPU energy (kWh) of a run from its wall time and, where
+	measured, its utilisation. Inputs may be scalars or NumPy arrays.
+	Subclasses must implement cpu_power_w.
+	"""
+	name = None
+
+	@abstractmethod
+	def cpu_power_w(self, busy):
+		"""Power draw in Watts with `busy` cores in use."""
+
+	def cpu_energy(self, runtime_seconds, cpu_percent=None, cpu_seconds=None, cpu_cores=1):
+		busy = busy_cores(runtime_seconds, cpu_percent, cpu_seconds, default=cpu_cores)
+		hours = np.asarray(runtime_seconds, dtype=float) / 3600.0
+		return _output(self.cpu_power_w(busy) * hours / 1000.0)
+
+class FlatPowerModel(PowerModel):
+	"""Fixed power per allotted core regardless of utilisation (the original estimate)."""
+	name = "flat"
+
+	def __init__(self, core_power_w=DEFAULT_CPU_POWER_W):
+		self.core_power_w = core_power_w
+
+	def cpu_power_w(self, busy):
+		return self.core_power_w * busy
+
+	def cpu_energy(self, runtime_seconds, cpu_percent=None, cpu_seconds=None, cpu_cores=1):
+		# Charges the allotted cores, ignoring measured utilisation
+		hours = np.asarray(runtime_seconds, dtype=float) / 3600.0
+		return _output(self.cpu_power_w(np.asarray(cpu_cores, dtype=float)) * hours / 1000.0)
+
+class LinearUtilizationModel(PowerModel):
+	"""Package power rises linearly from idle_w to tdp_w with utilisation of cpu_count cores."""
+	name = "linear"
+
+	def __init__(self, idle_w=DEFAULT_IDLE_POWER_W, tdp_w=DEFAULT_TDP_W, cpu_count=None):
+		self.idle_w = idle_w
+		self.tdp_w = tdp_w
+		self.cpu_count = cpu_count or os.cpu_count() or 1
+
+	def cpu_power_w(self, busy):
+		utilisation = np.clip(busy / self.cpu_count, 0.0, 1.0)
+		return self.idle_w + (self.tdp_w - self.idle_w) * utilisation
+
+class CPUTimeModel(PowerModel):
+	"""Charges core_power_w per busy core, i.e. per second of measured process CPU time."""
+	name = "cpu_time"
+
+	def __init__(self, core_power_w=DEFAULT_CPU_POWER_W):
+		self.core_power_w = core_power_w
+
+	def cpu_power_w(self, busy):
+		return self.core_power_w * busy
+
+class RAPLCalibratedModel(PowerModel):
+	"""
+	power = idle_w + watts_per_core * busy, with coefficients fitted by least
+	squares to RAPL package-energy samples (see rapl_sample).
+	"""
+	name = "rapl"
+
+	def __init__(self, idle_w, watts_per_core):
+		self.idle_w = idle_w
+		self.watts_per_core = watts_per_core
+
+	def cpu_power_w(self, busy):
+		return self.idle_w + self.watts_per_core * busy
+
+	@classmethod
+	def fit(cls, samples):
+		"""Fits from dicts with 'runtime_seconds', 'cpu_seconds' and 'energy_joules'."""
+		runtime = np.array([s['runtime_seconds'] for s in samples], dtype=float)
+		busy = np.array([s['cpu_seconds'] for s in samples], dtype=float) / runtime
+		power = np.array([s['energy_joules'] for s in samples], dtype=float) / runtime
+		if len(samples) < 2 or np.ptp(busy) == 0:
+			# Not enough spread in utilisation to separate idle from per-core power
+			return cls(0.0, float(np.mean(power / np.maximum(busy, 1e-9))))
+		(idle_w, watts_per_core), *_ = np.linalg.lstsq(np.column_stack([np.ones_like(busy), busy]), power, rcond=None)
+		return cls(max(float(idle_w), 0.0), float(watts_per_core))
+
+	def save(self, path):
+		with open(path, 'w') as f:
+			json.dump({'idle_w': self.idle_w, 'watts_per_core': self.watts_per_core}, f, indent=2)
+
+	@classmethod
+	def load(cls, path):
+		with open(path, 'r') as f:
+			return cls(**json.load(f))
+
+def read_rapl_energy_uj():
+	"""Cumulative package energy in microjoules, or None without readable RAPL counters."""
+	try:
+		with open(RAPL_ENERGY_PATH, 'r') as f:
+			return int(f.read())
+	except (OSError, ValueError):
+		return None
+
+def rapl_sample(func, *args, **kwargs):
+	"""
+	Runs func and returns a RAPLCalibratedModel.fit sample, or None without RAPL.
+	Energy is package-wide, so calibrate on an otherwise idle machine.
+	"""
+	start_uj = read_rapl_energy_uj()
+	if start_uj is None:
+		return None
+	cpu_start, wall_start = time.process_time(), time.perf_counter()
+	func(*args, **kwargs)
+	runtime = time.perf_counter() - wall_start
+	cpu_seconds = time.process_time() - cpu_start
+	delta_uj = read_rapl_energy_uj() - start_uj
+	if delta_uj < 0:
+		# Counter wrapped around
+		with open(RAPL_MAX_ENERGY_PATH, 'r') as f:
+			delta_uj += int(f.read())
+	return {'runtime_seconds': runtime, 'cpu_seconds': cpu_seconds, 'energy_joules': delta_uj / 1e6}
+
+POWER_MODELS = {
+	FlatPowerModel.name: FlatPowerModel,
+	LinearUtilizationModel.name: LinearUtilizationModel,
+	CPUTimeModel.name: CPUTimeModel,
+	RAPLCalibratedModel.name: RAPLCalibratedModel
+}
+
+def build_power_model(name, params=None):
+	"""
+	Power model by name ('flat', 'linear', 'cpu_time', 'rapl') and constructor
+	params; 'rapl' also accepts {'calibration_path': ...}.
+	"""
+	params = dict(params or {})
+	if name not in POWER_MODELS:
+		raise ValueError(f"Unknown power model: {name}")
+	if name == RAPLCalibratedModel.name and 'calibration_path' in params:
+		return RAPLCalibratedModel.load(params['calibration_path'])
+	return POWER_MODELS[name](**params)
+
+_power_model = None
+
+def set_power_model(model):
+	"""Overrides the configured power model (None re-reads the config)."""
+	global _power_model
+	_power_model = model
+
+def get_power_model():
+	"""The active power model, built from experiment_config.POWER_MODEL on first use."""
+	global _power_model
+	if _power_model is None:
+		try:
+			from config import experiment_config
+			_power_model = build_power_model(experiment_config.POWER_MODEL, experiment_config.POWER_MODEL_PARAMS)
+		except Exception as e:
+			print(f"[Warning] Power model config failed: {e}. Using flat model.")
+			_power_model = FlatPowerModel()
+	return _power_model
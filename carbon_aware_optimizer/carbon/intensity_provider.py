@@ -0,0 +1,204 @@
+"""
+Carbon intensity provider framework for live intensity APIs.
+CachedIntensityProvider wraps any fetch() -> gCO2/kWh callable with:
+- a TTL cache, so enrichment does not make one request per run
+- stale-while-revalidate: a stale value is returned while a background
+  thread refreshes it
+- a circuit breaker that stops calling a failing API and serves the last
+  good value until a retry is allowed
+HTTPIntensityClient is a pooled keep-alive JSON client to use as fetch.
+
+Example:
+	provider = http_intensity_provider("https://api.example.com/intensity?zone=GB", value_path=("carbonIntensity",))
+	set_carbon_intensity_provider(provider)
+"""
+import http.client
+import json
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_STALE_SECONDS = 3600.0
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT_SECONDS = 60.0
+
+class ProviderUnavailable(Exception):
+	"""Raised when no fresh or last good intensity value is available."""
+
+class HTTPIntensityClient:
+	"""
+	Thread-safe HTTP(S) GET client reusing up to pool_size keep-alive connections.
+	fetch() returns the float at value_path in the JSON response body.
+	"""
+
+	def __init__(self, url, value_path=("carbonIntensity",), headers=None, timeout=5.0, pool_size=4):
+		parts = urlsplit(url)
+		self._conn_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+		self._host = parts.hostname
+		self._port = parts.port
+		self._path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+		self.value_path = tuple(value_path)
+		self.headers = {'Accept': 'application/json', **(headers or {})}
+		self.timeout = timeout
+		self._pool = queue.LifoQueue(maxsize=pool_size)
+
+	def _acquire(self):
+		try:
+			return self._pool.get_nowait()
+		except queue.Empty:
+			return self._conn_class(self._host, self._port, timeout=self.timeout)
+
+	def _release(self, conn):
+		try:
+			self._pool.put_nowait(conn)
+		except queue.Full:
+			conn.close()
+
+	def _request(self, conn):
+		conn.request('GET', self._path, headers=self.headers)
+		response = conn.getresponse()
+		body = response.read()
+		if response.status != 200:
+			raise ProviderUnavailable(f"HTTP {response.status} from {self._host}")
+		if response.will_close:
+			conn.close()
+		return json.loads(body)
+
+	def fetch(self):
+		conn = self._acquire()
+		try:
+			try:
+				data = self._request(conn)
+			except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+				# The server dropped an idle keep-alive connection; retry once on a new one
+				conn.close()
+				data = self._request(conn)
+		except Exception:
+			conn.close()
+			raise
+		self._release(conn)
+		for key in self.value_path:
+			data = data[key]
+		return float(data)
+
+	def close(self):
+		while True:
+			try:
+				self._pool.get_nowait().close()
+			except queue.Empty:
+				return
+
+class CircuitBreaker:
+	"""
+	Opens after failure_threshold consecutive failures; after reset_timeout
+	one trial call is allowed (half-open) and its outcome closes or reopens it.
+	"""
+
+	def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT_SECONDS, clock=time.monotonic):
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self.clock = clock
+		self.failures = 0
+		self.opened_at = None
+		self._lock = threading.Lock()
+
+	@property
+	def state(self):
+		if self.opened_at is None:
+			return "closed"
+		if self.clock() - self.opened_at >= self.reset_timeout:
+			return "half_open"
+		return "open"
+
+	def allow(self):
+		"""Whether a call may be attempted now; claims the half-open trial slot."""
+		with self._lock:
+			state = self.state
+			if state == "half_open":
+				# Let one trial through; further calls wait for its outcome
+				self.opened_at = self.clock()
+				return True
+			return state == "closed"
+
+	def record_success(self):
+		with self._lock:
+			self.failures = 0
+			self.opened_at = None
+
+	def record_failure(self):
+		with self._lock:
+			self.failures += 1
+			if self.failures >= self.failure_threshold:
+				self.opened_at = self.clock()
+
+class CachedIntensityProvider:
+	"""
+	Callable provider for set_carbon_intensity_provider.
+	Values younger than ttl are served from cache; values younger than
+	ttl + stale_ttl are served while a background refresh runs; older or
+	missing values are fetched synchronously. If fetching fails or the
+	circuit is open, the last good value is served regardless of age;
+	ProviderUnavailable is raised only if there has never been one.
+	"""
+
+	def __init__(self, fetch, ttl=DEFAULT_TTL_SECONDS, stale_ttl=DEFAULT_STALE_SECONDS, breaker=None, clock=time.monotonic):
+		self.fetch = fetch
+		self.ttl = ttl
+		self.stale_ttl = stale_ttl
+		self.clock = clock
+		self.breaker = breaker or CircuitBreaker(clock=clock)
+		self.value = None
+		self.fetched_at = None
+		self.last_error = None
+		self._refresh_lock = threading.Lock()
+		self._refresh_thread = None
+
+	def _refresh(self):
+		"""Fetches through the breaker; returns True on success."""
+		if not self.breaker.allow():
+			return False
+		try:
+			value = float(self.fetch())
+		except Exception as e:
+			self.last_error = e
+			self.breaker.record_failure()
+			return False
+		self.value, self.fetched_at = value, self.clock()
+		self.breaker.record_success()
+		return True
+
+	def _refresh_in_background(self):
+		with self._refresh_lock:
+			if self._refresh_thread is not None and self._refresh_thread.is_alive():
+				return
+			self._refresh_thread = threading.Thread(target=self._refresh, daemon=True)
+			self._refresh_thread.start()
+
+	def wait_for_refresh(self, timeout=None):
+		"""Blocks until a running background refresh finishes (for tests and shutdown)."""
+		thread = self._refresh_thread
+		if thread is not None:
+			thread.join(timeout)
+
+	def __call__(self):
+		age = None if self.fetched_at is None else self.clock() - self.fetched_at
+		if age is not None and age < self.ttl:
+			return self.value
+		if age is not None and age < self.ttl + self.stale_ttl:
+			self._refresh_in_background()
+			return self.value
+		with self._refresh_lock:
+			self._refresh()
+		if self.value is None:
+			raise ProviderUnavailable(f"No carbon intensity available (circuit {self.breaker.state}): {self.last_error}")
+		return self.value
+
+def http_intensity_provider(url, value_path=("carbonIntensity",), headers=None, ttl=DEFAULT_TTL_SECONDS, stale_ttl=DEFAULT_STALE_SECONDS, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT_SECONDS, timeout=5.0, pool_size=4, clock=time.monotonic):
+	"""CachedIntensityProvider over a pooled HTTPIntensityClient for url."""
+	client = HTTPIntensityClient(url, value_path=value_path, headers=headers, timeout=timeout, pool_size=pool_size)
+	breaker = CircuitBreaker(failure_threshold, reset_timeout, clock=clock)
+	provider = CachedIntensityProvider(client.fetch, ttl=ttl, stale_ttl=stale_ttl, breaker=breaker, clock=clock)
+	provider.client = client
+	return provider
@@ -0,0 +1,129 @@
+"""
+Time-series carbon intensity store.
+Loads per-region hourly (or any resolution) intensity series from local
+JSON/CSV files into sorted NumPy arrays and answers point lookups by binary
+search plus linear interpolation. Timestamps are Unix seconds; lookups outside
+a series are clamped to its first/last value.
+
+JSON layout: {"<region>": [[timestamp, gco2_per_kwh], ...], ...}
+	or {"<region>": {"timestamps": [...], "intensity": [...]}, ...}
+CSV layout: header row with columns region,timestamp,intensity
+Timestamps may be Unix seconds or ISO-8601 strings (naive means UTC).
+"""
+import bisect
+import csv
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+DEFAULT_INTENSITY_PATH = os.path.join(os.path.dirname(__file__), '../config/carbon_intensity.json')
+
+def parse_timestamp(value):
+	"""Unix seconds from a number or an ISO-8601 string."""
+	if isinstance(value, (int, float)):
+		return float(value)
+	try:
+		return float(value)
+	except ValueError:
+		dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+		if dt.tzinfo is None:
+			dt = dt.replace(tzinfo=timezone.utc)
+		return dt.timestamp()
+
+class CarbonIntensityStore:
+	"""Per-region carbon intensity series (gCO2/kWh) with interpolated lookups."""
+
+	def __init__(self):
+		self._series = {}
+
+	def add_series(self, region, timestamps, intensities):
+		"""
+		Adds or replaces a region's series; points need not be sorted.
+		Intensities sharing a timestamp are averaged, so no segment has zero span.
+		"""
+		ts = np.array([parse_timestamp(t) for t in timestamps], dtype=float)
+		values = np.asarray(intensities, dtype=float)
+		if ts.shape != values.shape or ts.size == 0:
+			raise ValueError(f"Series for region '{region}' must be non-empty with one intensity per timestamp")
+		unique_ts, inverse = np.unique(ts, return_inverse=True)
+		values = np.bincount(inverse, weights=values) / np.bincount(inverse)
+		self._series[region] = (unique_ts, values)
+
+	def regions(self):
+		return list(self._series)
+
+	def __contains__(self, region):
+		return region in self._series
+
+	def _get(self, region):
+		if region not in self._series:
+			raise KeyError(f"No carbon intensity series for region '{region}'")
+		return self._series[region]
+
+	def intensity(self, region, timestamp):
+		"""Intensity at one timestamp: binary search, then linear interpolation."""
+		ts, values = self._get(region)
+		t = parse_timestamp(timestamp)
+		i = bisect.bisect_right(ts, t)
+		if i == 0:
+			return float(values[0])
+		if i == len(ts):
+			return float(values[-1])
+		t0, t1 = ts[i - 1], ts[i]
+		v0, v1 = values[i - 1], values[i]
+		return float(v0 + (v1 - v0) * (t - t0) / (t1 - t0))
+
+	def intensities(self, region, timestamps):
+		"""Vectorized intensity() for an array of Unix timestamps (np.searchsorted)."""
+		ts, values = self._get(region)
+		t = np.asarray(timestamps, dtype=float)
+		if len(ts) == 1:
+			return np.full(t.shape, values[0])
+		# Index of the segment [ts[i], ts[i+1]] holding each timestamp, clamped to the ends
+		i = np.clip(np.searchsorted(ts, t, side='right') - 1, 0, len(ts) - 2)
+		t0, t1 = ts[i], ts[i + 1]
+		frac = np.clip((t - t0) / (t1 - t0), 0.0, 1.0)
+		return values[i] + (values[i + 1] - values[i]) * frac
+
+	def load_json(self, path):
+		with open(path, 'r') as f:
+			data = json.load(f)
+		for region, series in data.items():
+			if isinstance(series, dict):
+				self.add_series(region, series['timestamps'], series['intensity'])
+			else:
+				self.add_series(region, [p[0] for p in series], [p[1] for p in series])
+		return self
+
+	def load_csv(self, path):
+		rows = {}
+		with open(path, 'r', newline='') as f:
+			for row in csv.DictReader(f):
+				rows.setdefault(row['region'], []).append((row['timestamp'], float(row['intensity'])))
+		for region, points in rows.items():
+			self.add_series(region, [p[0] for p in points], [p[1] for p in points])
+		return self
+
+	def load(self, path):
+		"""Loads a .json or .csv file; returns self."""
+		if path.lower().endswith('.csv'):
+			return self.load_csv(path)
+		return self.load_json(path)
+
+def configure_calculator(region, path=DEFAULT_INTENSITY_PATH):
+	"""
+	Loads the store from path and, if it has a series for region, makes the
+	carbon calculator charge runs at the intensity of their timestamps.
+	Returns the store, or None when region is unset or unavailable.
+	"""
+	from carbon.carbon_calculator import set_carbon_intensity_store
+	if not region or not os.path.exists(path):
+		return None
+	store = CarbonIntensityStore().load(path)
+	if region not in store:
+		print(f"[Warning] No carbon intensity series for region '{region}' in {path}. Using fallback.")
+		return None
+	set_carbon_intensity_store(store, region)
+	return store
@@ -0,0 +1,174 @@
+"""
+Trace-driven simulator for temporal and spatial carbon-aware load shifting.
+Evaluates scheduling policies over a job trace (arrival, duration, energy,
+deadline, allowed regions) and per-region intensity series, fully vectorized
+with NumPy so millions of jobs simulate in seconds.
+
+Policies:
+- run_now: start at arrival in the job's home region
+- deadline_shift: delay within the home region to the cheapest start that meets the deadline
+- lowest_region: start at arrival in the cheapest allowed region
+- combined: cheapest (start, region) pair over both
+
+A job's energy is spread evenly over its duration and charged at the mean
+intensity of its run window. Times are in seconds (e.g. Unix timestamps).
+"""
+import numpy as np
+
+POLICIES = ["run_now", "deadline_shift", "lowest_region", "combined"]
+
+DEFAULT_MAX_DELAY_SECONDS = 24 * 3600
+DEFAULT_CHUNK_SIZE = 50000
+
+class IntensityGrid:
+	"""
+	Per-region intensity (gCO2/kWh) on a shared regular time grid, treated as
+	constant within each step. Window means use the cumulative integral, so
+	each lookup is O(1); values outside the grid extend the first/last step.
+	"""
+
+	def __init__(self, regions, start, step, values):
+		self.regions = list(regions)
+		self.start = float(start)
+		self.step = float(step)
+		self.values = np.asarray(values, dtype=float).reshape(len(self.regions), -1)
+		# cumulative[r, i]: integral of region r from start to the start of step i
+		self.cumulative = np.concatenate(
+			[np.zeros((len(self.regions), 1)), np.cumsum(self.values, axis=1) * self.step], axis=1
+		)
+
+	@classmethod
+	def from_store(cls, store, regions, start, end, step=3600):
+		"""Samples CarbonIntensityStore series at each step's midpoint."""
+		n_steps = max(1, int(np.ceil((end - start) / step)))
+		mids = start + (np.arange(n_steps) + 0.5) * step
+		return cls(regions, start, step, [store.intensities(region, mids) for region in regions])
+
+	def _integral(self, region, t):
+		n = self.values.shape[1]
+		idx = np.clip(np.floor((t - self.start) / self.step).astype(np.int64), 0, n - 1)
+		return self.cumulative[region, idx] + self.values[region, idx] * (t - (self.start + idx * self.step))
+
+	def mean_intensity(self, region, starts, durations):
+		"""Mean intensity of region (an index) over [starts, starts + durations); arrays broadcast."""
+		starts = np.asarray(starts, dtype=float)
+		durations = np.asarray(durations, dtype=float)
+		# Zero-length jobs are priced over a 1 s window, i.e. their point intensity
+		safe = np.where(durations > 0, durations, 1.0)
+		return (self._integral(region, starts + safe) - self._integral(region, starts)) / safe
+
+def prepare_jobs(trace, regions):
+	"""
+	Converts a trace (DataFrame or dict of columns) to arrays. Columns: arrival,
+	duration, energy_kwh, deadline, and regions ('|'-separated names or lists
+	of allowed regions; first one is home unless a home_region column exists).
+	"""
+	index = {name: i for i, name in enumerate(regions)}
+	# Traces repeat a few region sets, so parse each distinct set once
+	keys = [r if isinstance(r, str) else '|'.join(r) for r in trace['regions']]
+	distinct, inverse = np.unique(np.asarray(keys, dtype=str), return_inverse=True)
+	distinct_allowed = np.zeros((len(distinct), len(regions)), dtype=bool)
+	distinct_home = np.zeros(len(distinct), dtype=np.int64)
+	for j, key in enumerate(distinct):
+		names = key.split('|')
+		distinct_allowed[j, [index[name] for name in names]] = True
+		distinct_home[j] = index[names[0]]
+	inverse = inverse.reshape(-1)
+	allowed = distinct_allowed[inverse]
+	if 'home_region' in trace:
+		home = np.array([index[name] for name in trace['home_region']])
+	else:
+		home = distinct_home[inverse]
+	return {
+		'arrival': np.asarray(trace['arrival'], dtype=float),
+		'duration': np.asarray(trace['duration'], dtype=float),
+		'energy_kwh': np.asarray(trace['energy_kwh'], dtype=float),
+		'deadline': np.asarray(trace['deadline'], dtype=float),
+		'allowed': allowed,
+		'home': home
+	}
+
+def _simulate_chunk(jobs, grid, policy, shift_step, n_offsets):
+	n = len(jobs['arrival'])
+	arrival, duration, deadline = jobs['arrival'], jobs['duration'], jobs['deadline']
+	if policy in ("run_now", "lowest_region"):
+		offsets = np.zeros(1)
+	else:
+		offsets = np.arange(n_offsets) * shift_step
+	if policy in ("run_now", "deadline_shift"):
+		region_mask = np.zeros_like(jobs['allowed'])
+		region_mask[np.arange(n), jobs['home']] = True
+	else:
+		region_mask = jobs['allowed']
+
+	starts = arrival[:, None] + offsets[None, :]  # n x K
+	feasible_time = starts + duration[:, None] <= deadline[:, None]
+	# Always keep "start now" so every job has a candidate; infeasible picks count as misses
+	feasible_time[:, 0] = True
+	cost = np.full((n, len(grid.regions), len(offsets)), np.inf)
+	for r in range(len(grid.regions)):
+		rows = region_mask[:, r]
+		if not rows.any():
+			continue
+		mean = grid.mean_intensity(r, starts[rows], duration[rows, None])
+		cost[rows, r] = np.where(feasible_time[rows], mean, np.inf)
+	flat = cost.reshape(n, -1).argmin(axis=1)
+	region, k = np.divmod(flat, len(offsets))
+	start = starts[np.arange(n), k]
+	intensity = cost[np.arange(n), region, k]
+	return {
+		'start': start,
+		'region': region,
+		'carbon_gco2': jobs['energy_kwh'] * intensity,
+		'delay': start - arrival,
+		'missed': start + duration > deadline
+	}
+
+def simulate(jobs, grid, policy, shift_step=None, max_delay=DEFAULT_MAX_DELAY_SECONDS, chunk_size=DEFAULT_CHUNK_SIZE):
+	"""
+	Applies policy to prepared jobs (see prepare_jobs). Shifted starts are tried
+	every shift_step seconds (default: the grid step) up to max_delay after arrival.
+	Returns per-job arrays: start, region (index), carbon_gco2, delay, missed.
+	"""
+	if policy not in POLICIES:
+		raise ValueError(f"Unknown policy: {policy}")
+	shift_step = shift_step or grid.step
+	n_offsets = int(max_delay // shift_step) + 1
+	n = len(jobs['arrival'])
+	parts = []
+	# Chunks bound the n x regions x offsets cost matrix
+	for lo in range(0, n, chunk_size):
+		chunk = {k: v[lo:lo + chunk_size] for k, v in jobs.items()}
+		parts.append(_simulate_chunk(chunk, grid, policy, shift_step, n_offsets))
+	if not parts:
+		return {k: np.array([]) for k in ('start', 'region', 'carbon_gco2', 'delay', 'missed')}
+	return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+def summarize(outcome):
+	"""Total gCO2, deadline misses and delay distribution of one simulate() result."""
+	delay = outcome['delay']
+	percentiles = np.percentile(delay, [50, 90, 99]) if delay.size else np.zeros(3)
+	return {
+		'total_carbon_gco2': float(outcome['carbon_gco2'].sum()),
+		'deadline_misses': int(outcome['missed'].sum()),
+		'mean_delay_s': float(delay.mean()) if delay.size else 0.0,
+		'p50_delay_s': float(percentiles[0]),
+		'p90_delay_s': float(percentiles[1]),
+		'p99_delay_s': float(percentiles[2]),
+		'max_delay_s': float(delay.max()) if delay.size else 0.0
+	}
+
+def compare_policies(trace, grid, policies=POLICIES, **kwargs):
+	"""
+	Simulates each policy on a trace and returns {policy: summary}, with
+	carbon saved against run_now where run_now is included.
+	"""
+	jobs = prepare_jobs(trace, grid.regions)
+	report = {policy: summarize(simulate(jobs, grid, policy, **kwargs)) for policy in policies}
+	if "run_now" in report:
+		baseline = report["run_now"]['total_carbon_gco2']
+		for summary in report.values():
+			saved = baseline - summary['total_carbon_gco2']
+			summary['carbon_saved_gco2'] = saved
+			summary['carbon_saved_pct'] = 100.0 * saved / baseline if baseline > 0 else 0.0
+	return report
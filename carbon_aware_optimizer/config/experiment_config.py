@@ -3,6 +3,11 @@ Experiment configuration for algorithm benchmarking.
 Defines algorithm categories, dataset sizes, number of runs, and random seed for reproducibility.
 """
 
+# Cache capacities (entries) and bounded policies benchmarked by the "caching"
+# category; each policy/capacity pair is its own algorithm, e.g. "lru_cache_256"
+CACHE_SIZES = [64, 256, 1024]
+CACHE_POLICIES = ["lru", "lfu", "arc"]
+
 # Algorithm categories and their respective algorithms
 ALGORITHM_CATEGORIES = {
     # Sorting algorithms to benchmark
@@ -20,7 +25,69 @@ ALGORITHM_CATEGORIES = {
     "recursion": [
         "fibonacci_recursive",
         "fibonacci_iterative"
-    ]
+    ],
+    # Substring search strategies (text/pattern workloads)
+    "string_search": [
+        "naive_string_search",
+        "kmp_search",
+        "horspool_search",
+        "builtin_find",
+        "regex_search",
+        "bytes_find",
+        "memoryview_horspool"
+    ],
+    # Dense matrix multiplication kernels
+    "matmul": [
+        "matmul_naive",       # Pure-Python triple loop
+        "matmul_blocked",     # Cache-blocked loop (MATMUL_TILE_SIZE)
+        "matmul_flat_array",  # array.array-backed flat row-major layout
+        "matmul_numpy"        # numpy.dot (BLAS)
+    ],
+    # Container choice for membership, FIFO, ordered insertion and range queries
+    "data_structures": [
+        "list_ops",
+        "deque_ops",
+        "set_ops",
+        "dict_ops",
+        "array_ops",
+        "bisect_ops",
+        "heapq_ops"
+    ],
+    # Round-trip (encode + decode) of nested benchmark result payloads
+    "serialization": [
+        "json_roundtrip",
+        "json_indent_roundtrip",  # As raw_results.json is written
+        "pickle_protocol_0_roundtrip",
+        "pickle_protocol_1_roundtrip",
+        "pickle_protocol_2_roundtrip",
+        "pickle_protocol_3_roundtrip",
+        "pickle_protocol_4_roundtrip",
+        "pickle_protocol_5_roundtrip",
+        "marshal_roundtrip",
+        "struct_roundtrip",       # Hand-packed binary columns
+        "npy_roundtrip",          # NumPy structured array .npy
+        "savez_roundtrip"         # NumPy .npz of column arrays
+    ],
+    # I/O-bound fan-out against a local stand-in HTTP server
+    "concurrency": [
+        "sequential_requests",
+        "thread_pool_requests",
+        "process_pool_requests",
+        "asyncio_requests"
+    ],
+    # File I/O strategies on generated text files (category "io")
+    "io": [
+        "line_iteration",
+        "buffered_read",
+        "readinto_read",
+        "mmap_scan",
+        "sendfile_copy"
+    ],
+    # Memoization strategies replaying synthetic key access traces
+    "caching": [
+        "no_cache",
+        "dict_cache"  # Unbounded
+    ] + [f"{policy}_cache_{n}" for policy in CACHE_POLICIES for n in CACHE_SIZES]
 }
 
 # Dataset sizes to use for experiments
@@ -30,6 +97,103 @@ DATASET_SIZES = [
     10000   # Large dataset
 ]
 
+# String search sweep: alphabet sizes (max 62) and pattern lengths
+STRING_SEARCH_ALPHABET_SIZES = [4, 26]
+STRING_SEARCH_PATTERN_LENGTHS = [4, 16, 64]
+
+# Matrix multiplication sweep: element dtypes and the blocked kernel's tile size.
+# Matrix dimension n is derived from the dataset size (n*n ~= size).
+MATMUL_DTYPES = ["float64", "float32", "int64"]
+MATMUL_TILE_SIZE = 16
+
+# Data structure operation mixes (relative weights per operation). The container
+# is pre-filled with `size` keys, then DATA_STRUCTURE_OPS_PER_RUN operations are
+# replayed. Containers that cannot answer an operation in a mix are skipped.
+DATA_STRUCTURE_OPS_PER_RUN = 1000
+DATA_STRUCTURE_OP_MIXES = {
+    "lookup_heavy": {"contains": 0.8, "insert": 0.2},
+    "fifo_queue": {"insert": 0.5, "pop_oldest": 0.5},
+    "ordered": {"insert": 0.4, "range_count": 0.3, "pop_min": 0.3},
+    "mixed": {"insert": 0.3, "contains": 0.3, "pop_oldest": 0.2, "range_count": 0.2}
+}
+
+# Also round-trip this project's own result files (raw_results.json from the
+# previous run, if present) through every serialization format
+SERIALIZATION_BENCHMARK_RESULT_FILES = True
+
+# Concurrency sweep: in-flight request limits and the stand-in server's
+# per-request latency. Each run issues size // CONCURRENCY_SIZE_DIVISOR requests.
+CONCURRENCY_LEVELS = [4, 16, 64]
+CONCURRENCY_LATENCY_MS = [5]
+CONCURRENCY_SIZE_DIVISOR = 50
+
+# File I/O: generated files are size * IO_BYTES_PER_SIZE_UNIT bytes. "cold" runs
+# evict the file from the page cache before each run where the OS allows it.
+IO_BYTES_PER_SIZE_UNIT = 1024
+IO_CACHE_MODES = ["warm", "cold"]
+
+# Caching: each trace has `size` requests over CACHE_KEY_SPACE keys; a miss costs
+# CACHE_MISS_WORK iterations of the miss kernel. "looping" cycles over
+# CACHE_LOOP_LENGTH keys, "scan_heavy" interleaves Zipf bursts with one-off scans.
+CACHE_TRACES = ["uniform", "zipf", "scan_heavy", "looping"]
+CACHE_KEY_SPACE = 4096
+CACHE_ZIPF_EXPONENT = 1.1
+CACHE_LOOP_LENGTH = 512
+CACHE_MISS_WORK = 200
+
+# Workload variants swept within a category. Each variant is stored as its own
+# task type (e.g. "string_search[alphabet_size=4,pattern_length=16]") so the
+# optimizer can recommend a different algorithm per variant.
+CATEGORY_VARIANTS = {
+    "string_search": [
+        {"alphabet_size": a, "pattern_length": m}
+        for a in STRING_SEARCH_ALPHABET_SIZES
+        for m in STRING_SEARCH_PATTERN_LENGTHS
+    ],
+    "matmul": [{"dtype": d} for d in MATMUL_DTYPES],
+    "data_structures": [{"mix": name} for name in DATA_STRUCTURE_OP_MIXES],
+    "concurrency": [
+        {"concurrency": c, "latency_ms": l}
+        for l in CONCURRENCY_LATENCY_MS
+        for c in CONCURRENCY_LEVELS
+    ],
+    "io": [{"cache": mode} for mode in IO_CACHE_MODES],
+    "caching": [{"trace": t} for t in CACHE_TRACES]
+}
+
+# Region whose time-series carbon intensity (config/carbon_intensity.json,
+# see carbon/intensity_store.py) is charged to each run at the time it executed.
+# None uses the calculator's current/default intensity.
+CARBON_INTENSITY_REGION = None
+
+# CPU power model used for estimated energy (carbon/energy_model.py):
+# - "flat": CPU_POWER_W per core regardless of utilisation (original estimate)
+# - "linear": idle-to-TDP package power by measured utilisation,
+#   params {"idle_w", "tdp_w", "cpu_count"}
+# - "cpu_time": power per busy core from measured process CPU time (incl.
+#   child processes), params {"core_power_w"}
+# - "rapl": fitted from RAPL samples, params {"calibration_path"} or
+#   {"idle_w", "watts_per_core"}
+POWER_MODEL = "flat"
+POWER_MODEL_PARAMS = {}
+
+# Carbon-aware scheduler (experiments/carbon_scheduler.py): every cell must finish
+# within SCHEDULER_DEADLINE_HOURS; the forecast for CARBON_INTENSITY_REGION is
+# read from SCHEDULER_FORECAST_PATH (None: config/carbon_intensity.json) and
+# priced per SCHEDULER_SLOT_SECONDS window. Cells without a previous result
+# are assumed to take SCHEDULER_DEFAULT_CELL_SECONDS.
+SCHEDULER_DEADLINE_HOURS = 24
+SCHEDULER_FORECAST_PATH = None
+SCHEDULER_SLOT_SECONDS = 3600
+SCHEDULER_DEFAULT_CELL_SECONDS = 60
+
+# Assignment solver benchmark (experiments/optimizer_benchmark.py): instances with
+# OPTIMIZER_BENCHMARK_OPTIONS options per task at each task count; heuristic and
+# branch-and-bound solvers stop after OPTIMIZER_BENCHMARK_TIME_BUDGET seconds.
+OPTIMIZER_BENCHMARK_TASK_COUNTS = [10, 100, 1000, 5000]
+OPTIMIZER_BENCHMARK_OPTIONS = 8
+OPTIMIZER_BENCHMARK_TIME_BUDGET = 2.0
+
 # Number of times to repeat each experiment for statistical reliability
 NUM_RUNS = 5
 
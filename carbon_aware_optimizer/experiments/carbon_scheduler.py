@@ -0,0 +1,251 @@
+"""
+Carbon-aware deferral scheduler for experiment batches.
+- Takes a queue of experiment cells (category, variant, size) with estimated
+  durations and deadlines
+- Reads a local carbon intensity forecast (carbon/intensity_store.py)
+- Places each cell in the lowest-intensity window that still meets its deadline
+- Checkpoints progress to JSON so a restarted scheduler resumes where it stopped
+- Reports carbon saved against running every cell immediately
+The clock and sleep functions are injectable, so a whole schedule can be
+replayed against a simulated clock.
+"""
+import sys
+import os
+
+# Add project root to Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+import json
+import math
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from config import experiment_config
+from carbon.energy_model import get_power_model
+from carbon.intensity_store import CarbonIntensityStore, DEFAULT_INTENSITY_PATH, configure_calculator
+
+CHECKPOINT_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/scheduler_state.json')
+
+def cell_id(category, variant, size):
+	"""Stable identifier of a cell, e.g. 'matmul[dtype=float32]@5000'."""
+	from experiments.run_experiments import task_type_name
+	return f"{task_type_name(category, variant)}@{size}"
+
+def make_cell(category, variant, size, duration_s, deadline):
+	"""A schedulable cell; duration_s is an estimate and deadline a Unix timestamp."""
+	return {
+		'id': cell_id(category, variant, size),
+		'category': category,
+		'variant': variant,
+		'size': size,
+		'duration_s': float(duration_s),
+		'deadline': float(deadline)
+	}
+
+def plan_schedule(cells, forecast, region, now, slot_seconds=3600):
+	"""
+	Assigns start times to cells. The horizon up to the latest deadline is cut
+	into slots of slot_seconds priced at the forecast intensity of their
+	midpoint. Cells are taken in deadline order and each goes to the cheapest
+	slot with room left that still finishes by its deadline (earliest on ties);
+	a cell that cannot meet its deadline is placed as early as possible.
+	Returns {cell id: planned start}.
+	"""
+	if not cells:
+		return {}
+	horizon = max(max(c['deadline'] for c in cells), now + slot_seconds)
+	n_slots = max(1, math.ceil((horizon - now) / slot_seconds))
+	starts = now + np.arange(n_slots) * slot_seconds
+	intensity = forecast.intensities(region, starts + slot_seconds / 2)
+	used = np.zeros(n_slots)
+	plan = {}
+	for cell in sorted(cells, key=lambda c: c['deadline']):
+		duration = cell['duration_s']
+		# Cells longer than a slot may take an empty one and spill over
+		fits = (used + duration <= slot_seconds) | (used == 0)
+		on_time = starts + used + duration <= cell['deadline']
+		candidates = np.flatnonzero(fits & on_time)
+		if candidates.size:
+			k = candidates[np.argmin(intensity[candidates])]
+		else:
+			open_slots = np.flatnonzero(fits)
+			k = open_slots[0] if open_slots.size else int(np.argmin(used))
+		plan[cell['id']] = float(starts[k] + used[k])
+		used[k] += duration
+	return plan
+
+class CarbonAwareScheduler:
+	"""
+	Runs cells through runner(cell) -> energy_kwh (or None to estimate from
+	run time with the configured power model) at their planned start times,
+	sleeping in between.
+	State is checkpointed to checkpoint_path after every change; a
+	checkpoint whose cells are all done starts the next batch.
+	"""
+
+	def __init__(self, cells, forecast, region, runner, checkpoint_path=CHECKPOINT_PATH, slot_seconds=3600, clock=time.time, sleep=time.sleep):
+		self.forecast = forecast
+		self.region = region
+		self.runner = runner
+		self.checkpoint_path = checkpoint_path
+		self.slot_seconds = slot_seconds
+		self.clock = clock
+		self.sleep = sleep
+		self.state = self._load() or {'batch': 1, 'created_at': clock(), 'cells': {}, 'order': []}
+		for cell in cells:
+			if cell['id'] not in self.state['cells']:
+				self.state['cells'][cell['id']] = dict(cell, status='pending')
+				self.state['order'].append(cell['id'])
+		self._save()
+
+	def _load(self):
+		if not os.path.exists(self.checkpoint_path):
+			return None
+		with open(self.checkpoint_path, 'r') as f:
+			state = json.load(f)
+		if state['cells'] and all(c['status'] == 'done' for c in state['cells'].values()):
+			# The checkpointed batch finished: start a new one, or its done cells would never rerun
+			return {'batch': state.get('batch', 1) + 1, 'created_at': self.clock(), 'cells': {}, 'order': []}
+		for cell in state['cells'].values():
+			if cell['status'] == 'running':
+				# Interrupted mid-run: its results were not saved, so run it again
+				cell['status'] = 'pending'
+		return state
+
+	def _save(self):
+		os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+		tmp_path = self.checkpoint_path + '.tmp'
+		with open(tmp_path, 'w') as f:
+			json.dump(self.state, f, indent=2)
+		# Atomic replace, so a crash never leaves a half-written checkpoint
+		os.replace(tmp_path, self.checkpoint_path)
+
+	def pending(self):
+		return [self.state['cells'][i] for i in self.state['order'] if self.state['cells'][i]['status'] == 'pending']
+
+	def plan(self):
+		"""(Re)plans pending cells from now. The run-immediately baseline is fixed on first plan."""
+		now = self.clock()
+		cells = self.pending()
+		if 'baseline' not in self.state:
+			# Back-to-back in queue order from when the batch was created
+			t, baseline = self.state['created_at'], {}
+			for cell in cells:
+				baseline[cell['id']] = t
+				t += cell['duration_s']
+			self.state['baseline'] = baseline
+		for cell_id_, start in plan_schedule(cells, self.forecast, self.region, now, self.slot_seconds).items():
+			self.state['cells'][cell_id_]['planned_start'] = start
+		self._save()
+		return {c['id']: c['planned_start'] for c in cells}
+
+	def run(self):
+		"""Runs every pending cell at its planned time; returns report()."""
+		self.plan()
+		while True:
+			cells = self.pending()
+			if not cells:
+				break
+			cell = min(cells, key=lambda c: c['planned_start'])
+			wait = cell['planned_start'] - self.clock()
+			if wait > 0:
+				self.sleep(wait)
+			cell['status'] = 'running'
+			cell['started_at'] = self.clock()
+			self._save()
+			energy_kwh = self.runner(cell)
+			cell['finished_at'] = self.clock()
+			if energy_kwh is None:
+				energy_kwh = get_power_model().cpu_energy(cell['finished_at'] - cell['started_at'])
+			cell['energy_kwh'] = energy_kwh
+			cell['status'] = 'done'
+			self._save()
+		return self.report()
+
+	def _carbon_at(self, energy_kwh, start, duration):
+		# Priced at the forecast intensity of the run's midpoint
+		return energy_kwh * self.forecast.intensity(self.region, start + duration / 2)
+
+	def report(self):
+		"""Carbon of completed cells as scheduled vs. run immediately, plus deadline misses."""
+		done = [c for c in self.state['cells'].values() if c['status'] == 'done']
+		scheduled = baseline = 0.0
+		delays, misses = [], 0
+		for cell in done:
+			duration = cell['finished_at'] - cell['started_at']
+			baseline_start = self.state['baseline'].get(cell['id'], cell['started_at'])
+			scheduled += self._carbon_at(cell['energy_kwh'], cell['started_at'], duration)
+			baseline += self._carbon_at(cell['energy_kwh'], baseline_start, duration)
+			delays.append(cell['started_at'] - baseline_start)
+			misses += cell['finished_at'] > cell['deadline']
+		return {
+			'cells_done': len(done),
+			'cells_pending': len(self.pending()),
+			'scheduled_carbon_gco2': scheduled,
+			'run_now_carbon_gco2': baseline,
+			'carbon_saved_gco2': baseline - scheduled,
+			'carbon_saved_pct': 100.0 * (baseline - scheduled) / baseline if baseline > 0 else 0.0,
+			'mean_delay_s': float(np.mean(delays)) if delays else 0.0,
+			'deadline_misses': misses
+		}
+
+def experiment_runner(results_path=None):
+	"""runner(cell) that benchmarks the cell and merges it into the raw results file."""
+	from experiments import run_experiments as exp
+	results_path = results_path or exp.RAW_RESULTS_PATH
+
+	def run(cell):
+		results = defaultdict(lambda: defaultdict(dict))
+		if os.path.exists(results_path):
+			with open(results_path, 'r') as f:
+				for task_type, algos in json.load(f).items():
+					for algo_name, sizes in algos.items():
+						results[task_type][algo_name].update(sizes)
+		energy_kwh = exp.run_cell(results, cell['category'], cell['variant'], cell['size'])
+		os.makedirs(os.path.dirname(results_path), exist_ok=True)
+		with open(results_path, 'w') as f:
+			json.dump(results, f, indent=2, default=list)
+		return energy_kwh
+	return run
+
+def estimate_cell_seconds(results, category, variant, size):
+	"""Cell duration from a previous raw_results run, else SCHEDULER_DEFAULT_CELL_SECONDS."""
+	from experiments.run_experiments import task_type_name
+	algos = results.get(task_type_name(category, variant), {})
+	times = [sizes[str(size)]['avg_time'] for sizes in algos.values() if str(size) in sizes]
+	if not times:
+		return experiment_config.SCHEDULER_DEFAULT_CELL_SECONDS
+	return sum(times) * experiment_config.NUM_RUNS
+
+def main():
+	from experiments.run_experiments import RAW_RESULTS_PATH, iter_cells
+	region = experiment_config.CARBON_INTENSITY_REGION
+	forecast_path = experiment_config.SCHEDULER_FORECAST_PATH or DEFAULT_INTENSITY_PATH
+	forecast = CarbonIntensityStore().load(forecast_path)
+	if region not in forecast:
+		print(f"[Warning] No forecast for region '{region}' in {forecast_path}; set CARBON_INTENSITY_REGION.")
+		return None
+	# Charge each scheduled run at the intensity of when it actually ran
+	configure_calculator(region, forecast_path)
+	previous = {}
+	if os.path.exists(RAW_RESULTS_PATH):
+		with open(RAW_RESULTS_PATH, 'r') as f:
+			previous = json.load(f)
+	deadline = time.time() + experiment_config.SCHEDULER_DEADLINE_HOURS * 3600
+	cells = [
+		make_cell(category, variant, size, estimate_cell_seconds(previous, category, variant, size), deadline)
+		for category, variant, size in iter_cells()
+	]
+	scheduler = CarbonAwareScheduler(cells, forecast, region, experiment_runner(), slot_seconds=experiment_config.SCHEDULER_SLOT_SECONDS)
+	for cell_id_, start in sorted(scheduler.plan().items(), key=lambda kv: kv[1]):
+		print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(start))}  {cell_id_}")
+	report = scheduler.run()
+	print(json.dumps(report, indent=2))
+	return report
+
+if __name__ == "__main__":
+	main()
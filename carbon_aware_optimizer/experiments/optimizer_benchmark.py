@@ -0,0 +1,98 @@
+"""
+Benchmark harness for workload assignment solvers.
+- Builds instances at each OPTIMIZER_BENCHMARK_TASK_COUNTS task count:
+  'planted' (known optimum, see planted_problem) and 'tight' (runtime
+  budget halfway between the fastest and the slowest assignment)
+- Runs every solver in ALL_SOLVERS under the same time budget
+- Reports carbon, gap to the reference optimum, feasibility and solve time
+The reference for 'tight' instances is the branch-and-bound optimum, or
+its lower bound when the time budget ran out (gaps are then upper bounds).
+Solvers that do a fixed amount of work (dp) report ignores_time_budget and
+are marked in the printed report, since their time is not capped. Solvers
+that refuse an instance (dp past its table limit) are skipped for it.
+"""
+import sys
+import os
+
+# Add project root to Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+import json
+
+import numpy as np
+
+from config import experiment_config
+from optimization.assignment_problem import AssignmentProblem, planted_problem, optimality_gap
+from optimization.classical_optimizer import ALL_SOLVERS
+
+RESULTS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/optimizer_benchmark.json')
+
+def tight_problem(n_tasks, n_options, seed=None):
+	"""Planted instance data with the budget halfway between fastest and slowest."""
+	planted, _, _ = planted_problem(n_tasks, n_options, seed=seed)
+	budget = (planted.runtime.min(axis=1).sum() + planted.runtime.max(axis=1).sum()) / 2
+	return AssignmentProblem(planted.carbon, planted.runtime, budget)
+
+def benchmark_instance(problem, reference, solvers=ALL_SOLVERS, time_budget=None, seed=0):
+	"""Runs each solver on problem; returns one row per solver."""
+	time_budget = time_budget or experiment_config.OPTIMIZER_BENCHMARK_TIME_BUDGET
+	rows = []
+	for name, solver in solvers.items():
+		try:
+			result = solver(problem, time_budget=time_budget, seed=seed)
+		except ValueError as e:
+			print(f"[Warning] Skipping {name}: {e}")
+			continue
+		rows.append({
+			'solver': name,
+			'carbon': result['carbon'],
+			'gap': optimality_gap(result, reference),
+			'feasible': result['feasible'],
+			'optimal': result.get('optimal', False),
+			# Solver's own lower bound on the optimum, if it reports one (dp: rounding bound)
+			'lower_bound': result.get('lower_bound'),
+			'elapsed_s': result['elapsed_s'],
+			'ignores_time_budget': result.get('ignores_time_budget', False),
+			'convergence': [(p['elapsed_s'], p['best_fitness']) for p in result['history']]
+		})
+	return rows
+
+def run_benchmark(task_counts=None, n_options=None, time_budget=None, seed=0):
+	"""Benchmarks every solver on planted and tight instances of each size."""
+	task_counts = task_counts or experiment_config.OPTIMIZER_BENCHMARK_TASK_COUNTS
+	n_options = n_options or experiment_config.OPTIMIZER_BENCHMARK_OPTIONS
+	time_budget = time_budget or experiment_config.OPTIMIZER_BENCHMARK_TIME_BUDGET
+	report = []
+	for n_tasks in task_counts:
+		problem, _, optimum = planted_problem(n_tasks, n_options, seed=seed)
+		for row in benchmark_instance(problem, optimum, time_budget=time_budget, seed=seed):
+			report.append({'instance': 'planted', 'tasks': n_tasks, 'reference': optimum, 'reference_exact': True, **row})
+		problem = tight_problem(n_tasks, n_options, seed=seed)
+		exact = ALL_SOLVERS['branch_and_bound'](problem, time_budget=time_budget)
+		reference = exact['carbon'] if exact['optimal'] else exact['lower_bound']
+		for row in benchmark_instance(problem, reference, time_budget=time_budget, seed=seed):
+			report.append({'instance': 'tight', 'tasks': n_tasks, 'reference': reference, 'reference_exact': exact['optimal'], **row})
+	return report
+
+def print_report(report):
+	print(f"{'instance':<8} {'tasks':>6} {'solver':<17} {'gap':>9} {'feasible':>8} {'time (s)':>9}")
+	for row in report:
+		gap = f"{row['gap']:.3%}" if np.isfinite(row['gap']) else "n/a"
+		bound = "" if row['reference_exact'] else " (<=)"
+		uncapped = " *" if row['ignores_time_budget'] else ""
+		print(f"{row['instance']:<8} {row['tasks']:>6} {row['solver']:<17} {gap:>9} {str(row['feasible']):>8} {row['elapsed_s']:>9.3f}{bound}{uncapped}")
+	if any(row['ignores_time_budget'] for row in report):
+		print("* ignores the time budget: always solves its full table")
+
+def main():
+	report = run_benchmark()
+	print_report(report)
+	os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+	with open(RESULTS_PATH, 'w') as f:
+		json.dump(report, f, indent=2)
+	return report
+
+if __name__ == "__main__":
+	main()
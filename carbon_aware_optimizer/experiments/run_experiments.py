@@ -20,8 +20,14 @@ import os
 import importlib
 import random
 import json
+import shutil
+import string
+import tempfile
+from array import array
 from collections import defaultdict
 
+import numpy as np
+
 
 import psutil
 import time
@@ -33,6 +39,17 @@ from carbon.carbon_calculator import enrich_with_energy_and_carbon as compute_ca
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config import experiment_config
+from algorithms.string_search import BYTES_ALGORITHMS
+from algorithms import matmul
+from algorithms.data_structures import SUPPORTED_OPS
+from algorithms.concurrency import StandInServer
+from algorithms import file_io
+from profiling.memory_profiler import memory_bandwidth_gbps, arithmetic_intensity
+from profiling.io_profiler import read_io_counters, io_delta
+from profiling.host_profiler import host_fingerprint
+from carbon.energy_model import classify_kernel_bound, estimate_memory_traffic_energy
+from carbon.carbon_calculator import get_carbon_intensity_at
+from carbon.intensity_store import configure_calculator
 
 # Import algorithm modules dynamically
 ALGO_MODULES = {
@@ -43,8 +60,66 @@ ALGO_MODULES = {
 	'binary_search': 'algorithms.binary_search',
 	'fibonacci_recursive': 'algorithms.recursion',
 	'fibonacci_iterative': 'algorithms.recursion',
+	'naive_string_search': 'algorithms.string_search',
+	'kmp_search': 'algorithms.string_search',
+	'horspool_search': 'algorithms.string_search',
+	'builtin_find': 'algorithms.string_search',
+	'regex_search': 'algorithms.string_search',
+	'bytes_find': 'algorithms.string_search',
+	'memoryview_horspool': 'algorithms.string_search',
+	'matmul_naive': 'algorithms.matmul',
+	'matmul_blocked': 'algorithms.matmul',
+	'matmul_flat_array': 'algorithms.matmul',
+	'matmul_numpy': 'algorithms.matmul',
+	'list_ops': 'algorithms.data_structures',
+	'deque_ops': 'algorithms.data_structures',
+	'set_ops': 'algorithms.data_structures',
+	'dict_ops': 'algorithms.data_structures',
+	'array_ops': 'algorithms.data_structures',
+	'bisect_ops': 'algorithms.data_structures',
+	'heapq_ops': 'algorithms.data_structures',
+	'json_roundtrip': 'algorithms.serialization',
+	'json_indent_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_0_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_1_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_2_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_3_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_4_roundtrip': 'algorithms.serialization',
+	'pickle_protocol_5_roundtrip': 'algorithms.serialization',
+	'marshal_roundtrip': 'algorithms.serialization',
+	'struct_roundtrip': 'algorithms.serialization',
+	'npy_roundtrip': 'algorithms.serialization',
+	'savez_roundtrip': 'algorithms.serialization',
+	'sequential_requests': 'algorithms.concurrency',
+	'thread_pool_requests': 'algorithms.concurrency',
+	'process_pool_requests': 'algorithms.concurrency',
+	'asyncio_requests': 'algorithms.concurrency',
+	'line_iteration': 'algorithms.file_io',
+	'buffered_read': 'algorithms.file_io',
+	'readinto_read': 'algorithms.file_io',
+	'mmap_scan': 'algorithms.file_io',
+	'sendfile_copy': 'algorithms.file_io',
+	'no_cache': 'algorithms.caching',
+	'dict_cache': 'algorithms.caching',
 }
 
+# Bounded caches are benchmarked as '<policy>_cache_<capacity>' algorithms that
+# share one function per policy
+ALGO_FUNCTIONS = {}
+CACHE_CAPACITIES = {}
+for _policy in experiment_config.CACHE_POLICIES:
+	for _capacity in experiment_config.CACHE_SIZES:
+		_name = f'{_policy}_cache_{_capacity}'
+		ALGO_MODULES[_name] = 'algorithms.caching'
+		ALGO_FUNCTIONS[_name] = f'{_policy}_cache'
+		CACHE_CAPACITIES[_name] = _capacity
+
+# array.array typecodes for the matmul dtypes
+MATMUL_TYPECODES = {'float64': 'd', 'float32': 'f', 'int64': 'q'}
+
+# Characters available to the string search text generator
+STRING_SEARCH_ALPHABET = string.ascii_lowercase + string.ascii_uppercase + string.digits
+
 # Profiling helpers
 process = psutil.Process(os.getpid())
 
@@ -69,10 +144,16 @@ class EnergyMonitor:
 		# Placeholder: Implement real hardware calls here
 		return None
 
+def _process_cpu_seconds():
+	"""User + system CPU time of this process and its reaped children (e.g. pool workers)."""
+	t = process.cpu_times()
+	return t.user + t.system + getattr(t, 'children_user', 0.0) + getattr(t, 'children_system', 0.0)
+
 def profile_algorithm(func, *args, **kwargs):
-	"""Profiles execution time, CPU, memory usage, and hardware energy."""
+	"""Profiles execution time, CPU (percent and seconds), memory usage, and hardware energy."""
 	# CPU percent before (non-blocking, so call once before and after)
 	cpu_before = process.cpu_percent(interval=None)
+	cpu_time_before = _process_cpu_seconds()
 	mem_before = process.memory_info().rss
 	
 	monitor = EnergyMonitor()
@@ -83,6 +164,7 @@ def profile_algorithm(func, *args, **kwargs):
 	
 	elapsed = time.perf_counter() - start
 	cpu_after = process.cpu_percent(interval=None)
+	cpu_time = _process_cpu_seconds() - cpu_time_before
 	mem_after = process.memory_info().rss
 	
 	# Calculate CPU and memory usage deltas
@@ -91,11 +173,12 @@ def profile_algorithm(func, *args, **kwargs):
 	
 	real_energy = monitor.get_energy_kwh()
 	
-	return result, elapsed, cpu_used, mem_used, real_energy
+	return result, elapsed, cpu_used, cpu_time, mem_used, real_energy
 
-def generate_datasets(category, size, seed):
+def generate_datasets(category, size, seed, variant=None):
 	"""Generates a deterministic dataset for a given category and size."""
 	random.seed(seed)
+	variant = variant or {}
 	if category == 'sorting':
 		# Random integer list
 		return [random.randint(0, size * 10) for _ in range(size)]
@@ -110,79 +193,458 @@ def generate_datasets(category, size, seed):
 		if size <= 1000: return 20
 		elif size <= 5000: return 25
 		else: return 30
+	elif category == 'string_search':
+		# Random text over the first `alphabet_size` symbols with the pattern
+		# planted at the end, so every strategy scans (almost) the whole text
+		alphabet = STRING_SEARCH_ALPHABET[:variant.get('alphabet_size', 26)]
+		m = min(variant.get('pattern_length', 16), size)
+		pattern = ''.join(random.choices(alphabet, k=m))
+		text = ''.join(random.choices(alphabet, k=size - m)) + pattern
+		return text, pattern
+	elif category == 'matmul':
+		# Two square n x n matrices with n*n ~= size, as nested Python lists.
+		# The dtype only changes the flat/numpy layouts built in prepare_inputs.
+		n = max(2, int(size ** 0.5))
+		if variant.get('dtype', 'float64').startswith('int'):
+			rand = lambda: random.randint(0, 9)
+		else:
+			rand = random.random
+		a = [[rand() for _ in range(n)] for _ in range(n)]
+		b = [[rand() for _ in range(n)] for _ in range(n)]
+		return a, b
+	elif category == 'data_structures':
+		# Unique keys: `size` initial keys plus fresh keys for inserts, and an
+		# operation trace drawn from the variant's weighted mix
+		mix = experiment_config.DATA_STRUCTURE_OP_MIXES[variant.get('mix', 'mixed')]
+		n_ops = experiment_config.DATA_STRUCTURE_OPS_PER_RUN
+		keys = random.sample(range(size * 10 + n_ops), size + n_ops)
+		initial, fresh = keys[:size], iter(keys[size:])
+		ops = []
+		for op in random.choices(list(mix), weights=list(mix.values()), k=n_ops):
+			if op == 'insert':
+				ops.append((op, next(fresh), None))
+			elif op == 'contains':
+				# Half hits, half misses (negative keys are never stored)
+				key = random.choice(initial) if random.random() < 0.5 else -1 - random.randrange(size)
+				ops.append((op, key, None))
+			elif op == 'range_count':
+				# Ranges span ~10% of the key space
+				lo = random.randrange(size * 10)
+				ops.append((op, lo, lo + size))
+			else:
+				ops.append((op, None, None))
+		return initial, ops
+	elif category == 'serialization':
+		# A raw_results-shaped payload with size // 10 leaves of NUM_RUNS runs each
+		payload = {}
+		for i in range(max(1, size // 10)):
+			task = payload.setdefault(f"task_{i % 4}", {})
+			leaf = {
+				'avg_time': random.random(),
+				'avg_cpu': random.uniform(0, 100),
+				'avg_mem': float(random.randint(1024, 1 << 24)),
+				'energy_kwh': random.random() * 1e-6,
+				'carbon_gco2': random.random() * 1e-3,
+				'runs': [
+					{'time': random.random(), 'cpu': random.uniform(0, 100), 'mem': float(random.randint(1024, 1 << 24))}
+					for _ in range(experiment_config.NUM_RUNS)
+				]
+			}
+			task.setdefault(f"algorithm_{(i // 4) % 5}", {})[str(1000 * (i // 20 + 1))] = leaf
+		return payload
+	elif category == 'concurrency':
+		# Number of simulated requests per run
+		return max(1, size // experiment_config.CONCURRENCY_SIZE_DIVISOR)
+	elif category == 'io':
+		# Log-like ASCII text: a pool of random lines cycled with line numbers
+		n_bytes = size * experiment_config.IO_BYTES_PER_SIZE_UNIT
+		pool = [''.join(random.choices(STRING_SEARCH_ALPHABET + ' ', k=random.randint(20, 120))) for _ in range(1000)]
+		lines, total, i = [], 0, 0
+		while total < n_bytes:
+			line = f"{i:08d} {pool[i % len(pool)]}\n"
+			lines.append(line)
+			total += len(line)
+			i += 1
+		# Ends on a full line, so the file is n_bytes rounded up to the next newline
+		return ''.join(lines).encode('ascii')
+	elif category == 'caching':
+		# Key access trace of `size` requests
+		trace = variant.get('trace', 'zipf')
+		n_keys = experiment_config.CACHE_KEY_SPACE
+		if trace == 'uniform':
+			return [random.randrange(n_keys) for _ in range(size)]
+		if trace == 'looping':
+			return [i % experiment_config.CACHE_LOOP_LENGTH for i in range(size)]
+		# Zipf ranks over a shuffled key space, so popular keys are not adjacent
+		keys = random.sample(range(n_keys), n_keys)
+		weights = [1.0 / rank ** experiment_config.CACHE_ZIPF_EXPONENT for rank in range(1, n_keys + 1)]
+		zipf = random.choices(keys, weights=weights, k=size)
+		if trace == 'zipf':
+			return zipf
+		if trace == 'scan_heavy':
+			# Alternate Zipf bursts with sequential scans over keys that are never requested again
+			burst, scan_key, out = 200, n_keys, []
+			for start in range(0, size, burst):
+				n = min(burst, size - start)
+				if (start // burst) % 2 == 0:
+					out.extend(zipf[start:start + n])
+				else:
+					out.extend(range(scan_key, scan_key + n))
+					scan_key += n
+			return out
+		raise ValueError(f"Unknown cache trace: {trace}")
+	else:
+		raise ValueError(f"Unknown category: {category}")
+
+def task_type_name(category, variant=None):
+	"""Result key for a category variant, e.g. 'string_search[alphabet_size=4,pattern_length=16]'."""
+	if not variant:
+		return category
+	params = ','.join(f"{k}={v}" for k, v in variant.items())
+	return f"{category}[{params}]"
+
+def prepare_inputs(category, base_data, variant=None):
+	"""Converts a generated dataset into the inputs shared by every run of a size."""
+	if category == 'string_search':
+		text, pattern = base_data
+		# Encode once so bytes-based strategies are not charged for the conversion
+		return {
+			'str': (text, pattern),
+			'bytes': (text.encode('ascii'), pattern.encode('ascii'))
+		}
+	if category == 'matmul':
+		# Materialise every layout up front; only the kernel itself is timed
+		a, b = base_data
+		dtype = (variant or {}).get('dtype', 'float64')
+		typecode = MATMUL_TYPECODES[dtype]
+		np_a, np_b = np.array(a, dtype=dtype), np.array(b, dtype=dtype)
+		return {
+			'n': len(a),
+			'nested': (a, b),
+			'flat': (array(typecode, np_a.ravel().tolist()), array(typecode, np_b.ravel().tolist())),
+			'numpy': (np_a, np_b),
+			'itemsize': np_a.itemsize
+		}
+	if category == 'concurrency':
+		# One stand-in server per variant/size, shared by every model; see release_inputs
+		variant = variant or {}
+		server = StandInServer(latency_ms=variant.get('latency_ms', 5)).start()
+		return {
+			'server': server,
+			'n_requests': base_data,
+			'concurrency': variant.get('concurrency', 4)
+		}
+	if category == 'io':
+		# Write the file into a fresh temp dir; see release_inputs
+		tmp_dir = tempfile.mkdtemp(prefix='greenalgo_io_')
+		path = os.path.join(tmp_dir, 'input.txt')
+		with open(path, 'wb') as f:
+			f.write(base_data)
+		cache = (variant or {}).get('cache', 'warm')
+		if cache == 'warm':
+			# Pull the file into the page cache once
+			file_io.buffered_read(path)
+		return {'dir': tmp_dir, 'path': path, 'dest': os.path.join(tmp_dir, 'copy.txt'), 'cache': cache, 'bytes': len(base_data)}
+	return base_data
+
+def release_inputs(category, inputs):
+	"""Frees resources acquired by prepare_inputs (e.g. the concurrency stand-in server)."""
+	if category == 'concurrency':
+		inputs['server'].stop()
+	elif category == 'io':
+		shutil.rmtree(inputs['dir'], ignore_errors=True)
+
+def build_args(category, algo_name, inputs):
+	"""Returns the positional arguments for one run, copying mutable inputs."""
+	if category == 'sorting':
+		# Use a copy to avoid in-place modification
+		return (list(inputs),)
+	elif category == 'searching':
+		arr, target = inputs
+		return (list(arr), target)
+	elif category == 'recursion':
+		# inputs is just an integer N
+		return (inputs,)
+	elif category == 'string_search':
+		return inputs['bytes'] if algo_name in BYTES_ALGORITHMS else inputs['str']
+	elif category == 'matmul':
+		layout = matmul.ALGORITHM_LAYOUTS[algo_name]
+		if algo_name == 'matmul_blocked':
+			return inputs[layout] + (experiment_config.MATMUL_TILE_SIZE,)
+		if layout == 'flat':
+			return inputs[layout] + (inputs['n'],)
+		return inputs[layout]
+	elif category == 'data_structures':
+		# Each container builds its own copy of the initial keys
+		return inputs
+	elif category == 'serialization':
+		return (inputs,)
+	elif category == 'concurrency':
+		return (inputs['server'].address, inputs['n_requests'], inputs['concurrency'])
+	elif category == 'io':
+		if inputs['cache'] == 'cold':
+			# Evict before every run so each one starts from storage
+			file_io.drop_file_cache(inputs['path'])
+		if algo_name == 'sendfile_copy':
+			return (inputs['path'], inputs['dest'])
+		return (inputs['path'],)
+	elif category == 'caching':
+		# Every run starts from an empty cache
+		return (inputs, experiment_config.CACHE_MISS_WORK, CACHE_CAPACITIES.get(algo_name))
 	else:
 		raise ValueError(f"Unknown category: {category}")
 
+def dispatch_registry():
+	"""
+	How optimization.crossover.green_dispatch calls each algorithm of the
+	categories it dispatches: {algorithm: {'module', 'function', 'input'
+	('bytes', 'str' or None: the type text arguments are converted to),
+	'extra_args' (appended after the caller's, e.g. a cache capacity)}}.
+	"""
+	registry = {}
+	for category in ('sorting', 'searching', 'string_search', 'caching'):
+		for algo_name in experiment_config.ALGORITHM_CATEGORIES.get(category, []):
+			entry = {'module': ALGO_MODULES[algo_name], 'function': ALGO_FUNCTIONS.get(algo_name, algo_name), 'input': None, 'extra_args': []}
+			if category == 'string_search':
+				entry['input'] = 'bytes' if algo_name in BYTES_ALGORITHMS else 'str'
+			elif category == 'caching':
+				entry['extra_args'] = [CACHE_CAPACITIES.get(algo_name)]
+			registry[algo_name] = entry
+	return registry
+
+def algorithm_supported(category, algo_name, variant):
+	"""Whether algo_name can run a variant; e.g. heaps and sets cannot answer FIFO pops."""
+	if category == 'data_structures':
+		mix = experiment_config.DATA_STRUCTURE_OP_MIXES[variant['mix']]
+		return set(mix) <= SUPPORTED_OPS[algo_name]
+	if category == 'io' and variant.get('cache') == 'cold':
+		return file_io.cold_cache_supported()
+	return True
+
+def collect_run_metrics(category, algo_name, inputs, result, elapsed):
+	"""Returns category-specific per-run metrics to store alongside time/cpu/mem."""
+	if category == 'matmul':
+		n = inputs['n']
+		# Nested lists touch an 8-byte pointer plus a boxed Python number per element
+		if matmul.ALGORITHM_LAYOUTS[algo_name] == 'nested':
+			element_bytes = 8 + sys.getsizeof(inputs['nested'][0][0][0])
+		else:
+			element_bytes = inputs['itemsize']
+		bytes_moved = matmul.memory_traffic_bytes(algo_name, n, element_bytes, experiment_config.MATMUL_TILE_SIZE)
+		return {
+			'flops': matmul.matmul_flops(n),
+			'bytes_moved': bytes_moved,
+			'bandwidth_gbps': memory_bandwidth_gbps(bytes_moved, elapsed)
+		}
+	if category == 'data_structures':
+		_, ops = inputs
+		return {'ops_per_sec': len(ops) / elapsed if elapsed > 0 else 0.0}
+	if category == 'serialization':
+		# The round-trip reports payload size and its own encode/decode split
+		return dict(result)
+	if category == 'concurrency':
+		return {
+			'requests': result['requests'],
+			'throughput_rps': result['requests'] / result['wall_sec'] if result['wall_sec'] > 0 else 0.0,
+			'cpu_sec': result['cpu_sec']
+		}
+	if category == 'io':
+		return {'throughput_mb_s': inputs['bytes'] / elapsed / 1e6 if elapsed > 0 else 0.0}
+	if category == 'caching':
+		return {
+			'requests': result['requests'],
+			'hit_rate': result['hits'] / result['requests'] if result['requests'] else 0.0,
+			'throughput_rps': result['requests'] / elapsed if elapsed > 0 else 0.0
+		}
+	return {}
+
+
+def benchmark_algorithm(category, algo_name, inputs):
+	"""
+	Runs algo_name NUM_RUNS times on prepared inputs.
+	Returns the averaged, energy/carbon-enriched result entry stored per size.
+	"""
+	# Import algorithm function
+	module = importlib.import_module(ALGO_MODULES[algo_name])
+	algo_func = getattr(module, ALGO_FUNCTIONS.get(algo_name, algo_name))
+	run_stats = []
+	for run in range(experiment_config.NUM_RUNS):
+		args = build_args(category, algo_name, inputs)
+		io_before = read_io_counters(process) if category == 'io' else None
+		started_at = time.time()
+		result, elapsed, cpu, cpu_time, mem, real_energy = profile_algorithm(algo_func, *args)
+		io_after = read_io_counters(process) if category == 'io' else None
+
+		run_stats.append({
+			'timestamp': started_at,  # Unix s, for time-varying carbon intensity
+			'time': elapsed,
+			'cpu': cpu,
+			'cpu_time': cpu_time,  # seconds, feeds the power model
+			'mem': mem,
+			'real_energy': real_energy,
+			**collect_run_metrics(category, algo_name, inputs, result, elapsed),
+			**io_delta(io_before, io_after)
+		})
+	# Average results
+	avg_time = sum(r['time'] for r in run_stats) / experiment_config.NUM_RUNS
+	avg_cpu = sum(r['cpu'] for r in run_stats) / experiment_config.NUM_RUNS
+	avg_mem = sum(r['mem'] for r in run_stats) / experiment_config.NUM_RUNS
+	avg_cpu_time = sum(r['cpu_time'] for r in run_stats) / experiment_config.NUM_RUNS
+
+	# Average real energy if available (handle None)
+	valid_energies = [r['real_energy'] for r in run_stats if r['real_energy'] is not None]
+	avg_real_energy = sum(valid_energies) / len(valid_energies) if valid_energies else None
+
+	# Charge at the intensity when each run executed, weighted by run time
+	intensities = [get_carbon_intensity_at(r['timestamp']) for r in run_stats]
+	total_time = sum(r['time'] for r in run_stats)
+	if total_time > 0:
+		carbon_intensity = sum(r['time'] * i for r, i in zip(run_stats, intensities)) / total_time
+	else:
+		carbon_intensity = sum(intensities) / len(intensities)
+
+	# Average any category-specific metrics reported per run
+	extra_keys = [k for k in run_stats[0] if k not in ('timestamp', 'time', 'cpu', 'cpu_time', 'mem', 'real_energy')]
+	workload_metrics = {k: sum(r[k] for r in run_stats) / experiment_config.NUM_RUNS for k in extra_keys}
+	if 'flops' in workload_metrics and 'bytes_moved' in workload_metrics:
+		# bytes_moved comes from matmul.memory_traffic_bytes, not hardware counters
+		workload_metrics['traffic_source'] = 'modelled'
+		workload_metrics['arithmetic_intensity'] = arithmetic_intensity(workload_metrics['flops'], workload_metrics['bytes_moved'])
+		workload_metrics['dram_energy_kwh'] = estimate_memory_traffic_energy(workload_metrics['bytes_moved'])
+		# Roofline classification only for BLAS-backed kernels; pure-Python loops are
+		# bound by the interpreter, not by their modelled traffic
+		if matmul.ALGORITHM_LAYOUTS.get(algo_name) == 'numpy':
+			workload_metrics['bound'] = classify_kernel_bound(workload_metrics['flops'], workload_metrics['bytes_moved'])
+	for phase in ('encode', 'decode'):
+		if f'{phase}_sec' in workload_metrics:
+			# Charge each serialization phase separately
+			phase_input = {'time': workload_metrics[f'{phase}_sec'], 'mem': avg_mem}
+			workload_metrics[f'{phase}_energy_kwh'] = compute_carbon(phase_input, carbon_intensity=carbon_intensity)['energy_kwh']
+	if 'cpu_sec' in workload_metrics:
+		# Wall time charges idle waiting at full power; also price the CPU time actually used
+		cpu_input = {'time': workload_metrics['cpu_sec'], 'mem': avg_mem}
+		workload_metrics['cpu_carbon_gco2'] = compute_carbon(cpu_input, carbon_intensity=carbon_intensity)['carbon_gco2']
+
+	# Compute energy and carbon using the averaged metrics
+	# Convert memory from bytes to MB for carbon input
+	carbon_input = {
+		'time': avg_time,          # seconds
+		'cpu': avg_cpu,            # percent
+		'cpu_time': avg_cpu_time,  # seconds
+		'mem': avg_mem             # bytes
+	}
+	# Pass real energy if we have it
+	enriched = compute_carbon(carbon_input, carbon_intensity=carbon_intensity, real_energy_kwh=avg_real_energy)
+
+	entry = {
+		'avg_time': avg_time,
+		'avg_cpu': avg_cpu,
+		'avg_cpu_time': avg_cpu_time,
+		'avg_mem': avg_mem,
+		'energy_kwh': enriched.get('energy_kwh', 0),
+		'carbon_gco2': enriched.get('carbon_gco2', 0),
+		'energy_source': enriched.get('energy_source', 'unknown'),
+		'host': host_fingerprint(),  # cost_model.py predicts per host
+		'runs': run_stats
+	}
+	if 'requests' in workload_metrics:
+		requests = workload_metrics['requests']
+		workload_metrics['energy_per_request_kwh'] = entry['energy_kwh'] / requests
+		workload_metrics['carbon_per_request_gco2'] = entry['carbon_gco2'] / requests
+		if 'cpu_carbon_gco2' in workload_metrics:
+			workload_metrics['cpu_carbon_per_request_gco2'] = workload_metrics['cpu_carbon_gco2'] / requests
+	if workload_metrics:
+		entry['workload_metrics'] = workload_metrics
+	return entry
+
+def print_entry(task_type, algo_name, size, entry):
+	"""Prints a one-result summary."""
+	workload_metrics = entry.get('workload_metrics', {})
+	print(f"Category: {task_type}, Algorithm: {algo_name}, Size: {size}")
+	print(f"  Avg Time: {entry['avg_time']:.6f}s, Avg CPU: {entry['avg_cpu']:.2f}%, Avg Mem: {entry['avg_mem']/1024:.2f} KB")
+	if 'bandwidth_gbps' in workload_metrics:
+		bound = f"{workload_metrics['bound']}-bound" if 'bound' in workload_metrics else "interpreter-bound"
+		print(f"  Memory Bandwidth: {workload_metrics['bandwidth_gbps']:.3f} GB/s (modelled traffic, {bound})")
+	if 'bytes' in workload_metrics:
+		print(f"  Payload: {workload_metrics['bytes']:.0f} bytes, Encode: {workload_metrics['encode_sec']:.6f}s, Decode: {workload_metrics['decode_sec']:.6f}s")
+	if 'throughput_mb_s' in workload_metrics:
+		print(f"  Throughput: {workload_metrics['throughput_mb_s']:.1f} MB/s, Read: {workload_metrics.get('io_read_bytes', 0):.0f} B, Written: {workload_metrics.get('io_write_bytes', 0):.0f} B")
+	if 'hit_rate' in workload_metrics:
+		print(f"  Hit Rate: {workload_metrics['hit_rate']:.2%}, Throughput: {workload_metrics['throughput_rps']:.1f} req/s, "f"Energy/Request: {workload_metrics['energy_per_request_kwh']:.3e} kWh")
+	elif 'requests' in workload_metrics:
+		print(f"  Throughput: {workload_metrics['throughput_rps']:.1f} req/s, CPU Time: {workload_metrics['cpu_sec']:.4f}s, "f"Carbon/Request: {workload_metrics['carbon_per_request_gco2']:.3e} gCO2")
+	print(f"  Energy ({entry['energy_source']}): {entry['energy_kwh']:.6e} kWh, "f"Carbon: {entry['carbon_gco2']:.6f} gCO2\n")
+
+def benchmark_result_files(results, paths):
+	"""
+	Round-trips this project's own result files through every serialization format.
+	Each file is stored as task type 'serialization[payload=<file name>]', keyed by its size in bytes.
+	Byte sizes are not dataset sizes, so main() keeps these results in
+	SERIALIZATION_RESULTS_PATH, out of raw_results.json and everything built from it.
+	"""
+	for path in paths:
+		if not os.path.exists(path):
+			continue
+		with open(path, 'r') as f:
+			payload = json.load(f)
+		task_type = task_type_name('serialization', {'payload': os.path.basename(path)})
+		size = os.path.getsize(path)
+		for algo_name in experiment_config.ALGORITHM_CATEGORIES['serialization']:
+			entry = benchmark_algorithm('serialization', algo_name, payload)
+			results[task_type][algo_name][str(size)] = entry
+			print_entry(task_type, algo_name, size, entry)
+
+RAW_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/raw_results.json')
+SERIALIZATION_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/serialization_results.json')
+
+def iter_cells():
+	"""Yields every (category, variant, size) experiment cell in run order."""
+	for category in experiment_config.ALGORITHM_CATEGORIES:
+		for variant in experiment_config.CATEGORY_VARIANTS.get(category, [None]):
+			for size in experiment_config.DATASET_SIZES:
+				yield category, variant, size
+
+def run_cell(results, category, variant, size):
+	"""
+	Benchmarks every supported algorithm of one cell into results.
+	Returns the cell's total energy in kWh (all runs).
+	"""
+	task_type = task_type_name(category, variant)
+	# Generate dataset once per size/category for fairness
+	base_data = generate_datasets(category, size, experiment_config.RANDOM_SEED, variant)
+	inputs = prepare_inputs(category, base_data, variant)
+	energy_kwh = 0.0
+	try:
+		for algo_name in experiment_config.ALGORITHM_CATEGORIES[category]:
+			if not algorithm_supported(category, algo_name, variant):
+				continue
+			# Store size as string for JSON compatibility and downstream code
+			entry = benchmark_algorithm(category, algo_name, inputs)
+			results[task_type][algo_name][str(size)] = entry
+			print_entry(task_type, algo_name, size, entry)
+			energy_kwh += entry['energy_kwh'] * experiment_config.NUM_RUNS
+	finally:
+		release_inputs(category, inputs)
+	return energy_kwh
+
 def main():
+	# Time-series carbon intensity, if a region is configured
+	configure_calculator(experiment_config.CARBON_INTENSITY_REGION)
 	results = defaultdict(lambda: defaultdict(dict))
-	for category in experiment_config.ALGORITHM_CATEGORIES:
-		algos = experiment_config.ALGORITHM_CATEGORIES[category]
-		for size in experiment_config.DATASET_SIZES:
-			# Generate dataset once per size/category for fairness
-			if category == 'sorting':
-				base_data = generate_datasets(category, size, experiment_config.RANDOM_SEED)
-			elif category == 'searching':
-				base_data, target = generate_datasets(category, size, experiment_config.RANDOM_SEED)
-			elif category == 'recursion':
-				base_data = generate_datasets(category, size, experiment_config.RANDOM_SEED)
-
-			for algo_name in algos:
-				# Import algorithm function
-				module = importlib.import_module(ALGO_MODULES[algo_name])
-				algo_func = getattr(module, algo_name)
-				run_stats = []
-				for run in range(experiment_config.NUM_RUNS):
-					# Use a copy to avoid in-place modification
-					real_energy = None
-					if category == 'sorting':
-						data = list(base_data)
-						_, elapsed, cpu, mem, real_energy = profile_algorithm(algo_func, data)
-					elif category == 'searching':
-						data = list(base_data)
-						_, elapsed, cpu, mem, real_energy = profile_algorithm(algo_func, data, target)
-					elif category == 'recursion':
-						# base_data is just an integer N
-						_, elapsed, cpu, mem, real_energy = profile_algorithm(algo_func, base_data)
-					
-					run_stats.append({
-						'time': elapsed, 
-						'cpu': cpu, 
-						'mem': mem,
-						'real_energy': real_energy
-					})
-				# Average results
-				avg_time = sum(r['time'] for r in run_stats) / experiment_config.NUM_RUNS
-				avg_cpu = sum(r['cpu'] for r in run_stats) / experiment_config.NUM_RUNS
-				avg_mem = sum(r['mem'] for r in run_stats) / experiment_config.NUM_RUNS
-				
-				# Average real energy if available (handle None)
-				valid_energies = [r['real_energy'] for r in run_stats if r['real_energy'] is not None]
-				avg_real_energy = sum(valid_energies) / len(valid_energies) if valid_energies else None
-
-				# Compute energy and carbon using the averaged metrics
-				# Convert memory from bytes to MB for carbon input
-				carbon_input = {
-					'time': avg_time,  # seconds
-					'mem': avg_mem     # bytes
-				}
-				# Pass real energy if we have it
-				enriched = compute_carbon(carbon_input, real_energy_kwh=avg_real_energy)
-
-				# Store size as string for JSON compatibility and downstream code
-				results[category][algo_name][str(size)] = {
-					'avg_time': avg_time,
-					'avg_cpu': avg_cpu,
-					'avg_mem': avg_mem,
-					'energy_kwh': enriched.get('energy_kwh', 0),
-					'carbon_gco2': enriched.get('carbon_gco2', 0),
-					'energy_source': enriched.get('energy_source', 'unknown'),
-					'runs': run_stats
-				}
-				print(f"Category: {category}, Algorithm: {algo_name}, Size: {size}")
-				print(f"  Avg Time: {avg_time:.6f}s, Avg CPU: {avg_cpu:.2f}%, Avg Mem: {avg_mem/1024:.2f} KB")
-				print(f"  Energy ({enriched.get('energy_source')}): {enriched.get('energy_kwh', 0):.6e} kWh, "f"Carbon: {enriched.get('carbon_gco2', 0):.6f} gCO2\n")
-
-                
+	for category, variant, size in iter_cells():
+		run_cell(results, category, variant, size)
+
+	out_path = RAW_RESULTS_PATH
+	if 'serialization' in experiment_config.ALGORITHM_CATEGORIES and experiment_config.SERIALIZATION_BENCHMARK_RESULT_FILES:
+		# Benchmark the previous run's results file before it is overwritten; stored
+		# separately because its byte-size keys would mix with dataset sizes
+		file_results = defaultdict(lambda: defaultdict(dict))
+		benchmark_result_files(file_results, [out_path])
+		if file_results:
+			os.makedirs(os.path.dirname(SERIALIZATION_RESULTS_PATH), exist_ok=True)
+			with open(SERIALIZATION_RESULTS_PATH, 'w') as f:
+				json.dump(file_results, f, indent=2, default=list)
+
 	# Debug: print a preview of the results structure
 	try:
 		preview = json.dumps(results, indent=2)
@@ -191,7 +653,6 @@ def main():
 		print("[DEBUG] Could not print results preview:", e)
 
 	# Store raw results as JSON
-	out_path = os.path.join(os.path.dirname(__file__), '../data/experiments/raw_results.json')
 	os.makedirs(os.path.dirname(out_path), exist_ok=True)
 	with open(out_path, 'w') as f:
 		json.dump(results, f, indent=2, default=list)
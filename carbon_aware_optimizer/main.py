@@ -22,22 +22,19 @@ def compute_energy_carbon():
 	log("2. Computing energy and carbon emissions")
 	try:
 		import json
-		from carbon.carbon_calculator import enrich_with_energy_and_carbon
+		from carbon.carbon_calculator import enrich_records, collect_runs
+		from carbon.intensity_store import configure_calculator
+		from config import experiment_config
+		# Charge each timestamped run at the intensity when it executed
+		configure_calculator(experiment_config.CARBON_INTENSITY_REGION)
 		raw_path = os.path.join(os.path.dirname(__file__), 'data/experiments/raw_results.json')
 		if not os.path.exists(raw_path):
 			print("[Warning] No raw results found. Skipping energy/carbon computation.")
 			return
 		with open(raw_path, 'r') as f:
 			results = json.load(f)
-		# Recursively enrich all run dicts
-		def enrich_all(d):
-			if isinstance(d, dict):
-				for k, v in d.items():
-					if isinstance(v, dict) and 'time' in v and 'mem' in v:
-						d[k] = enrich_with_energy_and_carbon(v)
-					else:
-						enrich_all(v)
-		enrich_all(results)
+		# Collect every run dict, then enrich them in one vectorized pass
+		enrich_records(collect_runs(results))
 		with open(raw_path, 'w') as f:
 			json.dump(results, f, indent=2)
 	except Exception as e:
@@ -58,12 +55,19 @@ def train_or_load_model():
 		train_and_save_model()
 	except Exception as e:
 		print("[Warning] Model training phase failed or already exists:", e)
+	try:
+		# Pre-execution cost model, so unmeasured sizes can be answered without running them
+		from ai_model.cost_model import fit_cost_model, COST_MODEL_PATH
+		model = fit_cost_model()
+		print(f"Cost model: {len(model['cells'])} cells saved to {COST_MODEL_PATH}")
+	except Exception as e:
+		print("[Warning] Cost model fit failed:", e)
 
 def run_optimizer():
 	log("5. Running quantum-inspired optimization")
 	try:
 		import pandas as pd
-		from optimization.quantum_inspired_optimizer import select_best_algorithm
+		from optimization.quantum_inspired_optimizer import select_best_algorithm, select_pareto
 		csv_path = os.path.join(os.path.dirname(__file__), 'data/experiments/cleaned_results.csv')
 		if not os.path.exists(csv_path):
 			print("[Warning] No dataset found for optimization.")
@@ -74,6 +78,29 @@ def run_optimizer():
 		algos = df_plot[['algorithm', 'carbon_gco2', 'avg_time_sec']].to_dict('records')
 		best_algo, score, explanation = select_best_algorithm(algos)
 		print(f"Optimizer selected: {best_algo}\nExplanation: {explanation}")
+		# Per task type recommendation (e.g. one per string search pattern length)
+		for task_type, group in df_plot.groupby('task_type'):
+			task_algos = group[['algorithm', 'carbon_gco2', 'avg_time_sec']].to_dict('records')
+			task_best, _, _ = select_best_algorithm(task_algos)
+			# Trade-off set across carbon, mean/p99 time and peak memory
+			front = select_pareto(group.to_dict('records'))['front']
+			print(f"  {task_type}: {task_best} (Pareto front: {', '.join(c['algorithm'] for c in front)})")
+		# Variance-aware pick from per-run samples; noisy near-ties are flagged, not resolved
+		samples_path = os.path.join(os.path.dirname(__file__), 'data/experiments/run_samples.csv')
+		if os.path.exists(samples_path):
+			from optimization.robust_selection import bootstrap_select, samples_from_frame
+			print("Bootstrap selection (largest size):")
+			for (task_type, size), samples in sorted(samples_from_frame(pd.read_csv(samples_path)).items()):
+				if size == df[df['task_type'] == task_type]['dataset_size'].max():
+					robust = bootstrap_select(samples, seed=0)
+					print(f"  {task_type}: {robust['explanation']}")
+		# Winners by input size, used by green_dispatch
+		from optimization.crossover import build_crossover_table, describe_intervals
+		from experiments.run_experiments import dispatch_registry
+		table = build_crossover_table(csv_path, registry=dispatch_registry())
+		print("Size-aware choice (balanced):")
+		for task_type, entry in table['categories'].items():
+			print(f"  {task_type}: {describe_intervals(entry['balanced'])}")
 		return best_algo, explanation
 	except Exception as e:
 		print("[Warning] Optimizer phase failed:", e)
@@ -0,0 +1,207 @@
+"""
+Workload-wide algorithm assignment problem shared by the quantum-inspired
+and classical solvers.
+Each of T tasks gets one of up to K options (algorithm/configuration), each
+with a carbon cost and a runtime. The goal is the lowest total carbon whose
+total runtime fits runtime_budget (the SLA) and, optionally, whose total
+carbon fits carbon_budget.
+
+Every solver has the signature solver(problem, time_budget=..., seed=...,
+**options) and returns make_result(...).
+"""
+import numpy as np
+
+class AssignmentProblem:
+	"""
+	carbon, runtime: T x K arrays; unavailable options are NaN or inf.
+	labels: optional T x K option names, tasks: optional T task names.
+	"""
+
+	def __init__(self, carbon, runtime, runtime_budget, carbon_budget=None, labels=None, tasks=None):
+		carbon = np.asarray(carbon, dtype=float)
+		runtime = np.asarray(runtime, dtype=float)
+		if carbon.ndim != 2 or carbon.shape != runtime.shape:
+			raise ValueError("carbon and runtime must be T x K arrays of the same shape")
+		self.valid = np.isfinite(carbon) & np.isfinite(runtime)
+		if not self.valid.any(axis=1).all():
+			raise ValueError("Every task needs at least one available option")
+		self.carbon = np.where(self.valid, carbon, np.inf)
+		self.runtime = np.where(self.valid, runtime, np.inf)
+		self.runtime_budget = float(runtime_budget)
+		self.carbon_budget = None if carbon_budget is None else float(carbon_budget)
+		self.labels = labels
+		self.tasks = tasks
+		self.n_tasks, self.n_options = carbon.shape
+		self._rows = np.arange(self.n_tasks)
+		# Lowest-carbon option per task, used to repair unavailable picks
+		self.cheapest = np.argmin(self.carbon, axis=1)
+		# Any infeasible assignment scores worse than every feasible one
+		self.penalty = max(float(np.where(self.valid, carbon, 0.0).max(axis=1).sum()), 1e-12)
+
+	def repair(self, assignments):
+		"""Replaces unavailable options with the task's lowest-carbon option."""
+		assignments = np.asarray(assignments, dtype=np.int64)
+		return np.where(self.valid[self._rows, assignments], assignments, self.cheapest)
+
+	def evaluate(self, assignments):
+		"""Total (carbon, runtime) of one assignment (T) or a population (P x T)."""
+		assignments = np.asarray(assignments, dtype=np.int64)
+		return self.carbon[self._rows, assignments].sum(axis=-1), self.runtime[self._rows, assignments].sum(axis=-1)
+
+	def violation(self, carbon, runtime):
+		"""Relative budget excess of totals (0 when feasible)."""
+		excess = np.maximum(runtime - self.runtime_budget, 0.0) / max(self.runtime_budget, 1e-12)
+		if self.carbon_budget is not None:
+			excess = excess + np.maximum(carbon - self.carbon_budget, 0.0) / max(self.carbon_budget, 1e-12)
+		return excess
+
+	def fitness_from_totals(self, carbon, runtime):
+		"""Penalized objective: total carbon if feasible, else penalty * (1 + violation)."""
+		violation = self.violation(carbon, runtime)
+		return np.where(violation > 0, self.penalty * (1.0 + violation), carbon)
+
+	def fitness(self, assignments):
+		return self.fitness_from_totals(*self.evaluate(assignments))
+
+	def fastest_assignment(self):
+		"""Lowest-runtime option per task (lowest carbon on ties): feasible if anything is."""
+		order = np.lexsort((self.carbon, self.runtime), axis=1)
+		return order[:, 0]
+
+	def hull_increments(self):
+		"""
+		Upgrades along each task's lower convex hull of (runtime, carbon),
+		starting from fastest_assignment(). Returns arrays task, option,
+		d_runtime, d_carbon (carbon saved is -d_carbon) and efficiency
+		(carbon saved per extra second), decreasing within each task.
+		"""
+		parts = []
+		for t in range(self.n_tasks):
+			options = np.flatnonzero(self.valid[t])
+			options = options[np.lexsort((self.carbon[t, options], self.runtime[t, options]))]
+			hull = [options[0]]
+			for k in options[1:]:
+				if self.carbon[t, k] >= self.carbon[t, hull[-1]]:
+					continue
+				# Drop hull points that lie on or above the segment to the new point
+				while len(hull) >= 2:
+					a, b = hull[-2], hull[-1]
+					cross = (self.runtime[t, b] - self.runtime[t, a]) * (self.carbon[t, k] - self.carbon[t, a]) - (self.carbon[t, b] - self.carbon[t, a]) * (self.runtime[t, k] - self.runtime[t, a])
+					if cross > 0:
+						break
+					hull.pop()
+				hull.append(k)
+			for a, b in zip(hull[:-1], hull[1:]):
+				parts.append((t, b, self.runtime[t, b] - self.runtime[t, a], self.carbon[t, b] - self.carbon[t, a]))
+		if not parts:
+			empty = np.array([], dtype=float)
+			return {'task': np.array([], dtype=np.int64), 'option': np.array([], dtype=np.int64), 'd_runtime': empty, 'd_carbon': empty, 'efficiency': empty}
+		task, option, d_runtime, d_carbon = (np.array(col) for col in zip(*parts))
+		return {
+			'task': task.astype(np.int64),
+			'option': option.astype(np.int64),
+			'd_runtime': d_runtime.astype(float),
+			'd_carbon': d_carbon.astype(float),
+			'efficiency': -d_carbon / np.maximum(d_runtime, 1e-300)
+		}
+
+	def greedy_assignment(self):
+		"""
+		Takes hull upgrades in order of carbon saved per second while the
+		runtime budget allows; a task stops upgrading at its first upgrade
+		that does not fit.
+		"""
+		assignment = self.fastest_assignment()
+		spare = self.runtime_budget - self.evaluate(assignment)[1]
+		if spare < 0:
+			return assignment
+		inc = self.hull_increments()
+		blocked = np.zeros(self.n_tasks, dtype=bool)
+		for i in np.argsort(-inc['efficiency'], kind='stable'):
+			t = inc['task'][i]
+			if blocked[t]:
+				continue
+			if inc['d_runtime'][i] <= spare:
+				assignment[t] = inc['option'][i]
+				spare -= inc['d_runtime'][i]
+			else:
+				blocked[t] = True
+		return assignment
+
+	def describe(self, assignment):
+		"""Option label (or index) chosen for each task."""
+		if self.labels is None:
+			return [int(k) for k in assignment]
+		return [self.labels[t][k] for t, k in enumerate(assignment)]
+
+def make_result(problem, assignment, solver, elapsed, history=None, **extra):
+	"""
+	Common solver result: assignment, carbon, runtime, feasible, solver,
+	elapsed_s and history (convergence curve: dicts with iteration,
+	elapsed_s and best_fitness).
+	"""
+	assignment = np.asarray(assignment, dtype=np.int64)
+	carbon, runtime = problem.evaluate(assignment)
+	result = {
+		'solver': solver,
+		'assignment': assignment,
+		'carbon': float(carbon),
+		'runtime': float(runtime),
+		'feasible': bool(problem.violation(carbon, runtime) == 0),
+		'elapsed_s': float(elapsed),
+		'history': history or []
+	}
+	result.update(extra)
+	return result
+
+def optimality_gap(result, optimum):
+	"""Relative carbon above a known optimum (inf for infeasible results)."""
+	if not result['feasible']:
+		return float('inf')
+	return (result['carbon'] - optimum) / optimum if optimum > 0 else result['carbon'] - optimum
+
+def from_results(records, workload, runtime_budget, carbon_budget=None, task_keys=('task_type', 'dataset_size')):
+	"""
+	Builds a problem from cleaned_results records (dicts with 'algorithm',
+	'carbon_gco2', 'avg_time_sec' and task_keys). workload lists one dict
+	(or tuple of task_keys values) per task; its options are the records
+	with matching keys.
+	"""
+	options = {}
+	for r in records:
+		options.setdefault(tuple(r[k] for k in task_keys), []).append(r)
+	keys = [tuple(w[k] for k in task_keys) if isinstance(w, dict) else tuple(w) for w in workload]
+	missing = sorted({k for k in keys if k not in options}, key=str)
+	if missing:
+		raise ValueError(f"No results for tasks: {missing}")
+	width = max(len(options[k]) for k in set(keys))
+	distinct = list(dict.fromkeys(keys))
+	position = {k: i for i, k in enumerate(distinct)}
+	carbon = np.full((len(distinct), width), np.nan)
+	runtime = np.full((len(distinct), width), np.nan)
+	labels = [[None] * width for _ in distinct]
+	for i, k in enumerate(distinct):
+		for j, r in enumerate(options[k]):
+			carbon[i, j] = float(r['carbon_gco2'])
+			runtime[i, j] = float(r['avg_time_sec'])
+			labels[i][j] = r['algorithm']
+	# Repeated tasks share the rows of their key
+	index = np.array([position[k] for k in keys], dtype=np.int64)
+	return AssignmentProblem(carbon[index], runtime[index], runtime_budget, carbon_budget, labels=[labels[i] for i in index], tasks=keys)
+
+def planted_problem(n_tasks, n_options=8, seed=None, multiplier=1.0):
+	"""
+	Random instance with a known optimum. Each task's choice minimizes
+	carbon + multiplier * runtime, and the runtime budget is set to that
+	assignment's total runtime, so by Lagrangian sufficiency no feasible
+	assignment has less carbon. Returns (problem, optimal assignment, optimal carbon).
+	"""
+	rng = np.random.default_rng(seed)
+	runtime = rng.uniform(0.5, 5.0, size=(n_tasks, n_options))
+	# Slower options tend to be greener (e.g. lower clock, less parallelism)
+	carbon = rng.uniform(0.5, 2.0, size=(n_tasks, 1)) * (6.0 - runtime) * rng.uniform(0.8, 1.2, size=(n_tasks, n_options))
+	optimal = np.argmin(carbon + multiplier * runtime, axis=1)
+	rows = np.arange(n_tasks)
+	budget = runtime[rows, optimal].sum()
+	problem = AssignmentProblem(carbon, runtime, budget)
+	return problem, optimal, float(carbon[rows, optimal].sum())
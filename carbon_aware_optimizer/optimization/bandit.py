@@ -0,0 +1,203 @@
+"""
+Online algorithm selection from production feedback.
+BanditSelector wraps interchangeable implementations (arms) of one task and
+picks one per call with Thompson sampling or UCB, contextual on the input's
+size bucket and distribution. Each call is timed with perf_counter and the
+arm's posterior over log runtime is updated; under the CPU power models
+energy, and so carbon, scales with that runtime.
+
+Exploration (calls given to an arm other than the current best) is capped
+at max_exploration of a context's calls, after a warm-up of one call per arm.
+State is saved atomically to JSON every save_every calls and on save().
+"""
+import json
+import math
+import os
+import random
+import threading
+import time
+
+BANDIT_STATE_DIR = os.path.join(os.path.dirname(__file__), '../data/bandit')
+
+POLICIES = ["thompson", "ucb"]
+DEFAULT_POLICY = "thompson"
+DEFAULT_MAX_EXPLORATION = 0.05
+DEFAULT_SAVE_EVERY = 100
+
+# Log-runtime variance assumed for an arm until it has two observations
+PRIOR_VARIANCE = 0.25
+
+def size_bucket(data):
+	"""Power-of-two size bucket of len(data), e.g. 1000 -> 'n<=1024'."""
+	return f"n<={1 << max(0, (len(data) - 1).bit_length())}"
+
+def input_distribution(data, samples=16):
+	"""'sorted', 'reversed' or 'random' from up to `samples` evenly spaced elements."""
+	n = len(data)
+	if n < 2:
+		return "sorted"
+	step = max(1, n // samples)
+	probe = [data[i] for i in range(0, n, step)]
+	try:
+		if all(a <= b for a, b in zip(probe, probe[1:])):
+			return "sorted"
+		if all(a >= b for a, b in zip(probe, probe[1:])):
+			return "reversed"
+	except TypeError:
+		pass
+	return "random"
+
+def default_context(data, *args, **kwargs):
+	return f"{size_bucket(data)}|{input_distribution(data)}"
+
+class BanditSelector:
+	"""
+	arms: {name: implementation}; each call runs impl(data, *args, **kwargs).
+	context: context(data, *args, **kwargs) -> str (default: size bucket and
+	input distribution).
+	"""
+
+	def __init__(self, name, arms, policy=DEFAULT_POLICY, max_exploration=DEFAULT_MAX_EXPLORATION, state_path=None, save_every=DEFAULT_SAVE_EVERY, context=default_context, seed=None):
+		if policy not in POLICIES:
+			raise ValueError(f"Unknown bandit policy: {policy}")
+		self.name = name
+		self.arms = dict(arms)
+		self.policy = policy
+		self.max_exploration = max_exploration
+		self.state_path = state_path or os.path.join(BANDIT_STATE_DIR, f"{name}.json")
+		self.save_every = save_every
+		self.context = context
+		self.rng = random.Random(seed)
+		self._lock = threading.Lock()
+		self._unsaved = 0
+		self.state = self._load() or {'name': name, 'policy': policy, 'contexts': {}}
+
+	def _load(self):
+		if not os.path.exists(self.state_path):
+			return None
+		with open(self.state_path, 'r') as f:
+			return json.load(f)
+
+	def save(self):
+		with self._lock:
+			snapshot = json.dumps(self.state, indent=2)
+			self._unsaved = 0
+		os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+		tmp_path = f"{self.state_path}.{threading.get_ident()}.tmp"
+		with open(tmp_path, 'w') as f:
+			f.write(snapshot)
+		# Atomic replace, so a crash never leaves a half-written state file
+		os.replace(tmp_path, self.state_path)
+
+	def _context_state(self, key):
+		ctx = self.state['contexts'].setdefault(key, {'calls': 0, 'explorations': 0, 'arms': {}})
+		for arm in self.arms:
+			ctx['arms'].setdefault(arm, {'n': 0, 'mean': 0.0, 'm2': 0.0})
+		return ctx
+
+	def _score(self, stats, total):
+		"""Sampled (Thompson) or optimistic (UCB) log runtime; lower is better."""
+		variance = stats['m2'] / (stats['n'] - 1) if stats['n'] > 1 else PRIOR_VARIANCE
+		spread = math.sqrt(max(variance, 1e-12) / stats['n'])
+		if self.policy == "thompson":
+			return self.rng.gauss(stats['mean'], spread)
+		return stats['mean'] - spread * math.sqrt(2.0 * math.log(max(total, 2)))
+
+	def choose(self, key):
+		"""Arm name for a context key; counts the call and any exploration."""
+		with self._lock:
+			ctx = self._context_state(key)
+			arms = {a: s for a, s in ctx['arms'].items() if a in self.arms}
+			tried = {a: s for a, s in arms.items() if s['n'] > 0}
+			greedy = min(tried, key=lambda a: tried[a]['mean']) if tried else None
+			untried = [a for a, s in arms.items() if s['n'] == 0]
+			if untried:
+				choice = untried[0]
+			else:
+				choice = min(arms, key=lambda a: self._score(arms[a], ctx['calls']))
+			# Warm-up of one call per arm, then at most max_exploration of calls
+			allowance = self.max_exploration * (ctx['calls'] + 1) + len(arms)
+			if choice != greedy and greedy is not None and ctx['explorations'] + 1 > allowance:
+				choice = greedy
+			ctx['calls'] += 1
+			if choice != greedy:
+				ctx['explorations'] += 1
+			return choice
+
+	def record(self, key, arm, elapsed):
+		"""Adds one runtime observation (seconds) to an arm (Welford update of log runtime)."""
+		value = math.log(max(elapsed, 1e-9))
+		with self._lock:
+			stats = self._context_state(key)['arms'][arm]
+			stats['n'] += 1
+			delta = value - stats['mean']
+			stats['mean'] += delta / stats['n']
+			stats['m2'] += delta * (value - stats['mean'])
+			self._unsaved += 1
+			due = self._unsaved >= self.save_every
+		if due:
+			self.save()
+
+	def __call__(self, data, *args, **kwargs):
+		key = self.context(data, *args, **kwargs)
+		arm = self.choose(key)
+		start = time.perf_counter()
+		result = self.arms[arm](data, *args, **kwargs)
+		self.record(key, arm, time.perf_counter() - start)
+		return result
+
+	def summary(self):
+		with self._lock:
+			return summarize_state(self.state)
+
+def summarize_state(state):
+	"""Per-context view of a selector state: best arm, exploration share and per-arm stats."""
+	contexts = {}
+	for key, ctx in state['contexts'].items():
+		tried = {a: s for a, s in ctx['arms'].items() if s['n'] > 0}
+		contexts[key] = {
+			'calls': ctx['calls'],
+			'exploration_fraction': ctx['explorations'] / ctx['calls'] if ctx['calls'] else 0.0,
+			'best_arm': min(tried, key=lambda a: tried[a]['mean']) if tried else None,
+			'arms': {
+				a: {
+					'calls': s['n'],
+					# Geometric mean runtime
+					'typical_time_sec': math.exp(s['mean']) if s['n'] else None,
+					'log_time_std': math.sqrt(s['m2'] / (s['n'] - 1)) if s['n'] > 1 else None
+				}
+				for a, s in ctx['arms'].items()
+			}
+		}
+	return {'name': state['name'], 'policy': state['policy'], 'contexts': contexts}
+
+def load_states(state_dir=BANDIT_STATE_DIR):
+	"""Summaries of every persisted selector state in state_dir, keyed by name."""
+	if not os.path.isdir(state_dir):
+		return {}
+	summaries = {}
+	for filename in sorted(os.listdir(state_dir)):
+		if filename.endswith('.json'):
+			with open(os.path.join(state_dir, filename), 'r') as f:
+				state = json.load(f)
+			summaries[state['name']] = summarize_state(state)
+	return summaries
+
+# Selectors created by selector_for_category, keyed by category
+_selectors = {}
+
+def selector_for_category(category, **kwargs):
+	"""
+	Shared selector over the registered algorithms of an ALGORITHM_CATEGORIES
+	entry whose functions take (data, *args), e.g. 'sorting' or 'searching'.
+	"""
+	if category not in _selectors:
+		import importlib
+		from config import experiment_config
+		from experiments.run_experiments import ALGO_MODULES, ALGO_FUNCTIONS
+		arms = {}
+		for name in experiment_config.ALGORITHM_CATEGORIES[category]:
+			module = importlib.import_module(ALGO_MODULES[name])
+			arms[name] = getattr(module, ALGO_FUNCTIONS.get(name, name))
+		_selectors[category] = BanditSelector(category, arms, **kwargs)
+	return _selectors[category]
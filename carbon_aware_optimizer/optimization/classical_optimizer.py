@@ -1 +1,209 @@
-# Classical optimization algorithms (placeholder)
+"""
+Exact classical baselines for workload-wide assignment (see
+assignment_problem.py): one option per task, minimizing total carbon within
+the runtime budget. This is a multiple-choice knapsack problem.
+- dp_assign: dynamic programming over the runtime budget cut into
+  `resolution` units (exact for the discretized runtimes; rounding up keeps
+  it feasible but costs some carbon on real-valued runtimes, bounded by the
+  lower_bound it reports)
+- branch_and_bound_assign: exact on the real runtimes, bounded by the LP
+  relaxation, which is solved greedily on each task's convex hull
+- greedy_assign: the hull-efficiency heuristic (greedy_assignment) as a
+  baseline of its own
+All share the solver interface of quantum_inspired_optimizer.py.
+"""
+import time
+
+import numpy as np
+
+from .assignment_problem import make_result
+from .quantum_inspired_optimizer import ASSIGNMENT_SOLVERS
+
+# Default DP resolution: at least DEFAULT_RESOLUTION units and DEFAULT_UNITS_PER_TASK
+# per task, capped so the choice table (tasks x units) stays within MAX_DP_CELLS.
+# Instances too large for DEFAULT_UNITS_PER_TASK within the cap are refused.
+DEFAULT_RESOLUTION = 1000
+DEFAULT_UNITS_PER_TASK = 10
+MAX_DP_CELLS = 50_000_000
+
+def greedy_assign(problem, time_budget=None, seed=None):
+	"""greedy_assignment() under the solver interface; time_budget and seed are unused."""
+	start = time.perf_counter()
+	assignment = problem.greedy_assignment()
+	elapsed = time.perf_counter() - start
+	return make_result(problem, assignment, 'greedy', elapsed, [{'iteration': 0, 'elapsed_s': elapsed, 'best_fitness': float(problem.fitness(assignment))}])
+
+def dp_assign(problem, time_budget=None, seed=None, resolution=None):
+	"""
+	Multiple-choice knapsack DP over the spare budget left by
+	fastest_assignment(), cut into `resolution` units (default: see
+	DEFAULT_UNITS_PER_TASK). Each option's extra runtime is rounded up to
+	whole units, so every solution meets the real budget and is optimal on
+	that grid (grid_optimal=True), but may lose some carbon to rounding
+	(raise resolution to tighten). Rounding adds less than one unit per
+	task, so the best carbon within resolution + tasks units is a lower
+	bound on the real optimum; it is reported as lower_bound, and optimal
+	is True only when the solution reaches it.
+	O(tasks * options * (resolution + tasks)) time, which time_budget does
+	not limit (the result says so with ignores_time_budget); seed is unused.
+	Raises ValueError when the default resolution would leave fewer than
+	DEFAULT_UNITS_PER_TASK units per task (use branch_and_bound_assign).
+	"""
+	start = time.perf_counter()
+	if resolution is None:
+		cap = MAX_DP_CELLS // problem.n_tasks - problem.n_tasks
+		if cap < DEFAULT_UNITS_PER_TASK * problem.n_tasks:
+			raise ValueError(
+				f"{problem.n_tasks} tasks leave {max(cap, 0)} units within MAX_DP_CELLS, "
+				f"fewer than {DEFAULT_UNITS_PER_TASK} per task; use branch_and_bound_assign"
+			)
+		resolution = min(max(DEFAULT_RESOLUTION, DEFAULT_UNITS_PER_TASK * problem.n_tasks), cap)
+	base = problem.fastest_assignment()
+	base_runtime = problem.runtime[np.arange(problem.n_tasks), base]
+	spare = problem.runtime_budget - base_runtime.sum()
+	if spare < 0:
+		# Nothing fits the budget: return the fastest assignment (infeasible)
+		return make_result(problem, base, 'dp', time.perf_counter() - start, resolution=resolution, optimal=False, grid_optimal=False, lower_bound=None, ignores_time_budget=True)
+	unit = spare / resolution if spare > 0 else 1.0
+	extra = problem.runtime - base_runtime[:, None]
+	# Tiny tolerance so exact multiples of the unit are not bumped up by float error
+	weights = np.where(problem.valid, np.ceil(extra / unit - 1e-9), resolution + 1)
+	weights = np.where(extra <= 0, 0, weights).astype(np.int64)
+	# Units past resolution only serve the rounding lower bound
+	capacity = resolution + problem.n_tasks
+	# best[b]: lowest carbon of the tasks so far using exactly b units
+	best = np.full(capacity + 1, np.inf)
+	best[0] = 0.0
+	choice = np.zeros((problem.n_tasks, capacity + 1), dtype=np.int16)
+	for t in range(problem.n_tasks):
+		layer = np.full(capacity + 1, np.inf)
+		for k in np.flatnonzero(problem.valid[t]):
+			w = weights[t, k]
+			if w > capacity:
+				continue
+			candidate = np.full(capacity + 1, np.inf)
+			candidate[w:] = best[:capacity + 1 - w] + problem.carbon[t, k]
+			better = candidate < layer
+			layer[better] = candidate[better]
+			choice[t, better] = k
+		best = layer
+	b = int(np.argmin(best[:resolution + 1]))
+	lower_bound = float(best.min())
+	assignment = np.zeros(problem.n_tasks, dtype=np.int64)
+	for t in range(problem.n_tasks - 1, -1, -1):
+		assignment[t] = choice[t, b]
+		b -= weights[t, assignment[t]]
+	elapsed = time.perf_counter() - start
+	carbon = float(best[:resolution + 1].min())
+	optimal = carbon <= lower_bound + 1e-9 * max(1.0, abs(carbon))
+	return make_result(problem, assignment, 'dp', elapsed, [{'iteration': problem.n_tasks, 'elapsed_s': elapsed, 'best_fitness': carbon}], resolution=resolution, optimal=optimal, grid_optimal=True, lower_bound=lower_bound, ignores_time_budget=True)
+
+class _Relaxation:
+	"""LP relaxation over the free tasks, from hull upgrades sorted by efficiency."""
+
+	def __init__(self, problem):
+		self.problem = problem
+		self.base = problem.fastest_assignment()
+		self.base_carbon = problem.carbon[np.arange(problem.n_tasks), self.base]
+		self.base_runtime = problem.runtime[np.arange(problem.n_tasks), self.base]
+		inc = problem.hull_increments()
+		# Hull efficiencies fall within a task, so a stable sort keeps each task's upgrades in order
+		order = np.argsort(-inc['efficiency'], kind='stable')
+		self.task = inc['task'][order]
+		self.option = inc['option'][order]
+		self.d_runtime = inc['d_runtime'][order]
+		self.d_carbon = inc['d_carbon'][order]
+		self.efficiency = inc['efficiency'][order]
+
+	def solve(self, free, fixed_carbon, fixed_runtime):
+		"""
+		Returns (bound, fractional task or None, multiplier, LP assignment of
+		the free tasks) or None when even the fastest options do not fit.
+		"""
+		spare = self.problem.runtime_budget - fixed_runtime - self.base_runtime[free].sum()
+		if spare < -1e-9 * max(1.0, self.problem.runtime_budget):
+			return None
+		bound = fixed_carbon + self.base_carbon[free].sum()
+		mask = free[self.task]
+		d_runtime = np.where(mask, self.d_runtime, 0.0)
+		d_carbon = np.where(mask, self.d_carbon, 0.0)
+		cumulative = np.cumsum(d_runtime)
+		taken = int(np.searchsorted(cumulative, spare, side='right'))
+		bound += d_carbon[:taken].sum()
+		assignment = self.base.copy()
+		picked = np.flatnonzero(mask[:taken])
+		# Later upgrades of a task overwrite earlier ones
+		assignment[self.task[picked]] = self.option[picked]
+		fractional, multiplier = None, 0.0
+		if taken < len(cumulative):
+			used = cumulative[taken - 1] if taken else 0.0
+			fraction = (spare - used) / d_runtime[taken]
+			if fraction > 1e-12:
+				bound += fraction * d_carbon[taken]
+				fractional = int(self.task[taken])
+			multiplier = float(self.efficiency[taken])
+		return bound, fractional, multiplier, assignment
+
+def branch_and_bound_assign(problem, time_budget=10.0, seed=None, node_limit=None):
+	"""
+	Depth-first branch-and-bound. Each node's LP relaxation bounds it; an
+	integral LP solution is optimal for its subtree, otherwise the node
+	branches on the task the LP splits, trying options in order of LP reduced
+	cost. Starts from greedy_assignment(). If time_budget (seconds) or
+	node_limit runs out, the incumbent is returned with optimal=False and
+	lower_bound set to the best bound still open.
+	"""
+	start = time.perf_counter()
+	relaxation = _Relaxation(problem)
+	incumbent = problem.greedy_assignment()
+	incumbent_carbon = problem.fitness(incumbent)
+	history = [{'iteration': 0, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(incumbent_carbon)}]
+	tolerance = 1e-9 * max(1.0, abs(float(incumbent_carbon)))
+	# Stack of (bound of parent, free mask, fixed assignment, fixed carbon, fixed runtime)
+	stack = [(-np.inf, np.ones(problem.n_tasks, dtype=bool), np.zeros(problem.n_tasks, dtype=np.int64), 0.0, 0.0)]
+	nodes = 0
+	while stack:
+		if (node_limit is not None and nodes >= node_limit) or (time_budget is not None and time.perf_counter() - start >= time_budget):
+			break
+		parent_bound, free, fixed, fixed_carbon, fixed_runtime = stack.pop()
+		if parent_bound >= incumbent_carbon - tolerance:
+			continue
+		nodes += 1
+		lp = relaxation.solve(free, fixed_carbon, fixed_runtime)
+		if lp is None:
+			continue
+		bound, fractional, multiplier, lp_assignment = lp
+		if bound >= incumbent_carbon - tolerance:
+			continue
+		if problem.carbon_budget is not None and bound > problem.carbon_budget + tolerance:
+			continue
+		if fractional is None:
+			# Integral LP optimum: best in this subtree
+			candidate = np.where(free, lp_assignment, fixed)
+			candidate_fitness = problem.fitness(candidate)
+			if candidate_fitness < incumbent_carbon:
+				incumbent, incumbent_carbon = candidate, candidate_fitness
+				history.append({'iteration': nodes, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(incumbent_carbon)})
+			continue
+		t = fractional
+		options = np.flatnonzero(problem.valid[t])
+		reduced_cost = problem.carbon[t, options] + multiplier * problem.runtime[t, options]
+		child_free = free.copy()
+		child_free[t] = False
+		# Push the worst first so the most promising child is explored next
+		for k in options[np.argsort(-reduced_cost, kind='stable')]:
+			child_fixed = fixed.copy()
+			child_fixed[t] = k
+			stack.append((bound, child_free, child_fixed, fixed_carbon + problem.carbon[t, k], fixed_runtime + problem.runtime[t, k]))
+	optimal = not stack
+	lower_bound = float(incumbent_carbon) if optimal else float(min(incumbent_carbon, min(entry[0] for entry in stack)))
+	return make_result(problem, incumbent, 'branch_and_bound', time.perf_counter() - start, history, nodes=nodes, optimal=optimal, lower_bound=lower_bound)
+
+CLASSICAL_SOLVERS = {
+	'greedy': greedy_assign,
+	'dp': dp_assign,
+	'branch_and_bound': branch_and_bound_assign
+}
+
+# Every workload assignment solver under one interface
+ALL_SOLVERS = {**ASSIGNMENT_SOLVERS, **CLASSICAL_SOLVERS}
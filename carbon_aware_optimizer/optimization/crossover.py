@@ -0,0 +1,175 @@
+"""
+Size-aware algorithm choice.
+build_crossover_table() finds, per task type and objective weighting, the
+input-size intervals where each algorithm wins (select_best_algorithm's
+scoring). Between measured sizes, carbon and runtime are interpolated
+log-log on a geometric grid. The table is stored as sorted lower bounds:
+algorithms[i] wins for bounds[i] <= n < bounds[i + 1].
+
+green_dispatch(category, data, *args) calls the winning implementation for
+len(data) with one bisect, so production code can call it directly. Only
+categories whose dataset_size is len(data) of the input (DISPATCH_CATEGORIES)
+are tabulated; e.g. matmul sizes count elements (n^2) and recursion inputs
+are plain integers.
+"""
+import bisect
+import importlib
+import json
+import os
+
+import numpy as np
+
+from .weight_sweep import alpha_sweep
+
+CROSSOVER_TABLE_PATH = os.path.join(os.path.dirname(__file__), '../data/experiments/crossover_table.json')
+CLEANED_CSV = os.path.join(os.path.dirname(__file__), '../data/experiments/cleaned_results.csv')
+
+# Carbon weight (alpha; runtime weight is 1 - alpha) of each named weighting
+WEIGHTINGS = {
+	'carbon_first': 0.8,
+	'balanced': 0.5,
+	'speed_first': 0.2
+}
+
+# Geometric grid points per decade of input size for locating crossovers
+GRID_POINTS_PER_DECADE = 32
+
+# Categories benchmarked at dataset_size == len(input)
+DISPATCH_CATEGORIES = ('sorting', 'searching', 'string_search', 'caching')
+
+def _size_grid(sizes):
+	lo, hi = min(sizes), max(sizes)
+	if lo == hi:
+		return np.array([lo])
+	count = max(2, int(np.ceil(np.log10(hi / lo) * GRID_POINTS_PER_DECADE)) + 1)
+	grid = np.unique(np.round(np.geomspace(lo, hi, count)).astype(np.int64))
+	return np.union1d(grid, sizes)
+
+def _interpolate(records, grid):
+	"""Log-log interpolated carbon/runtime records on grid, within each algorithm's measured range."""
+	by_algorithm = {}
+	for r in records:
+		by_algorithm.setdefault(r['algorithm'], []).append(r)
+	rows = []
+	for algorithm, points in by_algorithm.items():
+		points = sorted(points, key=lambda r: r['dataset_size'])
+		sizes = np.log([float(p['dataset_size']) for p in points])
+		inside = grid[(grid >= points[0]['dataset_size']) & (grid <= points[-1]['dataset_size'])]
+		curves = {}
+		for metric in ('carbon_gco2', 'avg_time_sec'):
+			# Floor at a tiny positive value so zero readings survive the log
+			values = np.log(np.maximum([float(p[metric]) for p in points], 1e-30))
+			curves[metric] = np.exp(np.interp(np.log(inside.astype(float)), sizes, values))
+		for i, n in enumerate(inside):
+			rows.append({'algorithm': algorithm, 'dataset_size': int(n), 'carbon_gco2': curves['carbon_gco2'][i], 'avg_time_sec': curves['avg_time_sec'][i]})
+	return rows
+
+def size_breakpoints(records, weightings=WEIGHTINGS):
+	"""
+	records: one task type's results (dicts with 'algorithm', 'dataset_size',
+	'carbon_gco2', 'avg_time_sec'). Returns {weighting: {'bounds': [...],
+	'algorithms': [...]}}; the first bound is 0 so every size has a winner.
+	"""
+	grid = _size_grid(sorted({int(r['dataset_size']) for r in records}))
+	names = list(weightings)
+	sweep = alpha_sweep(_interpolate(records, grid), alphas=[weightings[name] for name in names])
+	sizes = sweep['groups']
+	table = {}
+	for w, name in enumerate(names):
+		bounds, algorithms = [], []
+		for n, winner in zip(sizes, sweep['winners'][w]):
+			if not algorithms or winner != algorithms[-1]:
+				bounds.append(0 if not bounds else int(n))
+				algorithms.append(winner)
+		table[name] = {'bounds': bounds, 'algorithms': algorithms}
+	return table
+
+def build_crossover_table(csv_path=CLEANED_CSV, path=CROSSOVER_TABLE_PATH, weightings=WEIGHTINGS, registry=None):
+	"""
+	Computes the crossover table for every DISPATCH_CATEGORIES task type in
+	cleaned results and saves it to path. registry maps algorithms to how
+	they are called ({'module', 'function', 'input', 'extra_args'}, see
+	experiments.run_experiments.dispatch_registry); winners missing from it
+	are not dispatchable.
+	"""
+	import pandas as pd
+
+	df = pd.read_csv(csv_path)
+	categories = {}
+	for task_type, group in df.groupby('task_type'):
+		if task_type.split('[', 1)[0] not in DISPATCH_CATEGORIES:
+			continue
+		records = group[['algorithm', 'dataset_size', 'carbon_gco2', 'avg_time_sec']].to_dict('records')
+		categories[task_type] = size_breakpoints(records, weightings)
+	# Where each winner lives and how to call it, so dispatch does not need the experiment runner
+	registry = registry or {}
+	winners = {a for entry in categories.values() for w in entry.values() for a in w['algorithms']}
+	table = {
+		'weightings': dict(weightings),
+		'categories': categories,
+		'functions': {a: registry[a] for a in sorted(winners) if a in registry}
+	}
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, 'w') as f:
+		json.dump(table, f, indent=2)
+	_dispatch_cache.clear()
+	return table
+
+def describe_intervals(entry):
+	"""Human-readable intervals of one size_breakpoints entry."""
+	bounds, algorithms = entry['bounds'], entry['algorithms']
+	parts = []
+	for i, algorithm in enumerate(algorithms):
+		if i + 1 < len(bounds):
+			parts.append(f"{algorithm} for {bounds[i]} <= n < {bounds[i + 1]}")
+		else:
+			parts.append(f"{algorithm} for n >= {bounds[i]}")
+	return ', '.join(parts)
+
+# (path, weighting) -> {category: (bounds, implementations)}
+_dispatch_cache = {}
+
+def _load_dispatch(path, weighting):
+	with open(path, 'r') as f:
+		table = json.load(f)
+	functions = {}
+	for name, spec in table['functions'].items():
+		impl = getattr(importlib.import_module(spec['module']), spec['function'])
+		functions[name] = (impl, spec['input'], tuple(spec['extra_args']))
+	dispatch = {}
+	for category, entry in table['categories'].items():
+		chosen = entry.get(weighting)
+		# Skip task types with a winner the registry did not describe
+		if chosen and all(a in functions for a in chosen['algorithms']):
+			dispatch[category] = (chosen['bounds'], [functions[a] for a in chosen['algorithms']])
+	return dispatch
+
+def _as_input(value, input_type):
+	"""Converts text arguments to the type an implementation expects ('bytes' or 'str')."""
+	if input_type == 'bytes' and isinstance(value, str):
+		return value.encode('utf-8')
+	if input_type == 'str' and isinstance(value, (bytes, bytearray, memoryview)):
+		return bytes(value).decode('utf-8')
+	return value
+
+def green_dispatch(category, data, *args, weighting='balanced', path=CROSSOVER_TABLE_PATH, **kwargs):
+	"""
+	Calls the greenest implementation for len(data) in category (a task type
+	of DISPATCH_CATEGORIES, e.g. 'sorting') as impl(data, *args,
+	*extra_args, **kwargs) and returns its result. Text arguments are
+	converted to the str or bytes the winner expects, and extra_args (e.g. a
+	cache capacity) come from the table. The table is loaded once per
+	(path, weighting); reload with build_crossover_table() or
+	_dispatch_cache.clear().
+	"""
+	key = (path, weighting)
+	dispatch = _dispatch_cache.get(key)
+	if dispatch is None:
+		dispatch = _dispatch_cache[key] = _load_dispatch(path, weighting)
+	try:
+		bounds, implementations = dispatch[category]
+	except KeyError:
+		raise KeyError(f"No dispatchable crossover entry for '{category}' (weighting '{weighting}')") from None
+	impl, input_type, extra_args = implementations[bisect.bisect_right(bounds, len(data)) - 1]
+	args = tuple(_as_input(a, input_type) for a in (data,) + args)
+	return impl(*args, *extra_args, **kwargs)
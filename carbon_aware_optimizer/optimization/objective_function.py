@@ -2,6 +2,9 @@
 """
 Objective and cost functions for quantum-inspired optimization.
 """
+import warnings
+
+import numpy as np
 
 def min_max_normalize(values):
 	"""
@@ -21,3 +24,19 @@ def energy_function(normalized_carbon, normalized_runtime, alpha=0.5, beta=0.5):
 	alpha, beta: weights for carbon and runtime (must sum to 1 for interpretability).
 	"""
 	return alpha * normalized_carbon + beta * normalized_runtime
+
+def min_max_normalize_array(values, axis=-1):
+	"""
+	Vectorized min_max_normalize along axis of a NumPy array. NaN entries
+	(padding for missing candidates) are ignored and stay NaN; constant
+	slices map to 0 like min_max_normalize.
+	"""
+	values = np.asarray(values, dtype=float)
+	with warnings.catch_warnings():
+		# All-NaN slices (empty groups) are expected
+		warnings.simplefilter("ignore", RuntimeWarning)
+		lo = np.nanmin(values, axis=axis, keepdims=True)
+		span = np.nanmax(values, axis=axis, keepdims=True) - lo
+	safe_span = np.where(span > 0, span, 1.0)
+	normalized = np.where(span > 0, (values - lo) / safe_span, 0.0)
+	return np.where(np.isnan(values), np.nan, normalized)
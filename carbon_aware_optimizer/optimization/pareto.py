@@ -0,0 +1,77 @@
+"""
+Pareto-front (skyline) computation for multi-objective algorithm selection.
+All objectives are minimized. Two and three objectives use O(n log n)
+sweep algorithms; more objectives fall back to pairwise comparison.
+"""
+import bisect
+
+import numpy as np
+
+def _front_1d(points):
+	return np.flatnonzero(points[:, 0] == points[:, 0].min())
+
+def _front_2d(points):
+	# Sweep by x (then y); a point survives if its y beats every earlier one
+	order = np.lexsort((points[:, 1], points[:, 0]))
+	keep, best_y = [], np.inf
+	for i in order:
+		if points[i, 1] < best_y:
+			keep.append(i)
+			best_y = points[i, 1]
+	return np.array(keep, dtype=np.int64)
+
+def _front_3d(points):
+	# Sweep by x; the (y, z) staircase of kept points is sorted by y with z
+	# strictly decreasing, so the entry with the largest y <= y_i has the
+	# smallest z among all candidates that could dominate point i
+	order = np.lexsort((points[:, 2], points[:, 1], points[:, 0]))
+	stair_y, stair_z, keep = [], [], []
+	for i in order:
+		y, z = points[i, 1], points[i, 2]
+		j = bisect.bisect_right(stair_y, y)
+		if j > 0 and stair_z[j - 1] <= z:
+			continue
+		keep.append(i)
+		# Drop staircase entries the new point dominates in (y, z)
+		k = j
+		while k < len(stair_y) and stair_z[k] >= z:
+			k += 1
+		stair_y[j:k] = [y]
+		stair_z[j:k] = [z]
+	return np.array(keep, dtype=np.int64)
+
+def _front_nd(points):
+	n = len(points)
+	dominated = np.zeros(n, dtype=bool)
+	for i in range(n):
+		if dominated[i]:
+			continue
+		le = np.all(points <= points[i], axis=1)
+		lt = np.any(points < points[i], axis=1)
+		if np.any(le & lt):
+			dominated[i] = True
+	return np.flatnonzero(~dominated)
+
+def pareto_front(points):
+	"""
+	Indices (ascending) of the non-dominated rows of an n x m array, minimizing
+	every column. Identical points are all kept.
+	"""
+	points = np.asarray(points, dtype=float)
+	if points.ndim != 2:
+		raise ValueError("points must be a 2-D array (n candidates x m objectives)")
+	if len(points) == 0:
+		return np.array([], dtype=np.int64)
+	# Sweeps would treat duplicates as dominating each other; solve on distinct rows
+	distinct, inverse = np.unique(points, axis=0, return_inverse=True)
+	inverse = inverse.reshape(-1)
+	m = distinct.shape[1]
+	if m == 1:
+		front = _front_1d(distinct)
+	elif m == 2:
+		front = _front_2d(distinct)
+	elif m == 3:
+		front = _front_3d(distinct)
+	else:
+		front = _front_nd(distinct)
+	return np.flatnonzero(np.isin(inverse, front))
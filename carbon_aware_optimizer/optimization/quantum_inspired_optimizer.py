@@ -2,8 +2,22 @@
 """
 Quantum-inspired optimizer for algorithm selection.
 Evaluates all candidates, computes energy, and selects the best.
+For workload-wide assignment (one option per task under runtime and
+carbon budgets, see assignment_problem.py) it provides a quantum-inspired
+evolutionary algorithm (qiea_assign) and simulated annealing (anneal_assign).
 """
+import time
+
+import numpy as np
+
 from .objective_function import min_max_normalize, energy_function
+from .pareto import pareto_front
+from .assignment_problem import make_result
+
+# Objectives considered by select_pareto when present in every candidate
+PARETO_OBJECTIVES = ['carbon_gco2', 'avg_time_sec', 'p99_time_sec', 'peak_memory_mb']
+# qiea_assign re-observations of out-of-range option codes per generation
+MAX_REDRAWS = 8
 
 def select_best_algorithm(algorithms_metrics, alpha=0.5, beta=0.5):
 	"""
@@ -27,6 +41,181 @@ def select_best_algorithm(algorithms_metrics, alpha=0.5, beta=0.5):
 	)
 	return best_algo, energies[min_idx], explanation
 
+def select_pareto(algorithms_metrics, objectives=None, weights=None):
+	"""
+	Multi-objective selection over any number of minimized metrics.
+	objectives: metric keys (default: the PARETO_OBJECTIVES every candidate has)
+	weights: {objective: weight} for the scalarized pick (default: equal)
+	Returns a dict with:
+		'objectives', 'front' (non-dominated candidates, each with a
+		'score' = weighted sum of min-max normalized objectives), 'best',
+		'score' and 'explanation'.
+	The front does not depend on weights, so it can be computed once and
+	re-scalarized with scalarize_front() for any weighting.
+	"""
+	if objectives is None:
+		objectives = [o for o in PARETO_OBJECTIVES if all(o in a for a in algorithms_metrics)]
+	points = np.array([[float(a[o]) for o in objectives] for a in algorithms_metrics])
+	# Normalize over all candidates so scores are comparable across weightings
+	normalized = np.column_stack([min_max_normalize(list(points[:, j])) for j in range(len(objectives))]) if len(points) else points
+	front = []
+	for i in pareto_front(points):
+		candidate = dict(algorithms_metrics[i])
+		candidate['normalized'] = dict(zip(objectives, normalized[i].tolist()))
+		front.append(candidate)
+	result = {'objectives': list(objectives), 'front': front}
+	result.update(scalarize_front(front, objectives, weights))
+	return result
+
+def scalarize_front(front, objectives, weights=None):
+	"""
+	Picks the front member with the lowest weighted normalized score.
+	Returns {'best', 'score', 'explanation'} and sets each member's 'score'.
+	"""
+	weights = weights or {o: 1.0 / len(objectives) for o in objectives}
+	for candidate in front:
+		candidate['score'] = sum(weights.get(o, 0.0) * candidate['normalized'][o] for o in objectives)
+	if not front:
+		return {'best': None, 'score': None, 'explanation': "No candidates."}
+	best = min(front, key=lambda c: c['score'])
+	weight_text = ', '.join(f"{o}={weights.get(o, 0.0):g}" for o in objectives)
+	explanation = (
+		f"Selected '{best['algorithm']}' from {len(front)} Pareto-optimal candidates "
+		f"as the lowest weighted normalized score ({weight_text})."
+	)
+	return {'best': best['algorithm'], 'score': best['score'], 'explanation': explanation}
+
+def _out_of_budget(start, time_budget, iteration, max_iterations):
+	if max_iterations is not None and iteration >= max_iterations:
+		return True
+	return time.perf_counter() - start >= time_budget
+
+def qiea_assign(problem, time_budget=1.0, seed=None, population=32, max_generations=None, rotation=0.01 * np.pi, epsilon=0.01 * np.pi, migration_every=25, initial=None):
+	"""
+	Quantum-inspired evolutionary algorithm (Han & Kim QEA).
+	Each individual is a Q-bit vector: every task's option index is encoded
+	in ceil(log2 K) Q-bits with angle theta and P(bit = 1) = sin^2(theta).
+	Each generation observes the whole population at once, evaluates it
+	vectorized, and rotates every Q-bit towards the individual's best
+	solution where the observation was worse. Angles stay within
+	[epsilon, pi/2 - epsilon] so no bit collapses completely, and every
+	migration_every generations each individual's best is replaced by the
+	global best. Out-of-range codes (>= K) are re-observed rather than
+	folded with % K, which would favour the low options. initial optionally
+	seeds the attractors (default: none, the search starts from random
+	observations). history starts with the fitness at iteration 0.
+	"""
+	rng = np.random.default_rng(seed)
+	start = time.perf_counter()
+	n_bits = max(1, int(np.ceil(np.log2(problem.n_options))))
+	shifts = np.arange(n_bits)[::-1]
+
+	def to_bits(assignments):
+		return (assignments[..., None] >> shifts) & 1
+
+	theta = np.full((population, problem.n_tasks, n_bits), np.pi / 4)
+	best = np.zeros((population, problem.n_tasks), dtype=np.int64)
+	best_fitness = np.full(population, np.inf)
+	history, generation = [], 0
+	if initial is not None:
+		best[:] = problem.repair(initial)
+		best_fitness[:] = problem.fitness(best[0])
+		history.append({'iteration': 0, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(best_fitness[0])})
+	# Unseeded, the first generation's best becomes the iteration-0 entry
+	global_best, global_fitness = best[0].copy(), best_fitness[0]
+	while not _out_of_budget(start, time_budget, generation, max_generations):
+		observed = rng.random(theta.shape) < np.sin(theta) ** 2
+		decoded = (observed << shifts).sum(axis=-1)
+		# Rejection sampling: redraw the Q-bits of codes past the last option
+		for _ in range(MAX_REDRAWS):
+			rejected = decoded >= problem.n_options
+			if not rejected.any():
+				break
+			redrawn = rng.random(theta.shape) < np.sin(theta) ** 2
+			observed = np.where(rejected[..., None], redrawn, observed)
+			decoded = (observed << shifts).sum(axis=-1)
+		# Codes still out of range after MAX_REDRAWS are rescaled onto [0, K)
+		decoded = np.where(decoded >= problem.n_options, decoded * problem.n_options >> n_bits, decoded)
+		assignments = problem.repair(decoded)
+		fitness = problem.fitness(assignments)
+		improved = fitness < best_fitness
+		best[improved] = assignments[improved]
+		best_fitness[improved] = fitness[improved]
+		leader = int(np.argmin(best_fitness))
+		if best_fitness[leader] < global_fitness:
+			global_best, global_fitness = best[leader].copy(), best_fitness[leader]
+			history.append({'iteration': generation, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(global_fitness)})
+		# Rotation gate: move each Q-bit towards the attractor's bit where they differ
+		worse = (fitness > best_fitness)[:, None, None]
+		direction = to_bits(best) - to_bits(assignments)
+		theta = np.clip(theta + rotation * direction * worse, epsilon, np.pi / 2 - epsilon)
+		generation += 1
+		if migration_every and generation % migration_every == 0:
+			best[:] = global_best
+			best_fitness[:] = global_fitness
+	return make_result(problem, global_best, 'qiea', time.perf_counter() - start, history, iterations=generation)
+
+def anneal_assign(problem, time_budget=1.0, seed=None, chains=32, max_steps=None, t_start=None, t_end=None, check_every=50, initial=None):
+	"""
+	Simulated annealing over independent chains updated in lockstep.
+	Each step every chain proposes switching one random task to a random
+	available option; totals are updated incrementally, so a step is O(chains).
+	Temperature falls geometrically from t_start (default: the mean carbon
+	spread of a task) to t_end (default: t_start / 1000) over the time budget
+	or max_steps. Chains start from initial (default: fastest_assignment()),
+	whose fitness is the first history entry.
+	"""
+	rng = np.random.default_rng(seed)
+	start = time.perf_counter()
+	if initial is None:
+		initial = problem.fastest_assignment()
+	current = np.tile(problem.repair(initial), (chains, 1))
+	carbon, runtime = problem.evaluate(current)
+	fitness = problem.fitness_from_totals(carbon, runtime)
+	if t_start is None:
+		spread = np.where(problem.valid, problem.carbon, np.nan)
+		t_start = max(float(np.nanmean(np.nanmax(spread, axis=1) - np.nanmin(spread, axis=1))), 1e-9)
+	t_end = t_start / 1000.0 if t_end is None else t_end
+	leader = int(np.argmin(fitness))
+	global_best, global_fitness = current[leader].copy(), fitness[leader]
+	history = [{'iteration': 0, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(global_fitness)}]
+	step, progress = 0, 0.0
+	chain_rows = np.arange(chains)
+	while True:
+		if step % check_every == 0:
+			if _out_of_budget(start, time_budget, step, max_steps):
+				break
+			elapsed_fraction = (time.perf_counter() - start) / time_budget if time_budget else 1.0
+			progress = max(elapsed_fraction, step / max_steps if max_steps else 0.0)
+		elif max_steps is not None and step >= max_steps:
+			break
+		temperature = t_start * (t_end / t_start) ** min(progress, 1.0)
+		task = rng.integers(problem.n_tasks, size=chains)
+		option = rng.integers(problem.n_options, size=chains)
+		option = np.where(problem.valid[task, option], option, current[chain_rows, task])
+		old = current[chain_rows, task]
+		new_carbon = carbon + problem.carbon[task, option] - problem.carbon[task, old]
+		new_runtime = runtime + problem.runtime[task, option] - problem.runtime[task, old]
+		new_fitness = problem.fitness_from_totals(new_carbon, new_runtime)
+		delta = new_fitness - fitness
+		accept = (delta <= 0) | (rng.random(chains) < np.exp(-np.maximum(delta, 0.0) / temperature))
+		current[chain_rows[accept], task[accept]] = option[accept]
+		carbon = np.where(accept, new_carbon, carbon)
+		runtime = np.where(accept, new_runtime, runtime)
+		fitness = np.where(accept, new_fitness, fitness)
+		leader = int(np.argmin(fitness))
+		if fitness[leader] < global_fitness:
+			global_best, global_fitness = current[leader].copy(), fitness[leader]
+			history.append({'iteration': step, 'elapsed_s': time.perf_counter() - start, 'best_fitness': float(global_fitness)})
+		step += 1
+	return make_result(problem, global_best, 'anneal', time.perf_counter() - start, history, iterations=step)
+
+# Workload assignment solvers; classical_optimizer.py adds the exact ones
+ASSIGNMENT_SOLVERS = {
+	'qiea': qiea_assign,
+	'anneal': anneal_assign
+}
+
 if __name__ == "__main__":
 	# Example usage
 	algos = [
@@ -36,3 +225,12 @@ if __name__ == "__main__":
 	]
 	best, score, expl = select_best_algorithm(algos, alpha=0.7, beta=0.3)
 	print(f"Best: {best}, Energy: {score:.3f}\n{expl}")
+
+	# Workload assignment on an instance with a known optimum
+	from .assignment_problem import planted_problem, optimality_gap
+	problem, _, optimum = planted_problem(500, n_options=8, seed=0)
+	for name, solver in ASSIGNMENT_SOLVERS.items():
+		result = solver(problem, time_budget=2.0, seed=0)
+		print(f"{name}: gap {optimality_gap(result, optimum):.2%} after {result['iterations']} iterations ({result['elapsed_s']:.2f}s)")
+		for point in result['history'][::max(1, len(result['history']) // 5)]:
+			print(f"  {point['elapsed_s']:.3f}s  iteration {point['iteration']}: {point['best_fitness']:.2f}")
@@ -0,0 +1,135 @@
+"""
+Variance-aware algorithm selection from per-run samples.
+Bootstraps every candidate's runs at once: a B x N x R index tensor
+resamples each candidate's (runtime, carbon) pairs, giving B replicate
+means per candidate. Each replicate is scored like select_best_algorithm
+(min-max normalized, alpha * carbon + beta * runtime), which yields
+percentile confidence intervals and the probability that each candidate
+is truly best. When no candidate wins at least `confidence` of the
+replicates, the result is marked ambiguous instead of picking one.
+Per-run carbon scaled from runtime (no per-run energy reading) is flagged
+carbon_derived: its interval then only reflects runtime noise. Candidates
+with fewer than `min_runs` runs are flagged unresolvable (a single run
+resamples to the same mean every time, so its interval is a point) and
+make the result ambiguous.
+"""
+import numpy as np
+
+from .objective_function import min_max_normalize_array
+
+DEFAULT_BOOTSTRAP_SAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.95
+# Candidates that win at least this share of replicates are reported as tied
+DEFAULT_TIE_SHARE = 0.05
+# Fewer runs than this cannot give a meaningful bootstrap interval
+DEFAULT_MIN_RUNS = 5
+
+def _padded(samples, names, metric):
+	width = max(len(samples[n][metric]) for n in names)
+	values = np.full((len(names), width), np.nan)
+	for i, n in enumerate(names):
+		values[i, :len(samples[n][metric])] = samples[n][metric]
+	return values
+
+def _interval(values, level):
+	tail = (1.0 - level) / 2.0 * 100.0
+	return np.percentile(values, [tail, 100.0 - tail], axis=0)
+
+def bootstrap_select(samples, alpha=0.5, beta=0.5, n_boot=DEFAULT_BOOTSTRAP_SAMPLES, confidence=DEFAULT_CONFIDENCE, tie_share=DEFAULT_TIE_SHARE, min_runs=DEFAULT_MIN_RUNS, seed=None):
+	"""
+	samples: {algorithm: {'avg_time_sec': [...], 'carbon_gco2': [...]}} with
+		one entry per run (the two lists are paired by run), and optionally
+		'carbon_derived' (True when carbon was scaled from runtime)
+	Returns a dict with:
+		'candidates': per algorithm mean and CI of runtime, carbon and score,
+			'carbon_derived', 'unresolvable' (fewer than min_runs runs) and
+			'prob_best', sorted by prob_best
+		'best': the winner, or None when ambiguous
+		'ambiguous' (also when any candidate is unresolvable), 'tied'
+			(candidates with prob_best >= tie_share when ambiguous),
+			'unresolvable', 'leader' (highest prob_best) and 'explanation'
+	"""
+	names = list(samples)
+	if not names:
+		return {'candidates': [], 'best': None, 'leader': None, 'ambiguous': False, 'tied': [], 'unresolvable': [], 'explanation': "No candidates."}
+	rng = np.random.default_rng(seed)
+	runtime = _padded(samples, names, 'avg_time_sec')
+	carbon = _padded(samples, names, 'carbon_gco2')
+	counts = np.array([len(samples[n]['avg_time_sec']) for n in names])
+	width = runtime.shape[1]
+	# Resample R runs per candidate; indices past a candidate's count are masked out
+	index = (rng.random((n_boot, len(names), width)) * counts[None, :, None]).astype(np.int64)
+	mask = np.arange(width)[None, None, :] < counts[None, :, None]
+	rows = np.arange(len(names))[None, :, None]
+	runtime_means = np.where(mask, runtime[rows, index], 0.0).sum(axis=2) / counts
+	carbon_means = np.where(mask, carbon[rows, index], 0.0).sum(axis=2) / counts
+	scores = alpha * min_max_normalize_array(carbon_means, axis=1) + beta * min_max_normalize_array(runtime_means, axis=1)
+	# Equal scores within a replicate split its win between the tied candidates
+	winners = np.isclose(scores, scores.min(axis=1, keepdims=True), rtol=0.0, atol=1e-12)
+	prob_best = (winners / winners.sum(axis=1, keepdims=True)).mean(axis=0)
+
+	runtime_ci = _interval(runtime_means, confidence)
+	carbon_ci = _interval(carbon_means, confidence)
+	score_ci = _interval(scores, confidence)
+	candidates = []
+	for i, name in enumerate(names):
+		candidates.append({
+			'algorithm': name,
+			'runs': int(counts[i]),
+			'avg_time_sec': float(np.nanmean(runtime[i])),
+			'avg_time_ci': (float(runtime_ci[0, i]), float(runtime_ci[1, i])),
+			'carbon_gco2': float(np.nanmean(carbon[i])),
+			'carbon_ci': (float(carbon_ci[0, i]), float(carbon_ci[1, i])),
+			'carbon_derived': bool(samples[name].get('carbon_derived', False)),
+			'unresolvable': bool(counts[i] < min_runs),
+			'score_ci': (float(score_ci[0, i]), float(score_ci[1, i])),
+			'prob_best': float(prob_best[i])
+		})
+	candidates.sort(key=lambda c: -c['prob_best'])
+	leader = candidates[0]
+	unresolvable = [c['algorithm'] for c in candidates if c['unresolvable']]
+	ambiguous = leader['prob_best'] < confidence or bool(unresolvable)
+	tied = [c['algorithm'] for c in candidates if c['prob_best'] >= tie_share] if ambiguous else []
+	if unresolvable:
+		explanation = (
+			f"Ambiguous: fewer than {min_runs} runs for {', '.join(unresolvable)}, so the bootstrap "
+			f"cannot estimate their variance; rerun with more runs before choosing."
+		)
+	elif ambiguous:
+		shares = ', '.join(f"{c['algorithm']} {c['prob_best']:.2f}" for c in candidates if c['algorithm'] in tied)
+		explanation = (
+			f"Ambiguous: no candidate is best in {confidence:.0%} of {n_boot} bootstrap resamples "
+			f"(alpha={alpha}, beta={beta}); P(best): {shares}."
+		)
+	else:
+		explanation = (
+			f"Selected '{leader['algorithm']}': lowest combined energy score in "
+			f"{leader['prob_best']:.0%} of {n_boot} bootstrap resamples (alpha={alpha}, beta={beta})."
+		)
+	derived = [c['algorithm'] for c in candidates if c['carbon_derived']]
+	if derived:
+		explanation += f" Carbon per run is scaled from runtime for {', '.join(derived)}, so its interval reflects runtime noise only."
+	return {
+		'candidates': candidates,
+		'best': None if ambiguous else leader['algorithm'],
+		'leader': leader['algorithm'],
+		'ambiguous': ambiguous,
+		'tied': tied,
+		'unresolvable': unresolvable,
+		'explanation': explanation
+	}
+
+def samples_from_frame(df):
+	"""
+	Groups run_samples.csv rows (see dataset_builder.build_run_samples) into
+	{(task_type, dataset_size): samples for bootstrap_select}. Files
+	without a carbon_measured column count as derived carbon.
+	"""
+	groups = {}
+	for (task_type, size, algorithm), runs in df.groupby(['task_type', 'dataset_size', 'algorithm']):
+		groups.setdefault((task_type, int(size)), {})[algorithm] = {
+			'avg_time_sec': runs['time_sec'].to_numpy(dtype=float),
+			'carbon_gco2': runs['carbon_gco2'].to_numpy(dtype=float),
+			'carbon_derived': not runs['carbon_measured'].astype(bool).all() if 'carbon_measured' in runs else True
+		}
+	return groups
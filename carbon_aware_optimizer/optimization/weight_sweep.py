@@ -0,0 +1,100 @@
+"""
+Vectorized weight sweep and sensitivity analysis for select_best_algorithm.
+Evaluates energy_function for every alpha (beta = 1 - alpha), candidate and
+group (dataset size by default) in one NumPy broadcast, and finds the exact
+alpha breakpoints where the winner switches, so any weighting can be
+answered from a precomputed table.
+"""
+import bisect
+
+import numpy as np
+
+from .objective_function import min_max_normalize_array
+
+def _grouped_arrays(algorithms_metrics, group_key):
+	"""Pads candidates into G x N carbon/runtime arrays (NaN = no candidate)."""
+	groups = sorted({a[group_key] for a in algorithms_metrics})
+	position = {g: i for i, g in enumerate(groups)}
+	members = [[] for _ in groups]
+	for a in algorithms_metrics:
+		members[position[a[group_key]]].append(a)
+	width = max(len(m) for m in members)
+	carbon = np.full((len(groups), width), np.nan)
+	runtime = np.full((len(groups), width), np.nan)
+	labels = np.full((len(groups), width), None, dtype=object)
+	for g, rows in enumerate(members):
+		for j, a in enumerate(rows):
+			carbon[g, j] = float(a['carbon_gco2'])
+			runtime[g, j] = float(a['avg_time_sec'])
+			labels[g, j] = a['algorithm']
+	return groups, labels, carbon, runtime
+
+def alpha_sweep(algorithms_metrics, alphas=None, group_key='dataset_size'):
+	"""
+	algorithms_metrics: list of dicts with 'algorithm', 'carbon_gco2',
+		'avg_time_sec' and group_key (candidates are normalized per group)
+	alphas: carbon weights to evaluate (default: 0.00, 0.01, ..., 1.00)
+	Returns a dict with 'groups', 'alphas', 'labels' (G x N),
+	'energies' (alphas x G x N, NaN for padding) and 'winners' (alphas x G).
+	Winners match select_best_algorithm(group, alpha, 1 - alpha).
+	"""
+	alphas = np.linspace(0.0, 1.0, 101) if alphas is None else np.asarray(alphas, dtype=float)
+	groups, labels, carbon, runtime = _grouped_arrays(algorithms_metrics, group_key)
+	norm_carbon = min_max_normalize_array(carbon, axis=1)
+	norm_runtime = min_max_normalize_array(runtime, axis=1)
+	a = alphas[:, None, None]
+	energies = a * norm_carbon[None] + (1.0 - a) * norm_runtime[None]
+	best = np.where(np.isnan(energies), np.inf, energies).argmin(axis=2)
+	winners = labels[np.arange(len(groups))[None, :], best]
+	return {'groups': groups, 'alphas': alphas, 'labels': labels, 'energies': energies, 'winners': winners}
+
+def _lower_envelope(intercepts, slopes, labels):
+	"""Segments of [0, 1] on which each line b + m * alpha is lowest (first index wins ties)."""
+	n = len(intercepts)
+	idx = np.arange(n)
+	# Lowest at alpha = 0; among ties, the one that stays lowest (smallest slope)
+	tied = idx[np.isclose(intercepts, intercepts.min(), rtol=0.0, atol=1e-12)]
+	current = tied[np.lexsort((tied, slopes[tied]))[0]]
+	alpha, segments = 0.0, []
+	while True:
+		steeper = idx[slopes < slopes[current] - 1e-15]
+		crossings = (intercepts[steeper] - intercepts[current]) / (slopes[current] - slopes[steeper])
+		ahead = crossings > alpha + 1e-12
+		steeper, crossings = steeper[ahead], crossings[ahead]
+		if steeper.size == 0 or crossings.min() >= 1.0:
+			segments.append({'alpha_from': alpha, 'alpha_to': 1.0, 'algorithm': labels[current], 'index': int(current)})
+			return segments
+		first = np.isclose(crossings, crossings.min(), rtol=0.0, atol=1e-12)
+		candidates = steeper[first]
+		nxt = candidates[np.lexsort((candidates, slopes[candidates]))[0]]
+		alpha_next = float(crossings.min())
+		segments.append({'alpha_from': alpha, 'alpha_to': alpha_next, 'algorithm': labels[current], 'index': int(current)})
+		alpha, current = alpha_next, nxt
+
+def winner_breakpoints(algorithms_metrics, group_key='dataset_size'):
+	"""
+	Exact winner-switching table: {group: [{'alpha_from', 'alpha_to',
+	'algorithm', 'index'}, ...]} covering alpha in [0, 1] (beta = 1 - alpha).
+	Each candidate's energy is linear in alpha, so the winners are the lower
+	envelope of those lines and the breakpoints are their crossings.
+	"""
+	groups, labels, carbon, runtime = _grouped_arrays(algorithms_metrics, group_key)
+	norm_carbon = min_max_normalize_array(carbon, axis=1)
+	norm_runtime = min_max_normalize_array(runtime, axis=1)
+	table = {}
+	for g, group in enumerate(groups):
+		valid = ~np.isnan(norm_carbon[g])
+		intercepts = norm_runtime[g, valid]
+		slopes = norm_carbon[g, valid] - norm_runtime[g, valid]
+		table[group] = _lower_envelope(intercepts, slopes, list(labels[g, valid]))
+	return table
+
+def lookup_winner(segments, alpha):
+	"""
+	Winning algorithm for alpha from one group's winner_breakpoints segments.
+	At a breakpoint both neighbours tie in exact arithmetic; the segment
+	starting there is returned, which select_best_algorithm (floating-point
+	scores) need not agree with.
+	"""
+	starts = [s['alpha_from'] for s in segments]
+	return segments[max(bisect.bisect_right(starts, alpha) - 1, 0)]['algorithm']
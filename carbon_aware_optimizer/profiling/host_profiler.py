@@ -0,0 +1,33 @@
+"""
+Host fingerprint for tagging benchmark results with the machine they ran on.
+"""
+import functools
+import hashlib
+import platform
+
+import psutil
+
+
+def cpu_model():
+    """CPU model name (from /proc/cpuinfo on Linux), or platform.processor()."""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+@functools.lru_cache(maxsize=None)
+def host_fingerprint():
+    """
+    Short stable id of the hardware and Python build, e.g. 'x86_64-8c-16g-3f2a9c1b'.
+    Hosts with the same CPU model, core count, memory and Python version share it.
+    """
+    cores = psutil.cpu_count(logical=True) or 1
+    memory_gb = round(psutil.virtual_memory().total / 1024 ** 3)
+    description = '|'.join([platform.machine(), cpu_model(), str(cores), str(memory_gb), platform.python_version()])
+    digest = hashlib.sha1(description.encode()).hexdigest()[:8]
+    return f"{platform.machine()}-{cores}c-{memory_gb}g-{digest}"
@@ -0,0 +1,30 @@
+"""
+Process I/O counter helpers built on psutil.
+"""
+import psutil
+
+
+def read_io_counters(process):
+    """Returns the process's psutil I/O counters, or None where unavailable (e.g. macOS)."""
+    try:
+        return process.io_counters()
+    except (AttributeError, NotImplementedError, psutil.Error):
+        return None
+
+
+def io_delta(before, after):
+    """
+    Bytes read/written between two read_io_counters() snapshots.
+    read_bytes/write_bytes count storage I/O; read_chars/write_chars (Linux)
+    also count page-cache hits.
+    """
+    if before is None or after is None:
+        return {}
+    delta = {
+        'io_read_bytes': after.read_bytes - before.read_bytes,
+        'io_write_bytes': after.write_bytes - before.write_bytes
+    }
+    if hasattr(after, 'read_chars'):
+        delta['io_read_chars'] = after.read_chars - before.read_chars
+        delta['io_write_chars'] = after.write_chars - before.write_chars
+    return delta
@@ -0,0 +1,147 @@
+"""
+Tests for the carbon-aware experiment scheduler on a simulated clock
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'carbon_aware_optimizer'))
+
+from carbon.intensity_store import CarbonIntensityStore
+from experiments.carbon_scheduler import CarbonAwareScheduler, make_cell, plan_schedule
+
+HOUR = 3600
+T0 = 1_700_000_000.0
+REGION = 'GB'
+# Hourly forecast: dirty for two hours, clean in hour 3, dirty again after
+HOURLY_INTENSITY = [400, 380, 100, 420, 450, 450]
+
+
+class SimulatedClock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def forecast(tmp_path):
+    path = tmp_path / 'forecast.json'
+    # Points at slot midpoints, so every slot is priced at its own hour's value
+    series = [[T0 + (h + 0.5) * HOUR, value] for h, value in enumerate(HOURLY_INTENSITY)]
+    path.write_text(json.dumps({REGION: series}))
+    return CarbonIntensityStore().load(str(path))
+
+
+def make_runner(clock, duration=600, energy_kwh=0.01):
+    ran = []
+
+    def run(cell):
+        ran.append(cell['id'])
+        clock.now += duration
+        return energy_kwh
+    run.ran = ran
+    return run
+
+
+def test_plan_picks_cleanest_slot_before_deadline(forecast):
+    cell = make_cell('sorting', {}, 1000, 600, T0 + 5 * HOUR)
+    plan = plan_schedule([cell], forecast, REGION, T0, slot_seconds=HOUR)
+    assert plan[cell['id']] == T0 + 2 * HOUR
+
+
+def test_plan_respects_deadline(forecast):
+    # The clean hour ends after this deadline, so the cheaper of the first two hours wins
+    cell = make_cell('sorting', {}, 1000, 600, T0 + 2 * HOUR)
+    plan = plan_schedule([cell], forecast, REGION, T0, slot_seconds=HOUR)
+    assert plan[cell['id']] == T0 + HOUR
+
+
+def test_plan_falls_back_to_earliest_when_deadline_unreachable(forecast):
+    # Longer than the time left before its deadline: run as early as possible
+    cell = make_cell('sorting', {}, 1000, 2 * HOUR, T0 + HOUR)
+    plan = plan_schedule([cell], forecast, REGION, T0, slot_seconds=HOUR)
+    assert plan[cell['id']] == T0
+
+
+def test_run_defers_to_clean_slot_and_saves_carbon(forecast, tmp_path):
+    clock = SimulatedClock()
+    runner = make_runner(clock)
+    cells = [make_cell('sorting', {}, size, 600, T0 + 5 * HOUR) for size in (1000, 2000)]
+    scheduler = CarbonAwareScheduler(cells, forecast, REGION, runner, checkpoint_path=str(tmp_path / 'state.json'), slot_seconds=HOUR, clock=clock, sleep=clock.sleep)
+    report = scheduler.run()
+    assert runner.ran == [c['id'] for c in cells]
+    assert all(T0 + 2 * HOUR <= c['started_at'] < T0 + 3 * HOUR for c in scheduler.state['cells'].values())
+    assert report['cells_done'] == 2
+    assert report['cells_pending'] == 0
+    assert report['deadline_misses'] == 0
+    assert report['carbon_saved_gco2'] > 0
+
+
+def test_resume_reruns_interrupted_cell_only(forecast, tmp_path):
+    checkpoint = str(tmp_path / 'state.json')
+    clock = SimulatedClock()
+    cells = [make_cell('sorting', {}, size, 600, T0 + 5 * HOUR) for size in (1000, 2000)]
+
+    ran = []
+
+    def crash_on_second(cell):
+        ran.append(cell['id'])
+        clock.now += 600
+        if len(ran) == 2:
+            raise KeyboardInterrupt
+        return 0.01
+
+    scheduler = CarbonAwareScheduler(cells, forecast, REGION, crash_on_second, checkpoint_path=checkpoint, slot_seconds=HOUR, clock=clock, sleep=clock.sleep)
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.run()
+    with open(checkpoint, 'r') as f:
+        statuses = {i: c['status'] for i, c in json.load(f)['cells'].items()}
+    assert sorted(statuses.values()) == ['done', 'running']
+
+    runner = make_runner(clock)
+    resumed = CarbonAwareScheduler(cells, forecast, REGION, runner, checkpoint_path=checkpoint, slot_seconds=HOUR, clock=clock, sleep=clock.sleep)
+    report = resumed.run()
+    assert runner.ran == [i for i, status in statuses.items() if status == 'running']
+    assert report['cells_done'] == 2
+
+
+def test_finished_batch_starts_a_new_one(forecast, tmp_path):
+    checkpoint = str(tmp_path / 'state.json')
+    clock = SimulatedClock()
+    cells = [make_cell('sorting', {}, 1000, 600, T0 + 5 * HOUR)]
+    CarbonAwareScheduler(cells, forecast, REGION, make_runner(clock), checkpoint_path=checkpoint, slot_seconds=HOUR, clock=clock, sleep=clock.sleep).run()
+
+    # A later batch with the same cells plans and runs them again
+    clock.now = T0 + 24 * HOUR
+    later = [make_cell('sorting', {}, 1000, 600, clock.now + 5 * HOUR)]
+    runner = make_runner(clock)
+    scheduler = CarbonAwareScheduler(later, forecast, REGION, runner, checkpoint_path=checkpoint, slot_seconds=HOUR, clock=clock, sleep=clock.sleep)
+    assert scheduler.state['batch'] == 2
+    assert scheduler.run()['cells_done'] == 1
+    assert runner.ran == [later[0]['id']]
+
+
+def test_unreported_energy_uses_power_model(forecast, tmp_path):
+    from carbon.energy_model import FlatPowerModel, set_power_model
+
+    clock = SimulatedClock()
+    cells = [make_cell('sorting', {}, 1000, 600, T0 + 5 * HOUR)]
+
+    def run(cell):
+        clock.now += 600
+        return None
+
+    set_power_model(FlatPowerModel(core_power_w=100.0))
+    try:
+        scheduler = CarbonAwareScheduler(cells, forecast, REGION, run, checkpoint_path=str(tmp_path / 'state.json'), slot_seconds=HOUR, clock=clock, sleep=clock.sleep)
+        scheduler.run()
+    finally:
+        set_power_model(None)
+    assert scheduler.state['cells'][cells[0]['id']]['energy_kwh'] == pytest.approx(100.0 * 600 / 3600 / 1000)
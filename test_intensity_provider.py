@@ -0,0 +1,150 @@
+"""
+Tests for the cached carbon intensity provider against a local HTTP stand-in
+"""
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'carbon_aware_optimizer'))
+
+from carbon.intensity_provider import ProviderUnavailable, http_intensity_provider
+
+
+class IntensityServer:
+    """Serves {"carbonIntensity": value}, or HTTP 500 while failing is set."""
+
+    def __init__(self, value=200.0):
+        self.value = value
+        self.failing = False
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests += 1
+                status = 500 if server.failing else 200
+                body = json.dumps({'carbonIntensity': server.value}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/intensity"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    server = IntensityServer()
+    yield server
+    server.close()
+
+
+def make_provider(server, clock, **kwargs):
+    return http_intensity_provider(server.url, clock=clock, timeout=2.0, **kwargs)
+
+
+def test_ttl_serves_cache_then_refetches(server):
+    clock = FakeClock()
+    provider = make_provider(server, clock, ttl=10, stale_ttl=0)
+    assert provider() == 200.0
+    server.value = 300.0
+    clock.now += 5
+    assert provider() == 200.0
+    assert server.requests == 1
+    clock.now += 6
+    assert provider() == 300.0
+    assert server.requests == 2
+    provider.client.close()
+
+
+def test_stale_value_served_while_refreshing(server):
+    clock = FakeClock()
+    provider = make_provider(server, clock, ttl=10, stale_ttl=100)
+    assert provider() == 200.0
+    server.value = 250.0
+    clock.now += 50
+    assert provider() == 200.0
+    provider.wait_for_refresh(timeout=5)
+    assert server.requests == 2
+    assert provider() == 250.0
+    # Past ttl + stale_ttl the refresh is synchronous
+    server.value = 275.0
+    clock.now += 200
+    assert provider() == 275.0
+    provider.client.close()
+
+
+def test_circuit_opens_and_serves_last_good_value(server):
+    clock = FakeClock()
+    provider = make_provider(server, clock, ttl=1, stale_ttl=0, failure_threshold=2, reset_timeout=30)
+    assert provider() == 200.0
+    server.failing = True
+    for _ in range(2):
+        clock.now += 2
+        assert provider() == 200.0
+    assert provider.breaker.state == 'open'
+    requests = server.requests
+    clock.now += 10
+    assert provider() == 200.0
+    assert server.requests == requests
+    provider.client.close()
+
+
+def test_half_open_trial_closes_or_reopens(server):
+    clock = FakeClock()
+    provider = make_provider(server, clock, ttl=1, stale_ttl=0, failure_threshold=1, reset_timeout=30)
+    assert provider() == 200.0
+    server.failing = True
+    clock.now += 2
+    provider()
+    assert provider.breaker.state == 'open'
+
+    # A failed trial reopens the circuit
+    clock.now += 30
+    assert provider.breaker.state == 'half_open'
+    requests = server.requests
+    assert provider() == 200.0
+    assert server.requests == requests + 1
+    assert provider.breaker.state == 'open'
+
+    # A successful trial closes it
+    server.failing = False
+    server.value = 180.0
+    clock.now += 30
+    assert provider() == 180.0
+    assert provider.breaker.state == 'closed'
+    provider.client.close()
+
+
+def test_unavailable_without_any_value(server):
+    server.failing = True
+    provider = make_provider(server, FakeClock(), failure_threshold=1)
+    with pytest.raises(ProviderUnavailable):
+        provider()
+    assert provider.breaker.state == 'open'
+    provider.client.close()